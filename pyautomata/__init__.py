@@ -1,3 +1,23 @@
-from pyautomata.classes import Canvas, Pattern, Recognizer
+from pyautomata.classes import (
+    Canvas, Engine, LightConeCanvas, MultiRecognizer, PackedCanvas, Pattern, Recognizer,
+    StreamingRecognizer,
+)
 from pyautomata.stats import StatsContainer, calculate_stats
-from pyautomata.render import draw_plot, draw_standard_deviation
\ No newline at end of file
+from pyautomata.render import draw_plot, draw_standard_deviation
+from pyautomata.sweep import SweepResult, sweep
+from pyautomata.handlers.cycles import Cycle
+from pyautomata.cache import CacheInfo, CanvasCache
+from pyautomata.ensemble import EnsembleResult, ensemble
+from pyautomata.instrument import Instrumentation, PhaseRecord, PhaseSummary
+from pyautomata.hashlife import HashLife
+from pyautomata.column import center_column
+from pyautomata.randomness import RandomnessResult, RandomnessTests, calculate_randomness
+
+# The batch runner pulls in its command line, which library users do not need
+BATCH_EXPORTS = ('BatchSpec', 'BatchStore', 'Job', 'run_batch')
+
+def __getattr__(name: str):
+    if name in BATCH_EXPORTS:
+        from pyautomata import batch
+        return getattr(batch, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,9 @@
+# Project PyAutomata Command Line Module
+
+# Python Modules
+import sys
+
+# Local Modules
+from pyautomata.batch import main
+
+sys.exit(main())
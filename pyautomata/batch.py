@@ -0,0 +1,478 @@
+# Project PyAutomata Batch Module
+
+# Python Modules
+from argparse import ArgumentParser
+from collections import deque
+from dataclasses import dataclass, field
+import json
+import os
+import re
+import sys
+from tempfile import mkstemp
+from time import perf_counter
+from typing import Callable
+
+# Third-Party Modules
+from numpy import (
+    array, concatenate, cumsum, full, load, nan, ndarray, savez, zeros, int32, int64, uint32, uint64,
+)
+
+# Local Modules
+from pyautomata.classes.canvas import Canvas
+from pyautomata.classes.general import Engine, Pattern, validate_rule
+from pyautomata.sweep import NONZERO_RULES
+from pyautomata.version import VERSION
+
+# Analyses a job can run on its canvas
+ANALYSES = ('stats', 'recognition', 'render')
+
+# Finished jobs buffered before their results are written out as a shard
+DEFAULT_SHARD_JOBS = 64
+
+# Columns of a shard holding one value per job, and the fill of jobs without them
+SCALAR_COLUMNS = {'mean_increase': nan, 'standard_deviation': nan, 'segment_count': -1}
+
+# Columns of a shard holding an array per job, concatenated and sliced by `<name>_offsets`
+ARRAY_COLUMNS = {'sums': uint32, 'segment_counts': uint64, 'parent_segments': int32}
+
+SIZE_SUFFIXES = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+@dataclass(frozen=True)
+class Job:
+    rule: int
+    rows: int
+    pattern: Pattern
+    analyses: tuple[str, ...]
+    pattern_length: int = 5
+
+    @property
+    def key(self) -> str:
+        """
+        Identity of the job in the index, covering everything its results depend on
+        """
+        analyses = '+'.join(f'recognition-{self.pattern_length}' if analysis == 'recognition'
+                            else analysis for analysis in self.analyses)
+        return f'{self.rule}/{self.rows}/{self.pattern.name.lower()}/{analyses}'
+
+    @property
+    def cells(self) -> int:
+        columns = self.rows if self.pattern in [Pattern.RIGHT, Pattern.LEFT] else self.rows * 2
+        return self.rows * columns
+
+
+@dataclass
+class BatchSpec:
+    """
+    Jobs of a batch: every rule at every size and pattern, each running the
+    selected analyses on a single canvas
+    """
+    rules: list[int] = field(default_factory=lambda: list(NONZERO_RULES))
+    sizes: list[int] = field(default_factory=lambda: [100])
+    patterns: list[Pattern] = field(default_factory=lambda: [Pattern.STANDARD])
+    analyses: tuple[str, ...] = ('stats',)
+    pattern_length: int = 5
+    engine: Engine | None = None
+    seed: int = None
+
+    def __post_init__(self):
+        for rule in self.rules:
+            validate_rule(rule)
+        if any(size < 1 for size in self.sizes):
+            raise ValueError('Sizes must be positive')
+        unknown = set(self.analyses) - set(ANALYSES)
+        if unknown or not self.analyses:
+            raise ValueError(f'Analyses must be chosen from {", ".join(ANALYSES)}, got {", ".join(sorted(unknown))}')
+        if self.pattern_length < 1:
+            raise ValueError('Pattern length must be positive')
+
+        # Held in a fixed order so that the job keys do not depend on the spec
+        self.analyses = tuple(analysis for analysis in ANALYSES if analysis in self.analyses)
+
+    def jobs(self) -> list[Job]:
+        return [Job(rule, rows, pattern, self.analyses, self.pattern_length)
+                for rule in self.rules for rows in self.sizes for pattern in self.patterns]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BatchSpec':
+        """
+        Spec from its JSON form, such as
+        `{"rules": [30, 90], "sizes": [1000], "analyses": ["stats", "render"]}`.
+        `rules` may be `"all"`.
+        """
+        unknown = set(data) - {'rules', 'sizes', 'patterns', 'analyses', 'pattern_length', 'engine', 'seed'}
+        if unknown:
+            raise ValueError(f'Unknown job spec fields: {", ".join(sorted(unknown))}')
+
+        kwargs = dict(data)
+        if 'rules' in data:
+            kwargs['rules'] = list(NONZERO_RULES) if data['rules'] == 'all' else list(data['rules'])
+        if 'sizes' in data:
+            kwargs['sizes'] = list(data['sizes'])
+        if 'patterns' in data:
+            kwargs['patterns'] = [Pattern.from_string(pattern.lower()) for pattern in data['patterns']]
+        if 'analyses' in data:
+            kwargs['analyses'] = tuple(data['analyses'])
+        if data.get('engine') is not None:
+            kwargs['engine'] = Engine.from_string(data['engine'])
+        return cls(**kwargs)
+
+    @classmethod
+    def load(cls, filename: str) -> 'BatchSpec':
+        with open(filename) as file:
+            return cls.from_dict(json.load(file))
+
+
+def recognition_tables(recognizer) -> tuple[ndarray, ndarray]:
+    """
+    Dense segment histogram and parent table of a recognizer, packed from the
+    dictionaries of the Python engine when it has no tables
+    """
+    if recognizer.segment_counts is not None:
+        return recognizer.segment_counts, recognizer.parent_segments
+
+    def code(window: tuple[int]) -> int:
+        return int(''.join(map(str, window)), 2)
+
+    length = recognizer.pattern_length
+    segment_counts = zeros((1 << length,), uint64)
+    parent_segments = full((1 << (length + 2),), -1, int32)
+    for segment, count in recognizer.pattern_segments.items():
+        segment_counts[code(segment)] = count
+    for parent, segment in recognizer.pattern_rules.items():
+        parent_segments[code(parent)] = code(segment)
+    return segment_counts, parent_segments
+
+def run_job(job: Job, engine: Engine = None, seed: int = None, directory: str = None,
+            memory_budget: int = None) -> dict:
+    """
+    Worker procedure generating the canvas of a job and running its analyses.
+    Only the canvases that are rendered keep their rows, spilling to
+    `directory` past `memory_budget`, and recognition runs while the rows
+    are generated.  Renders are written to `directory` and only the arrays
+    and scalars of the results travel back.
+    """
+    start = perf_counter()
+    recognize = job.pattern_length if 'recognition' in job.analyses else None
+    render = 'render' in job.analyses
+
+    spill_directory = None if directory is None else os.path.join(directory, 'spill')
+    canvas = Canvas(job.rule, job.rows, job.pattern, engine=engine, sums_only=not render,
+                    memory_budget=memory_budget, spill_directory=spill_directory, seed=seed,
+                    recognize=recognize)
+
+    result = {}
+    if 'stats' in job.analyses:
+        result['sums'] = canvas.sums
+        result['mean_increase'] = float(canvas.stats.mean_increase)
+        result['standard_deviation'] = float(canvas.stats.standard_deviation)
+    if recognize is not None:
+        result['segment_counts'], result['parent_segments'] = recognition_tables(canvas.recognizer)
+        result['segment_count'] = int(canvas.recognizer.segment_count)
+    if render:
+        name = job.key.replace('/', '_') + '.png'
+        canvas.save_png(os.path.join(directory, 'renders', name))
+        result['render'] = os.path.join('renders', name)
+
+    result['seconds'] = perf_counter() - start
+    return result
+
+def limit_memory(memory_limit: int) -> None:
+    """
+    Pool initializer capping the heap of a worker, so that a job outgrowing
+    it fails with MemoryError instead of exhausting the machine.  The data
+    limit leaves out the file mappings canvases spill to.  Platforms without
+    `resource` run unbounded.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_DATA)
+    if hard != resource.RLIM_INFINITY:
+        memory_limit = min(memory_limit, hard)
+    resource.setrlimit(resource.RLIMIT_DATA, (memory_limit, hard))
+
+def parse_size(value: str) -> int:
+    """
+    Bytes of a size such as `512M` or `2G`
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*', str(value).upper())
+    if match is None:
+        raise ValueError(f'Size must be a number of bytes with an optional K, M, G or T suffix, got {value}')
+    return int(float(match[1]) * SIZE_SUFFIXES[match[2]])
+
+
+class BatchStore:
+    """
+    Results of a batch in `directory`, written incrementally as columnar
+    shards.  Each shard is an npz of the finished jobs, with a column per
+    scalar and the arrays of every job concatenated with their offsets.
+
+    `index.jsonl` holds a line per finished job, its shard and position and
+    its scalars, appended once its shard is safely written, so a batch
+    interrupted at any point resumes from the jobs in the index.  Failed
+    jobs are indexed with their error.
+    """
+    def __init__(self, directory: str, shard_jobs: int = DEFAULT_SHARD_JOBS) -> None:
+        self.directory = directory
+        self.shard_jobs = shard_jobs
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        for subdirectory in ['shards', 'renders', 'spill']:
+            os.makedirs(os.path.join(directory, subdirectory), exist_ok=True)
+
+        self.records: dict[str, dict] = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'rb+') as file:
+                complete = 0
+                for line in file:
+                    if not line.endswith(b'\n'):
+                        # A line cut short by a crash, dropped so that its job is run again
+                        file.truncate(complete)
+                        break
+                    complete += len(line)
+                    record = json.loads(line)
+                    self.records[record['key']] = record
+
+        self.pending: list[tuple[Job, dict]] = []
+        shards = [int(name[6:-4]) for name in os.listdir(os.path.join(directory, 'shards'))
+                  if re.fullmatch(r'shard-\d+\.npz', name)]
+        self.next_shard = max(shards, default=-1) + 1
+
+    def __repr__(self) -> str:
+        return f'Batch Store: {len(self.records)} jobs in {self.directory}'
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def finished(self, include_failed: bool = True) -> set[str]:
+        """
+        Keys of the indexed jobs, leaving out the failed ones unless included
+        """
+        return {key for key, record in self.records.items()
+                if include_failed or record['status'] == 'done'}
+
+    def add(self, job: Job, result: dict) -> None:
+        """
+        Buffer the results of a job, writing a shard once enough are held
+        """
+        self.pending.append((job, result))
+        if len(self.pending) >= self.shard_jobs:
+            self.flush()
+
+    def fail(self, job: Job, error: BaseException) -> None:
+        self.append_records([{**self.job_record(job), 'status': 'failed',
+                              'error': f'{type(error).__name__}: {error}'}])
+
+    def flush(self) -> None:
+        """
+        Write the buffered results as the next shard, then index them
+        """
+        if not self.pending:
+            return
+
+        name = f'shard-{self.next_shard:06d}.npz'
+        columns = {
+            'rule': array([job.rule for job, _ in self.pending], int32),
+            'rows': array([job.rows for job, _ in self.pending], int64),
+            'pattern': array([job.pattern.name.lower() for job, _ in self.pending]),
+        }
+        for column, fill in SCALAR_COLUMNS.items():
+            columns[column] = array([result.get(column, fill) for _, result in self.pending])
+        for column, dtype in ARRAY_COLUMNS.items():
+            arrays = [result.get(column, zeros((0,), dtype)) for _, result in self.pending]
+            columns[column] = concatenate(arrays).astype(dtype, copy=False)
+            columns[f'{column}_offsets'] = concatenate([[0], cumsum([len(values) for values in arrays])]).astype(int64)
+
+        descriptor, temporary_path = mkstemp(suffix='.tmp', dir=os.path.join(self.directory, 'shards'))
+        with os.fdopen(descriptor, 'wb') as file:
+            savez(file, **columns)
+        os.replace(temporary_path, os.path.join(self.directory, 'shards', name))
+
+        records = []
+        for position, (job, result) in enumerate(self.pending):
+            record = {**self.job_record(job), 'status': 'done', 'shard': name, 'position': position,
+                      'columns': [column for column in [*SCALAR_COLUMNS, *ARRAY_COLUMNS] if column in result]}
+            record.update({key: result[key] for key in ['render', 'seconds', *SCALAR_COLUMNS] if key in result})
+            records.append(record)
+
+        self.append_records(records)
+        self.pending = []
+        self.next_shard += 1
+
+    def job_record(self, job: Job) -> dict:
+        return {'key': job.key, 'rule': job.rule, 'rows': job.rows,
+                'pattern': job.pattern.name.lower(), 'analyses': list(job.analyses),
+                'pattern_length': job.pattern_length, 'version': VERSION}
+
+    def append_records(self, records: list[dict]) -> None:
+        with open(self.index_path, 'a') as file:
+            for record in records:
+                file.write(json.dumps(record) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        self.records.update((record['key'], record) for record in records)
+
+    def load(self, key: str | Job) -> dict:
+        """
+        Results of a finished job, its arrays sliced out of its shard
+        """
+        key = key.key if isinstance(key, Job) else key
+        record = self.records.get(key)
+        if record is None or record['status'] != 'done':
+            raise KeyError(f'No results stored for job {key}')
+
+        result = {'render': record['render']} if 'render' in record else {}
+        position = record['position']
+        with load(os.path.join(self.directory, 'shards', record['shard'])) as shard:
+            for column in record['columns']:
+                if column in ARRAY_COLUMNS:
+                    start, stop = shard[f'{column}_offsets'][position:position+2]
+                    result[column] = shard[column][start:stop]
+                else:
+                    result[column] = shard[column][position].item()
+        return result
+
+
+def run_batch(spec: BatchSpec, directory: str, workers: int = None, memory_limit: int = None,
+              shard_jobs: int = DEFAULT_SHARD_JOBS, retry_failed: bool = False,
+              progress: Callable[[Job, dict | BaseException], None] = None) -> BatchStore:
+    """
+    Run the jobs of a spec across a process pool, skipping those already
+    in the store in `directory`, and return the store.
+
+    Jobs are submitted largest first, at most two per worker at a time, so
+    the results held in flight stay bounded.  With `memory_limit` bytes each
+    worker is capped at that heap and spills stored canvases past half of it.
+    A job that raises is indexed as failed and skipped on later runs unless
+    `retry_failed`, as is a job whose worker dies.  `progress` is called
+    with every job and its results or error.
+    """
+    store = BatchStore(directory, shard_jobs)
+    finished = store.finished(include_failed=not retry_failed)
+    jobs = sorted((job for job in spec.jobs() if job.key not in finished), key=lambda job: -job.cells)
+
+    workers = os.cpu_count() if workers is None else workers
+    memory_budget = None if memory_limit is None else memory_limit // 2
+    arguments = (spec.engine, spec.seed, directory, memory_budget)
+
+    def finish(job: Job, outcome: dict | BaseException) -> None:
+        if isinstance(outcome, BaseException):
+            store.fail(job, outcome)
+        else:
+            store.add(job, outcome)
+        if progress is not None:
+            progress(job, outcome)
+
+    try:
+        if workers <= 1:
+            for job in jobs:
+                try:
+                    outcome = run_job(job, *arguments)
+                except Exception as error:
+                    outcome = error
+                finish(job, outcome)
+        else:
+            run_pool(jobs, workers, memory_limit, arguments, finish)
+    finally:
+        store.flush()
+
+    return store
+
+def run_pool(jobs: list[Job], workers: int, memory_limit: int | None, arguments: tuple,
+             finish: Callable[[Job, dict | BaseException], None]) -> None:
+    """
+    Run the jobs across a process pool.  A worker dying takes the pool down
+    with every job in flight, so those jobs are run again one at a time in a
+    fresh pool, failing only the job that takes its worker down alone.
+    """
+    # Imported here as it pulls in multiprocessing, which plain imports do not need
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from concurrent.futures.process import BrokenProcessPool
+
+    queue, suspects = deque(jobs), deque()
+    initializer, initargs = (None, ()) if memory_limit is None else (limit_memory, (memory_limit,))
+
+    while queue or suspects:
+        isolated = bool(suspects)
+        source, in_flight = (suspects, 1) if isolated else (queue, workers * 2)
+
+        with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as executor:
+            running = {}
+            broken = False
+            while (source or running) and not broken:
+                while source and len(running) < in_flight:
+                    job = source.popleft()
+                    running[executor.submit(run_job, job, *arguments)] = job
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        outcome = future.result()
+                    except BrokenProcessPool as error:
+                        broken = True
+                        if not isolated:
+                            suspects.append(job)
+                            continue
+                        outcome = error
+                    except Exception as error:
+                        outcome = error
+                    finish(job, outcome)
+
+            # Jobs still running on a broken pool are lost with it
+            suspects.extend(running.values())
+
+
+def format_outcome(job: Job, outcome: dict | BaseException) -> str:
+    if isinstance(outcome, BaseException):
+        return f'{job.key:<48} FAILED {type(outcome).__name__}: {outcome}'
+    return f'{job.key:<48} {outcome["seconds"]:>10.3f} s'
+
+def main(arguments: list[str] = None) -> int:
+    """
+    Command line entry point, returning 1 when a job failed
+    """
+    parser = ArgumentParser(prog='python -m pyautomata',
+                            description='Run a batch of rules x sizes x patterns x analyses into a '
+                                        'resumable result store')
+    parser.add_argument('spec', nargs='?', help='JSON job spec, overridden by the options below')
+    parser.add_argument('--output', required=True, help='directory of the result store')
+    parser.add_argument('--rules', nargs='+', type=int)
+    parser.add_argument('--sizes', nargs='+', type=int)
+    parser.add_argument('--patterns', nargs='+', metavar='PATTERN')
+    parser.add_argument('--analyses', nargs='+', choices=ANALYSES)
+    parser.add_argument('--pattern-length', type=int)
+    parser.add_argument('--engine', choices=[engine.name.lower() for engine in Engine])
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--workers', type=int, help='processes in the pool, every CPU by default')
+    parser.add_argument('--memory-limit', type=parse_size,
+                        help='heap of each worker, such as 2G, with larger canvases spilled to disk')
+    parser.add_argument('--shard-jobs', type=int, default=DEFAULT_SHARD_JOBS,
+                        help='finished jobs written per shard')
+    parser.add_argument('--retry-failed', action='store_true')
+    parser.add_argument('--quiet', action='store_true')
+    options = parser.parse_args(arguments)
+
+    data = {}
+    if options.spec:
+        with open(options.spec) as file:
+            data = json.load(file)
+    for name in ['rules', 'sizes', 'patterns', 'analyses', 'pattern_length', 'engine', 'seed']:
+        if getattr(options, name) is not None:
+            data[name] = getattr(options, name)
+    spec = BatchSpec.from_dict(data)
+
+    failures = []
+    def progress(job: Job, outcome: dict | BaseException) -> None:
+        if isinstance(outcome, BaseException):
+            failures.append(job)
+        if not options.quiet:
+            print(format_outcome(job, outcome), flush=True)
+
+    run_batch(spec, options.output, options.workers, options.memory_limit, options.shard_jobs,
+              options.retry_failed, progress)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
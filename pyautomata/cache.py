@@ -0,0 +1,249 @@
+# Project PyAutomata Cache Module
+
+# Python Modules
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+import os
+from tempfile import mkstemp
+from typing import TYPE_CHECKING
+
+# Third-Party Modules
+from numpy import ascontiguousarray, load, ndarray, savez
+
+# Local Modules
+from pyautomata.classes.general import Pattern, CENTRAL_LINE_MAP
+from pyautomata.version import VERSION
+if TYPE_CHECKING:
+    from pyautomata.classes.canvas import Canvas
+
+# Default bytes of canvases held in memory
+DEFAULT_MEMORY_BUDGET = 256 * 1024**2
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+    entries: int
+    memory_bytes: int
+    disk_bytes: int
+
+
+class CanvasCache:
+    """
+    Cache of generated canvases keyed by rule, pattern, initial row and
+    `VERSION`, with an in-memory LRU bounded by `memory_budget` bytes and an
+    optional on-disk tier in `directory` bounded by `disk_budget` bytes.
+
+    Canvases of the single cell patterns are the top-left corner of any larger
+    canvas of the same rule, so they are keyed without their rows and a
+    request for fewer rows is sliced out of the largest canvas cached.
+    Served arrays are read-only views shared with the cache.
+    """
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, directory: str = None,
+                 disk_budget: int = None) -> None:
+        self.memory_budget = memory_budget
+        self.directory = directory
+        self.disk_budget = disk_budget
+
+        self.entries: OrderedDict[tuple, tuple[ndarray, ndarray]] = OrderedDict()
+        self.memory_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f'Canvas Cache: {len(self.entries)} entries, {self.memory_bytes} bytes'
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def info(self) -> CacheInfo:
+        """
+        Counters and sizes of the cache for tuning the budgets
+        """
+        return CacheInfo(self.hits, self.misses, self.disk_hits, self.evictions,
+                         len(self.entries), self.memory_bytes, self.disk_bytes())
+
+    def key(self, rule: int, rows: int, pattern: Pattern, initial_row: ndarray) -> tuple:
+        """
+        Cache key of a canvas.  Single cell patterns are keyed without their
+        rows and initial row, which only differ in width between sizes.
+        """
+        if pattern in CENTRAL_LINE_MAP:
+            return VERSION, rule, pattern.name, None, None
+        digest = blake2b(ascontiguousarray(initial_row).tobytes(), digest_size=16).hexdigest()
+        return VERSION, rule, pattern.name, rows, digest
+
+    def fetch(self, rule: int, rows: int, pattern: Pattern,
+              initial_row: ndarray) -> tuple[ndarray, ndarray] | None:
+        """
+        Return the cached `(result, sums)` of a canvas, sliced to `rows` rows,
+        or None when neither tier can serve it
+        """
+        key = self.key(rule, rows, pattern, initial_row)
+
+        entry = self.entries.get(key)
+        if entry is not None and len(entry[1]) >= rows:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return slice_canvas(*entry, rows, pattern)
+
+        entry = self.read_disk(key)
+        if entry is not None and len(entry[1]) >= rows:
+            self.hits += 1
+            self.disk_hits += 1
+            self.remember(key, *entry)
+            return slice_canvas(*entry, rows, pattern)
+
+        self.misses += 1
+        return None
+
+    def store(self, rule: int, pattern: Pattern, initial_row: ndarray, result: ndarray,
+              sums: ndarray) -> None:
+        """
+        Add a generated canvas to both tiers unless a canvas at least as large
+        is already cached under its key
+        """
+        key = self.key(rule, len(sums), pattern, initial_row)
+
+        entry = self.entries.get(key)
+        if entry is not None and len(entry[1]) >= len(sums):
+            return
+
+        self.remember(key, result, sums)
+        self.write_disk(key, result, sums)
+
+    def remember(self, key: tuple, result: ndarray, sums: ndarray) -> None:
+        """
+        Insert into the in-memory LRU, evicting the least recently used
+        canvases beyond the memory budget
+        """
+        size = result.nbytes + sums.nbytes
+        if key in self.entries:
+            old_result, old_sums = self.entries.pop(key)
+            self.memory_bytes -= old_result.nbytes + old_sums.nbytes
+
+        if size > self.memory_budget:
+            return
+
+        self.entries[key] = (result, sums)
+        self.memory_bytes += size
+
+        while self.memory_bytes > self.memory_budget:
+            _, (old_result, old_sums) = self.entries.popitem(last=False)
+            self.memory_bytes -= old_result.nbytes + old_sums.nbytes
+            self.evictions += 1
+
+    def disk_path(self, key: tuple) -> str:
+        """
+        File of the on-disk tier holding the canvas of a key
+        """
+        name = blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f'{name}.npz')
+
+    def disk_files(self) -> list[str]:
+        """
+        Paths of the canvases in the on-disk tier
+        """
+        if self.directory is None:
+            return []
+        return [entry.path for entry in os.scandir(self.directory) if entry.name.endswith('.npz')]
+
+    def disk_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in self.disk_files())
+
+    def read_disk(self, key: tuple) -> tuple[ndarray, ndarray] | None:
+        """
+        Load a canvas from the on-disk tier, marking it as recently used
+        """
+        if self.directory is None:
+            return None
+
+        path = self.disk_path(key)
+        try:
+            with load(path) as stored:
+                result, sums = stored['result'], stored['sums']
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            return None
+
+        return result, sums
+
+    def write_disk(self, key: tuple, result: ndarray, sums: ndarray) -> None:
+        """
+        Save a canvas to the on-disk tier, then evict the least recently used
+        files beyond the disk budget
+        """
+        if self.directory is None:
+            return
+
+        descriptor, temporary_path = mkstemp(suffix='.tmp', dir=self.directory)
+        with os.fdopen(descriptor, 'wb') as file:
+            savez(file, result=result, sums=sums)
+        os.replace(temporary_path, self.disk_path(key))
+
+        if self.disk_budget is None:
+            return
+
+        files = sorted(self.disk_files(), key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in files)
+        for path in files:
+            if total <= self.disk_budget:
+                break
+            total -= os.path.getsize(path)
+            os.remove(path)
+            self.evictions += 1
+
+    def canvas(self, rule: int, rows: int = 100, pattern: Pattern = Pattern.STANDARD,
+               **kwargs) -> 'Canvas':
+        """
+        Build a canvas through the cache
+        """
+        from pyautomata.classes.canvas import Canvas
+        return Canvas(rule, rows, pattern, cache=self, **kwargs)
+
+    def clear(self) -> None:
+        """
+        Empty both tiers and reset the counters
+        """
+        self.entries.clear()
+        self.memory_bytes = 0
+        for path in self.disk_files():
+            os.remove(path)
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+
+def slice_canvas(result: ndarray, sums: ndarray, rows: int,
+                 pattern: Pattern) -> tuple[ndarray, ndarray]:
+    """
+    Read-only views of the first `rows` rows of a cached canvas, cropped to
+    the columns a canvas of that size has around its starting cell.  The sums
+    of cropped rows are recounted, as the wider canvas can have live cells
+    outside the crop.
+    """
+    cached_rows = len(sums)
+
+    if pattern is Pattern.STANDARD:
+        columns = slice(cached_rows - rows, cached_rows + rows)
+    elif pattern is Pattern.RIGHT:
+        columns = slice(cached_rows - rows, cached_rows)
+    elif pattern is Pattern.LEFT:
+        columns = slice(0, rows)
+    else:
+        columns = slice(None)
+
+    result, sums = result[:rows, columns], sums[:rows]
+    if rows < cached_rows and columns != slice(None):
+        sums = result.sum(axis=1, dtype=sums.dtype)
+    result.flags.writeable = False
+    sums.flags.writeable = False
+
+    return result, sums
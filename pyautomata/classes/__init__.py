@@ -1,3 +1,5 @@
 from pyautomata.classes.canvas import Canvas
-from pyautomata.classes.general import Pattern
-from pyautomata.classes.recognizer import Recognizer
\ No newline at end of file
+from pyautomata.classes.general import Engine, Pattern
+from pyautomata.classes.lightconecanvas import LightConeCanvas
+from pyautomata.classes.packedcanvas import PackedCanvas
+from pyautomata.classes.recognizer import MultiRecognizer, Recognizer, StreamingRecognizer
\ No newline at end of file
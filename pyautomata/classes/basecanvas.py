@@ -1,33 +1,54 @@
 # PyAutomata Base Canvas
 
 # Python Modules
-from random import randint
+from functools import cache
+import os
+from tempfile import mkstemp
+from typing import Iterator, TYPE_CHECKING
+from weakref import finalize
 
 # Third-Party Modules
 from numpy import (
-    arange, array, ascontiguousarray, 
-    insert as np_insert, binary_repr,
-    zeros, uint8, ndarray,
+    array, ascontiguousarray, asarray, binary_repr,
+    concatenate, memmap, stack, zeros, uint8, uint32, ndarray,
 )
+from numpy.random import default_rng
 
 # Local Modules
-from pyautomata.classes.general import Pattern, CENTRAL_LINE_MAP
-from pyautomata.handlers.rust import generate_canvas, RUST_AVAILABLE
+from pyautomata.classes.general import Engine, Pattern, CENTRAL_LINE_MAP, resolve_engine, validate_rule
+from pyautomata.classes.recognizer import StreamingRecognizer
+from pyautomata.handlers.rust import generate_canvas
+from pyautomata.handlers import vectorized
+from pyautomata.handlers.cycles import Cycle, CycleDetector, fill_rows, fill_sums, first_full_row, shift_rows
+from pyautomata.instrument import PhaseRecord, phase
+from pyautomata.stats import RunningStats
 from pyautomata.version import VERSION
+if TYPE_CHECKING:
+    from pyautomata.cache import CanvasCache
+
+# Rows generated per engine call when streaming, bounding memory to O(columns)
+STREAM_CHUNK_ROWS = 256
+
+# Rows of the first engine call when detecting cycles, doubling per call up to the limit
+CYCLE_CHUNK_ROWS = 64
+CYCLE_CHUNK_LIMIT = 4096
 
 class BaseCanvas:
     """
     Canvas base class containing fundamental attributes
     """
     def __init__(self, rule: int, rows: int = 100, pattern: Pattern = Pattern.STANDARD,
-                 force_python: bool = False, generate: bool = True) -> None:
-        init_except_message = 'Rule must be an integer between 1 and 256'
-        if type(rule) != int:
-            raise ValueError(init_except_message)
-        if not 1 <= rule <= 256:
-            raise ValueError(init_except_message)
+                 force_python: bool = False, generate: bool = True,
+                 engine: Engine | str = None, sums_only: bool = False,
+                 memory_budget: int = None, buffer: ndarray = None,
+                 spill_directory: str = None, threads: int = None,
+                 cache: 'CanvasCache' = None, seed: int = None,
+                 detect_cycles: bool = False, recognize: int = None) -> None:
+        validate_rule(rule)
         
         pattern = pattern if isinstance(pattern, Pattern) else Pattern.from_string(pattern)
+        if recognize is not None and detect_cycles:
+            raise ValueError('Recognition needs every row generated and cannot detect cycles')
         
         self.rows = rows
         self.columns = self.rows if pattern in [Pattern.RIGHT, Pattern.LEFT] else (self.rows*2)
@@ -38,21 +59,39 @@ class BaseCanvas:
         self.version = VERSION
         self.pattern = pattern
 
+        self.engine = resolve_engine(engine, force_python)
+        self.sums_only = sums_only
+        self.threads = 1 if threads is None else threads
+
+        # Storage of the canvas: RAM, a caller-supplied buffer or a spill file
+        self.memory_budget = memory_budget
+        self.buffer = buffer
+        self.spill_directory = spill_directory
+        self.spill_path: str = None
+        self.cache = cache
+        self.seed = seed
+
         self.sums = None
         self.result = None
+        # Final rows kept in `sums_only` mode so that the canvas can be extended
+        self.last_rows: ndarray = None
 
-        # Generate the rule set that dictates generation behavior
-        flat_rule_set = []
-        output_rule_set = [int(x) for x in binary_repr(rule, width=8)]
+        # Welford accumulator of the marginal increases, filled during generation
+        self.running_stats: RunningStats = None
 
-        for i in range(8):
-            input_rule_set = tuple([int(x) for x in binary_repr(7-i, 3)])
-            rule_set[input_rule_set] = output_rule_set[i]
-            flat_rule_set.extend([input_rule_set, output_rule_set[i]])
+        # Phases recorded while `Instrumentation` is entered
+        self.timings: list[PhaseRecord] = []
 
-        self.rule = rule
-        self.rule_set = {}
-        self.flat_rule_set = array(flat_rule_set, uint8)
+        # Cycle the generated rows settle into, when detected
+        self.detect_cycles = detect_cycles
+        self.cycle: Cycle = None
+
+        # Pattern length recognized as the rows are generated, and its recognizer
+        self.recognize = recognize
+        self.recognizer: StreamingRecognizer = None
+
+        # The rule set that dictates generation behavior
+        self.rule_set, self.rule_table, self.flat_rule_set = build_rule_set(rule)
 
         if generate:
             self.generate(pattern, force_python)
@@ -60,47 +99,492 @@ class BaseCanvas:
     def __repr__(self) -> str:
         return f'Canvas: Rule {self.rule} - {self.description}'
     
+    def initial_row(self, pattern: Pattern = Pattern.STANDARD) -> tuple[ndarray, int]:
+        """
+        Build the first row of the canvas for the supplied pattern and its sum.
+        RANDOM rows are drawn in one call, repeatably when `seed` is set.
+        """
+        first_row = zeros((self.columns,), uint8)
+
+        # Pattern logic
+        if pattern in CENTRAL_LINE_MAP:
+            first_row[CENTRAL_LINE_MAP[pattern](self.columns)] = 1
+        elif pattern is Pattern.ALTERNATING:
+            first_row[1::2] = 1
+        elif pattern is Pattern.RANDOM:
+            first_row = random_rows(1, self.columns, self.seed)[0]
+
+        return first_row, int(first_row.sum())
+
+    def boost_parameters(self, pattern: Pattern = Pattern.STANDARD) -> tuple[bool, int]:
+        """
+        Light cone masking parameters for patterns that start from a single cell
+        """
+        boost = True if pattern in CENTRAL_LINE_MAP else False
+        central_line = 0 if not boost else CENTRAL_LINE_MAP[pattern](self.columns)
+        return boost, central_line
+
     def generate(self, pattern: Pattern = Pattern.STANDARD,
-                 force_python: bool = False):
+                 force_python: bool = False, engine: Engine | str = None):
         """
         Procedure to generate the canvas based on the supplied pattern.
         `force_python` will bypass the Rust API and use Python native logic.
+        `engine` selects between the Python, NumPy and Rust engines and defaults
+        to the one chosen at construction.  In `sums_only` mode the rows are
+        streamed and only the sums are kept.  Canvases are served from and
+        added to `cache` when one is supplied.  The engines accumulate the
+        running stats as the rows are generated.  With `detect_cycles` the
+        rows are hashed as they are generated and, once they enter a cycle,
+        the remaining rows and sums are filled by repetition.  With
+        `recognize` each chunk of rows is recognized as it is generated, so
+        `sums_only` canvases are recognized without ever being stored.
         """
-        canvas = zeros([self.rows, self.columns], uint8)
-        ascontiguousarray(canvas)
+        if engine is None and not force_python:
+            engine = self.engine
+        else:
+            engine = resolve_engine(engine, force_python)
+        self.cycle = None
 
-        pattern_iteration_map = {
-            Pattern.RANDOM: lambda _: randint(0, 1),
-            Pattern.ALTERNATING: lambda i: 0 if i % 2 == 0 else 1,
-        }
+        with phase('canvas.initial_row', self):
+            first_row, first_sum = self.initial_row(pattern)
 
-        row_sum = 0
+        recognizer = None
+        if self.recognize is not None:
+            recognizer = StreamingRecognizer(self.rule, pattern, self.recognize, engine=engine)
+            recognizer.timings = self.timings
+        self.recognizer = recognizer
 
-        # Pattern logic
-        if pattern in CENTRAL_LINE_MAP:
-            canvas[0, CENTRAL_LINE_MAP[pattern](self.columns)] = 1
-            row_sum = 1
+        if self.cache is not None:
+            with phase('canvas.cache_fetch', self):
+                cached = self.cache.fetch(self.rule, self.rows, pattern, first_row)
+            if cached is not None:
+                self.running_stats = None
+                result, self.sums = cached
+                # Kept so that a streamed canvas served from the cache can be extended
+                self.last_rows = array(result[-2:]) if self.sums_only else None
+                if recognizer is not None:
+                    recognizer.update(result)
+                if self.sums_only:
+                    result = None
+                elif self.buffer is not None:
+                    result = self.allocate_canvas()
+                    result[...] = cached[0]
+                self.result = result
+                return
 
-        if pattern in pattern_iteration_map:
-            func = pattern_iteration_map[pattern]
-            for i, _ in enumerate(canvas[0]):
-                value = func(i)
-                canvas[0][i] = value
-                row_sum += value
+        self.running_stats = RunningStats()
+        self.running_stats.update(0, first_sum)
 
-        self.sums = [row_sum]
+        if self.sums_only:
+            with phase('canvas.stream_sums', self):
+                self.sums, self.last_rows = self.stream_sums(STREAM_CHUNK_ROWS, pattern, engine,
+                                                             first_row, stats=self.running_stats,
+                                                             detect_cycles=self.detect_cycles,
+                                                             recognizer=recognizer)
+            self.result = None
+            return
 
-        boost = True if pattern in CENTRAL_LINE_MAP else False
-        central_line = 0 if not boost else CENTRAL_LINE_MAP[pattern](self.columns)
+        with phase('canvas.allocate', self):
+            canvas = self.allocate_canvas()
+        boost, central_line = self.boost_parameters(pattern)
+
+        with phase('canvas.generate_rows', self):
+            if self.detect_cycles:
+                self.result, self.sums = self.generate_cycling(first_row, pattern, engine, canvas,
+                                                               self.running_stats)
+            elif recognizer is not None:
+                self.result, self.sums = self.generate_recognizing(first_row, pattern, engine,
+                                                                   canvas, recognizer,
+                                                                   self.running_stats)
+            else:
+                self.result, self.sums = self.generate_rows(first_row, self.rows, engine, boost,
+                                                            central_line, canvas=canvas,
+                                                            stats=self.running_stats)
+
+        if self.cache is not None:
+            with phase('canvas.cache_store', self):
+                self.cache.store(self.rule, pattern, first_row, self.result, self.sums)
+
+    def stream_sums(self, chunk_size: int = STREAM_CHUNK_ROWS, pattern: Pattern = None,
+                    engine: Engine | str = None, last_row: ndarray = None,
+                    generated: int = 0, stats: RunningStats = None,
+                    detect_cycles: bool = False,
+                    recognizer: StreamingRecognizer = None) -> tuple[ndarray, ndarray]:
+        """
+        Stream the rows after `generated`, keeping only their sums and the
+        last two rows.  With `detect_cycles` the rows after a detected cycle
+        are not generated, their sums are repeated from the cycle.  Each chunk
+        is passed to `recognizer` as it is generated.
+        """
+        pattern = self.pattern if pattern is None else pattern
+        engine = self.engine if engine is None else resolve_engine(engine)
+
+        base = generated
+        chunk_sums = []
+        last_rows = None if last_row is None or generated == 0 else last_row[None]
 
-        if RUST_AVAILABLE and not force_python:
-            canvas, sums = generate_canvas(canvas[0], self.rows, self.columns, self.flat_rule_set, boost, central_line)
-            self.sums = np_insert(sums, 0, row_sum)
+        while generated < self.rows:
+            detector = self.cycle_detector(pattern, generated) if detect_cycles else None
+            cycle = None
+            for chunk, sums in self.iter_chunks(chunk_size, pattern, engine, last_row, generated,
+                                                stats):
+                chunk_sums.append(sums)
+                if recognizer is not None:
+                    recognizer.update(chunk)
+                last_rows = chunk[-2:].copy() if last_rows is None else concatenate([last_rows, chunk[-2:]])[-2:]
+                cycle = None if detector is None else detector.observe(chunk, generated)
+                generated += len(chunk)
+                last_row = chunk[-1]
+                if cycle is not None:
+                    break
+
+            if cycle is None:
+                break
+
+            stop = detector.prediction_stop(cycle)
+            stop = self.rows if stop is None else min(stop, self.rows)
+            if stop > generated:
+                repeated = fill_sums(concatenate(chunk_sums), cycle, generated, stop, base)
+                chunk_sums.append(repeated)
+                if stats is not None:
+                    stats.update_sums(repeated, generated)
+                last_rows = self.cycle_rows(cycle, [stop-2, stop-1], chunk, generated,
+                                            pattern, engine)
+                last_row, generated = last_rows[-1], stop
+            if stop >= self.rows:
+                self.cycle = cycle
+
+        return concatenate(chunk_sums), last_rows
+
+    def cycle_detector(self, pattern: Pattern, start: int = 0) -> CycleDetector:
+        """
+        Detector for the rows from `start`.  Rules that turn dead
+        neighbourhoods live only repeat once the light cone spans the canvas,
+        and only exactly, as the dead cells past the edges are not evolved.
+        """
+        quiescent = bool(self.rule_table[0] == 0)
+        if quiescent:
+            return CycleDetector(self.columns, True, start)
+
+        boost, central_line = self.boost_parameters(pattern)
+        return CycleDetector(self.columns, False,
+                             max(start, first_full_row(self.columns, boost, central_line)))
+
+    def cycle_rows(self, cycle: Cycle, indices: list[int], chunk: ndarray, generated: int,
+                   pattern: Pattern, engine: Engine) -> ndarray:
+        """
+        Rows at the absolute `indices`, after the first repeat of `cycle`,
+        built from the matching rows of the first repeated period.  `chunk`
+        holds the rows up to `generated` and the rest of that period is
+        streamed on from it.
+        """
+        repeat = cycle.transient + cycle.period
+        sources = {repeat + (index - repeat) % cycle.period for index in indices}
+        chunk_start = generated - len(chunk)
+
+        rows = {source: chunk[source - chunk_start] for source in sources if source < generated}
+        missing = max(sources) + 1
+        if missing > generated:
+            for block, _ in self.iter_chunks(STREAM_CHUNK_ROWS, pattern, engine, chunk[-1], generated):
+                for source in sources:
+                    if generated <= source < generated + len(block):
+                        rows[source] = block[source - generated]
+                generated += len(block)
+                if generated >= missing:
+                    break
+
+        return stack([shift_rows(rows[repeat + (index - repeat) % cycle.period],
+                                 (index - repeat) // cycle.period * cycle.shift)
+                      for index in indices])
+
+    def extend(self, rows: int, engine: Engine | str = None) -> ndarray:
+        """
+        Continue the canvas by `rows` rows from its last rows without
+        regenerating the earlier ones, returning the sums of the new rows.
+        Single cell patterns are widened so that the canvas matches one
+        generated at the new size, other patterns keep their width.  The last
+        row is regenerated as the light cone of a RIGHT canvas reaches one
+        cell past its left edge.
+        """
+        if rows < 1:
+            raise ValueError(f'Rows to extend by must be positive, got {rows}')
+        if self.sums is None:
+            raise ValueError('Canvas must be generated before it is extended')
+
+        engine = self.engine if engine is None else resolve_engine(engine)
+        pattern = self.pattern
+
+        # Recognition covered the rows of the canvas before it was extended
+        self.recognizer = None
+
+        # Read before the width changes, which the unpacking views of some storages depend on
+        old_rows, old_columns = self.rows, self.columns
+        last_rows = self.final_rows()
+
+        # Columns added to the left and right of the existing canvas
+        left, right = {
+            Pattern.STANDARD: (rows, rows),
+            Pattern.RIGHT: (rows, 0),
+            Pattern.LEFT: (0, rows),
+        }.get(pattern, (0, 0))
+
+        self.rows = old_rows + rows
+        self.columns = old_columns + left + right
+
+        # Absolute index of the row generation restarts from
+        seed_index = old_rows - len(last_rows)
+        seed = zeros((self.columns,), uint8)
+        seed[left:left+old_columns] = last_rows[0]
+
+        # The regenerated last row is accumulated again
+        running = self.running_stats
+        if running is not None and seed_index < old_rows - 1:
+            running.remove(old_rows - 1, int(self.sums[old_rows - 1]))
+
+        if self.sums_only:
+            new_sums, self.last_rows = self.stream_sums(STREAM_CHUNK_ROWS, pattern, engine,
+                                                        seed, seed_index+1, running)
         else:
-            canvas = self.python_generate(canvas, self.rows, boost, central_line)
+            # A supplied buffer no longer fits the extended canvas
+            self.buffer = None
+            new_sums = self.extend_rows(seed, seed_index, left, old_rows, old_columns, engine,
+                                        running)
 
+        self.sums = concatenate([self.sums[:seed_index+1], new_sums])
+
+        return self.sums[old_rows:]
+
+    def final_rows(self, count: int = 2) -> ndarray:
+        """
+        Last `count` rows as uint8 cells, from the stored canvas or the rows
+        kept in `sums_only` mode
+        """
+        if self.sums_only:
+            return self.last_rows
+        return asarray(self.result[-count:])
+
+    def extend_rows(self, seed: ndarray, seed_index: int, left: int, old_rows: int,
+                    old_columns: int, engine: Engine, stats: RunningStats = None) -> ndarray:
+        """
+        Move the stored rows into a canvas of the new size, `left` columns in,
+        and generate the rows after `seed_index` from `seed`, returning their
+        sums
+        """
+        canvas = self.allocate_canvas()
+        canvas[:old_rows, left:left+old_columns] = self.result
+
+        boost, central_line = self.boost_parameters(self.pattern)
+        _, new_sums = self.generate_rows(seed, self.rows - seed_index, engine, boost,
+                                         central_line, seed_index, canvas[seed_index:], stats)
+        new_sums = new_sums[1:]
         self.result = canvas
 
+        # Only single cell canvases match a canvas generated at the new size
+        if self.cache is not None and self.pattern in CENTRAL_LINE_MAP:
+            first_row, _ = self.initial_row(self.pattern)
+            self.cache.store(self.rule, self.pattern, first_row, self.result,
+                             concatenate([self.sums[:seed_index+1], new_sums]))
+
+        return new_sums
+
+    def estimate_footprint(self) -> int:
+        """
+        Estimated bytes needed to hold the generated canvas and its sums
+        """
+        sums_bytes = self.rows * uint32().itemsize
+        if self.sums_only:
+            return sums_bytes
+        return self.rows * self.columns * uint8().itemsize + sums_bytes
+
+    def allocate_canvas(self, shape: tuple[int, int] = None, dtype: type = uint8) -> ndarray:
+        """
+        Allocate the zeroed canvas the engines write into.  A caller-supplied
+        `buffer` is used as is, otherwise the canvas spills to a memory-mapped
+        file when it would exceed `memory_budget` or does not fit in memory.
+        """
+        shape = (self.rows, self.columns) if shape is None else shape
+
+        if self.buffer is not None:
+            if self.buffer.shape != shape or self.buffer.dtype != dtype:
+                raise ValueError(f'Buffer must be a {shape} {dtype.__name__} array, got {self.buffer.shape} {self.buffer.dtype}')
+            self.buffer[...] = 0
+            return self.buffer
+
+        if self.memory_budget is None or self.estimate_footprint() <= self.memory_budget:
+            try:
+                return zeros(shape, dtype)
+            except MemoryError:
+                pass
+
+        return self.spill_canvas(shape, dtype)
+
+    def spill_canvas(self, shape: tuple[int, int], dtype: type = uint8) -> memmap:
+        """
+        Create a zero-filled memory-mapped canvas backed by a temporary file
+        that is removed with the canvas
+        """
+        descriptor, self.spill_path = mkstemp(prefix='pyautomata-', suffix='.canvas',
+                                              dir=self.spill_directory)
+        os.close(descriptor)
+        finalize(self, remove_spill_file, self.spill_path)
+
+        return memmap(self.spill_path, dtype, 'w+', shape=shape)
+
+    def generate_cycling(self, first_row: ndarray, pattern: Pattern, engine: Engine,
+                         canvas: ndarray, stats: RunningStats = None) -> tuple[ndarray, ndarray]:
+        """
+        Generate the rows into `canvas` in growing chunks, hashing each row,
+        and fill the rows and sums after a detected cycle by repetition.  A
+        moving cycle that reaches an edge resumes generation from there.
+        """
+        boost, central_line = self.boost_parameters(pattern)
+        sums = zeros((self.rows,), uint32)
+
+        detector = self.cycle_detector(pattern)
+        generated, chunk_rows = 0, CYCLE_CHUNK_ROWS
+
+        while generated < self.rows:
+            count = min(chunk_rows, self.rows - generated)
+            if detector.exhausted:
+                count = self.rows - generated
+
+            if generated == 0:
+                _, sums[:count] = self.generate_rows(first_row, count, engine, boost, central_line,
+                                                     canvas=canvas[:count], stats=stats)
+            else:
+                # The last row is regenerated as the seed
+                _, chunk_sums = self.generate_rows(canvas[generated-1].copy(), count+1, engine,
+                                                   boost, central_line, generated-1,
+                                                   canvas[generated-1:generated+count], stats)
+                sums[generated:generated+count] = chunk_sums[1:]
+
+            cycle = detector.observe(canvas[generated:generated+count], generated)
+            generated += count
+            chunk_rows = min(chunk_rows * 2, CYCLE_CHUNK_LIMIT)
+            if cycle is None:
+                continue
+
+            stop = detector.prediction_stop(cycle)
+            stop = self.rows if stop is None else min(stop, self.rows)
+            if stop > generated:
+                fill_rows(canvas, cycle, generated, stop)
+                sums[generated:stop] = fill_sums(sums, cycle, generated, stop)
+                if stats is not None:
+                    stats.update_sums(sums[generated:stop], generated)
+                generated = stop
+            if stop >= self.rows:
+                self.cycle = cycle
+
+            detector = self.cycle_detector(pattern, generated)
+            chunk_rows = CYCLE_CHUNK_ROWS
+
+        return canvas, sums
+
+    def generate_recognizing(self, first_row: ndarray, pattern: Pattern, engine: Engine,
+                             canvas: ndarray, recognizer: StreamingRecognizer,
+                             stats: RunningStats = None) -> tuple[ndarray, ndarray]:
+        """
+        Generate the rows into `canvas` a chunk at a time, recognizing each
+        chunk while it is still in cache rather than reading the canvas back
+        """
+        boost, central_line = self.boost_parameters(pattern)
+        sums = zeros((self.rows,), uint32)
+        generated = 0
+
+        while generated < self.rows:
+            count = min(STREAM_CHUNK_ROWS, self.rows - generated)
+            if generated == 0:
+                _, sums[:count] = self.generate_rows(first_row, count, engine, boost, central_line,
+                                                     canvas=canvas[:count], stats=stats)
+            else:
+                # The last row is regenerated as the seed
+                _, chunk_sums = self.generate_rows(canvas[generated-1].copy(), count+1, engine,
+                                                   boost, central_line, generated-1,
+                                                   canvas[generated-1:generated+count], stats)
+                sums[generated:generated+count] = chunk_sums[1:]
+
+            recognizer.update(canvas[generated:generated+count])
+            generated += count
+
+        return canvas, sums
+
+    def generate_rows(self, first_row: ndarray, rows: int, engine: Engine, boost: bool = False,
+                      central_line: int = 0, row_offset: int = 0, canvas: ndarray = None,
+                      stats: RunningStats = None) -> tuple[ndarray, ndarray]:
+        """
+        Dispatch the generation of `rows` rows, starting with `first_row`, to
+        the selected engine and return the rows and their sums.  `row_offset`
+        is the absolute index of `first_row` when continuing a canvas and
+        `canvas` an optional zeroed buffer that the engines write into.  The
+        Rust and NumPy engines tile the rows across `threads` when above one.
+        The rows after `first_row` are added to `stats` as they are generated.
+        """
+        if engine is Engine.RUST:
+            return generate_canvas(first_row, rows, self.columns, self.flat_rule_set,
+                                   boost, central_line, row_offset, canvas, self.threads,
+                                   stats=stats)
+        elif engine is Engine.NUMPY and self.threads > 1:
+            return vectorized.generate_canvas_tiled(first_row, rows, self.columns, self.rule_table,
+                                                    boost, central_line, row_offset, canvas,
+                                                    self.threads, stats=stats)
+        elif engine is Engine.NUMPY:
+            return vectorized.generate_canvas(first_row, rows, self.columns, self.rule_table,
+                                              boost, central_line, row_offset, canvas, stats)
+        else:
+            if canvas is None:
+                canvas = zeros([rows, self.columns], uint8)
+                ascontiguousarray(canvas)
+            canvas[0] = first_row
+            return self.python_generate(canvas, rows, boost, central_line, row_offset, stats)
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_ROWS, pattern: Pattern = None,
+                    engine: Engine | str = None, last_row: ndarray = None,
+                    generated: int = 0,
+                    stats: RunningStats = None) -> Iterator[tuple[ndarray, ndarray]]:
+        """
+        Stream the canvas as `(rows, sums)` chunks of at most `chunk_size` rows,
+        only holding one chunk and the last row between engine calls.
+        `last_row` and `generated` resume the stream after `generated` rows,
+        `last_row` being the first row when `generated` is 0.  The rows
+        generated after the first are added to `stats`.
+        """
+        pattern = self.pattern if pattern is None else pattern
+        engine = self.engine if engine is None else resolve_engine(engine)
+
+        if last_row is None:
+            last_row, _ = self.initial_row(pattern)
+        boost, central_line = self.boost_parameters(pattern)
+
+        while generated < self.rows:
+            if generated == 0:
+                count = min(chunk_size, self.rows)
+                chunk, sums = self.generate_rows(last_row, count, engine, boost, central_line,
+                                                 stats=stats)
+            else:
+                # The last row is regenerated as the seed and dropped
+                count = min(chunk_size, self.rows - generated)
+                chunk, sums = self.generate_rows(last_row, count+1, engine, boost,
+                                                 central_line, generated-1, stats=stats)
+                chunk, sums = chunk[1:], sums[1:]
+
+            generated += count
+            last_row = chunk[-1].copy()
+            yield chunk, sums
+
+    def iter_rows(self, chunk_size: int = None, pattern: Pattern = None,
+                  engine: Engine | str = None) -> Iterator[ndarray]:
+        """
+        Generator over the rows of the canvas without materializing it.
+        Yields single rows by default or `chunk_size x columns` blocks.
+        """
+        if chunk_size is not None:
+            for chunk, _ in self.iter_chunks(chunk_size, pattern, engine):
+                yield chunk
+            return
+
+        for chunk, _ in self.iter_chunks(STREAM_CHUNK_ROWS, pattern, engine):
+            yield from chunk
+
     def python_generate_row(self, input_row: ndarray, start: int, stop: int) -> tuple[ndarray, int]:
         """
         Method to generate the next row given an input row
@@ -108,31 +592,75 @@ class BaseCanvas:
         new_row = zeros((self.columns,), uint8)
         row_sum = 0
         
-        for i in arange(start, stop):
-            left = 0 if i < 0 else input_row[i]
-            center = input_row[i+1]
-            right = 0 if i >= len(input_row)-2 else input_row[i+2]
+        for i in range(start, stop):
+            left = 0 if i == 0 else input_row[i-1]
+            center = input_row[i]
+            right = 0 if i == self.columns-1 else input_row[i+1]
             output_pattern = self.rule_set[(left, center, right)]
-            new_row[i+1] = output_pattern
+            new_row[i] = output_pattern
             row_sum += output_pattern
 
         return new_row, row_sum
 
 
-    def python_generate(self, canvas: ndarray, rows: int, boost: bool = False, central_line: int = 0):
+    def python_generate(self, canvas: ndarray, rows: int, boost: bool = False,
+                        central_line: int = 0, row_offset: int = 0,
+                        stats: RunningStats = None) -> tuple[ndarray, ndarray]:
         """
         Alternative function to internally generate a canvas instead of using
         the Rust API
         """
-        for i in arange(0, rows-1):
-            start = (central_line - i - 2) if boost else 0
-            stop = min((central_line + i + 2, self.columns-1)) if boost else self.columns-1
+        sums = [int(canvas[0].sum())]
+
+        for i in range(0, rows-1):
+            start, stop = vectorized.row_bounds(i + row_offset, self.columns, boost, central_line)
 
             new_row, row_sum = self.python_generate_row(canvas[i], start, stop)
-            self.sums.append(row_sum)
+            sums.append(row_sum)
             canvas[i+1] = new_row
+            if stats is not None:
+                stats.update(i + row_offset + 1, row_sum)
 
-        self.sums = array(self.sums)
+        return canvas, array(sums, uint32)
 
-        return canvas
-    
+
+@cache
+def build_rule_set(rule: int) -> tuple[dict[tuple[int], int], ndarray, ndarray]:
+    """
+    Build the rule set lookups once per rule: the neighbourhood tuple map, the
+    8-entry table indexed by `left<<2 | center<<1 | right` and the flat
+    `left, center, right, output` array passed to Rust.  The arrays are
+    shared between canvases and therefore read-only.
+    """
+    rule_set = {}
+    flat_rule_set = []
+    rule_table = zeros((8,), uint8)
+    output_rule_set = [int(x) for x in binary_repr(rule, width=8)]
+
+    for i in range(8):
+        input_rule_set = tuple([int(x) for x in binary_repr(7-i, 3)])
+        rule_set[input_rule_set] = output_rule_set[i]
+        rule_table[7-i] = output_rule_set[i]
+        flat_rule_set.extend([*input_rule_set, output_rule_set[i]])
+
+    flat_rule_set = array(flat_rule_set, uint8)
+    rule_table.flags.writeable = False
+    flat_rule_set.flags.writeable = False
+
+    return rule_set, rule_table, flat_rule_set
+
+def random_rows(count: int, columns: int, seed: int = None) -> ndarray:
+    """
+    Draw `count x columns` random cells in one vectorized call
+    """
+    return default_rng(seed).integers(0, 2, (count, columns), uint8)
+
+def remove_spill_file(path: str) -> None:
+    """
+    Remove a canvas spill file, ignoring files that are already gone or still
+    mapped on platforms that refuse to delete them
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
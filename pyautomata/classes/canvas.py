@@ -1,10 +1,20 @@
 # Project PyAutomata Canvas Class Library
 
+# Python Modules
+from typing import TYPE_CHECKING
+
+# Third-Party Modules
+from numpy import ndarray
+
 # Local Modules
 from pyautomata.classes.basecanvas import BaseCanvas
-from pyautomata.classes.general import Pattern
-from pyautomata.render import draw_plot, draw_standard_deviation
-from pyautomata.stats import StatsContainer, calculate_stats
+from pyautomata.classes.general import Engine, Pattern
+from pyautomata.render import (
+    DensityPyramid, build_pyramid, draw_plot, draw_standard_deviation, preview_png, write_png
+)
+from pyautomata.stats import StatsContainer, calculate_continued_stats, calculate_stats
+if TYPE_CHECKING:
+    from pyautomata.cache import CanvasCache
 
 class Canvas(BaseCanvas):
     """
@@ -12,20 +22,49 @@ class Canvas(BaseCanvas):
     circular import and dependency errors
     """
     def __init__(self, rule: int, rows: int = 100, pattern: Pattern = Pattern.STANDARD,
-                 force_python: bool = False, generate: bool = True) -> None:
-        super().__init__(rule, rows, pattern, force_python, generate)
-        
-        if generate:
-            self._stats: StatsContainer = calculate_stats(self)
+                 force_python: bool = False, generate: bool = True,
+                 engine: Engine | str = None, sums_only: bool = False,
+                 memory_budget: int = None, buffer: ndarray = None,
+                 spill_directory: str = None, threads: int = None,
+                 cache: 'CanvasCache' = None, seed: int = None,
+                 detect_cycles: bool = False, recognize: int = None) -> None:
+        self._stats: StatsContainer = None
+        self._stats_sums: ndarray = None
+        super().__init__(rule, rows, pattern, force_python, generate, engine, sums_only,
+                         memory_budget, buffer, spill_directory, threads, cache, seed,
+                         detect_cycles, recognize)
 
     @property
     def stats(self):
-        if self.result is None:
+        """
+        Stats of the row sums, built on first access and again whenever the
+        sums are replaced
+        """
+        if self.sums is None:
             self.generate(self.pattern)
-        if self._stats is None:
+        if self._stats is None or self._stats_sums is not self.sums:
             self._stats: StatsContainer = calculate_stats(self)
+            self._stats_sums = self.sums
         return self._stats
 
+    def extend(self, rows: int, engine: Engine | str = None) -> ndarray:
+        """
+        Continue the canvas by `rows` rows without recalculating the stats of
+        the existing rows.  The running stats are carried through the engines,
+        otherwise the stats of the new rows are merged into the existing ones.
+        """
+        start = self.rows
+        last_sum = self.sums[-1]
+        new_sums = super().extend(rows, engine)
+
+        # A regenerated last row that changed also invalidates merged stats
+        if self.running_stats is not None or self.sums[start-1] != last_sum:
+            self._stats = None
+        elif self._stats is not None:
+            self._stats = self._stats.merge(calculate_continued_stats(new_sums, start))
+            self._stats_sums = self.sums
+        return new_sums
+
     def render(self, max_depth: int = None, filename: str = None,
                title: str = None) -> None:
         """
@@ -36,6 +75,21 @@ class Canvas(BaseCanvas):
                 raise ValueError(f'Max depth cannot exceed canvas columns ({max_depth} v. {self.columns})')
         draw_plot(self, max_depth, filename, title)
 
+    def save_png(self, filename: str, bit_depth: int = 1) -> None:
+        """
+        Write the canvas to a full resolution PNG, 1 or 8 bits per cell
+        """
+        write_png(self, filename, bit_depth)
+
+    def pyramid(self, block: int = 8, levels: int = None) -> DensityPyramid:
+        """
+        Density pyramid of the canvas for previewing and zooming large canvases
+        """
+        return build_pyramid(self, block, levels)
+
+    def _repr_png_(self) -> bytes | None:
+        return preview_png(self)
+
     def draw_sums_deviations(self, start: int = None, end: int = None):
         """
         Charts the calculated row sums and the standard deviations
@@ -1,5 +1,7 @@
 from enum import Enum
 
+from pyautomata.handlers.rust import rust_available
+
 class Pattern(Enum):
     ALTERNATING = 'Alternating First Row'
     RANDOM = 'Random First Row'
@@ -30,4 +32,49 @@ CENTRAL_LINE_MAP = {
     Pattern.LEFT: lambda _: 0,
     Pattern.RIGHT: lambda i: i-1,
     Pattern.STANDARD: lambda i: i//2,
-}
\ No newline at end of file
+}
+
+class Engine(Enum):
+    PYTHON = 'Python'
+    NUMPY = 'NumPy'
+    RUST = 'Rust'
+
+    @classmethod
+    def from_string(cls, input_string: str):
+        """
+        Basic conversion method for mapping strings to values
+        """
+        string_map: dict = {
+            'python': cls.PYTHON,
+            'numpy': cls.NUMPY,
+            'rust': cls.RUST,
+        }
+
+        if (engine_match := string_map.get(input_string.lower())):
+            return engine_match
+        else:
+            raise ValueError(f'No Engine with the value: {input_string}')
+
+
+def resolve_engine(engine: Engine | str = None, force_python: bool = False) -> Engine:
+    """
+    Select the engine, preferring Rust and falling back on NumPy when the
+    compiled library is not available
+    """
+    if force_python:
+        return Engine.PYTHON
+
+    if engine is not None and not isinstance(engine, Engine):
+        engine = Engine.from_string(engine)
+
+    if engine is None or (engine is Engine.RUST and not rust_available()):
+        return Engine.RUST if rust_available() else Engine.NUMPY
+
+    return engine
+
+def validate_rule(rule: int) -> None:
+    """
+    Raise a ValueError unless `rule` is a rule number a canvas can be built for
+    """
+    if type(rule) != int or not 1 <= rule <= 256:
+        raise ValueError('Rule must be an integer between 1 and 256')
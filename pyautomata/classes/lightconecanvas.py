@@ -0,0 +1,107 @@
+# Project PyAutomata Light Cone Canvas Class Library
+
+# Third-Party Modules
+from numpy import ndarray, zeros, uint8, uint32
+
+# Local Modules
+from pyautomata.classes.canvas import Canvas
+from pyautomata.classes.general import Engine, Pattern, CENTRAL_LINE_MAP
+from pyautomata.handlers import lightcone
+from pyautomata.instrument import phase
+from pyautomata.stats import RunningStats
+
+class LightConeCanvas(Canvas):
+    """
+    Canvas for the patterns starting from a single cell that only stores the
+    light cone of each row, roughly halving the memory of a STANDARD canvas.
+    `result` is a `LightConeArray` that densifies the regions it is indexed
+    with, or the whole canvas through `numpy.asarray`.
+    """
+    def __init__(self, rule: int, rows: int = 100, pattern: Pattern = Pattern.STANDARD,
+                 **kwargs) -> None:
+        pattern = pattern if isinstance(pattern, Pattern) else Pattern.from_string(pattern)
+        if pattern not in CENTRAL_LINE_MAP:
+            raise ValueError(f'Light cone canvases need a single cell pattern, got {pattern.value}')
+
+        # Options that need the rows of the dense generation path
+        dense_options = [name for name in ['cache', 'detect_cycles', 'recognize']
+                         if kwargs.get(name) is not None and kwargs.get(name) is not False]
+        if dense_options and not kwargs.get('sums_only'):
+            raise ValueError(f'Light cone canvases only support {", ".join(dense_options)} with sums_only')
+
+        super().__init__(rule, rows, pattern, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'Light Cone Canvas: Rule {self.rule} - {self.description}'
+
+    @property
+    def nbytes(self) -> int:
+        return 0 if self.result is None else self.result.nbytes
+
+    def cell_count(self) -> int:
+        """
+        Number of cells stored across the light cone spans
+        """
+        _, central_line = self.boost_parameters(self.pattern)
+        starts, stops = lightcone.cone_spans(self.rows, self.columns, central_line)
+        return int((stops - starts).sum())
+
+    def estimate_footprint(self) -> int:
+        """
+        Estimated bytes needed to hold the light cone spans and the sums
+        """
+        sums_bytes = self.rows * uint32().itemsize
+        if self.sums_only:
+            return sums_bytes
+        return self.cell_count() * uint8().itemsize + sums_bytes
+
+    def generate(self, pattern: Pattern = Pattern.STANDARD,
+                 force_python: bool = False, engine: Engine | str = None):
+        """
+        Generate the light cone canvas.  The span kernel is used regardless
+        of the engine selection.
+        """
+        if self.sums_only:
+            return super().generate(pattern, force_python, engine)
+
+        with phase('canvas.initial_row', self):
+            first_row, first_sum = self.initial_row(pattern)
+        _, central_line = self.boost_parameters(pattern)
+
+        with phase('canvas.allocate', self):
+            cells = self.allocate_canvas((self.cell_count(),), uint8)
+
+        self.running_stats = RunningStats()
+        self.running_stats.update(0, first_sum)
+        with phase('canvas.generate_rows', self):
+            self.result, self.sums = lightcone.generate_canvas(first_row, self.rows, self.columns,
+                                                               self.rule_table, central_line, cells,
+                                                               self.running_stats)
+
+    def extend_rows(self, seed: ndarray, seed_index: int, left: int, old_rows: int,
+                    old_columns: int, engine: Engine, stats: RunningStats = None) -> ndarray:
+        """
+        Move the stored spans into the cone of the new size, `left` columns
+        in, and generate the spans after `seed_index`, which is already held.
+        The span kernel is used regardless of the engine selection.
+        """
+        _, central_line = self.boost_parameters(self.pattern)
+        starts, stops = lightcone.cone_spans(self.rows, self.columns, central_line)
+        offsets = lightcone.span_offsets(starts, stops)
+        cells = self.allocate_canvas((offsets[-1],), uint8)
+
+        # The old spans lie inside the new ones, which are only wider where
+        # the old canvas was cut off by its edges
+        for row in range(seed_index + 1):
+            start, values = self.result.row_span(row)
+            offset = offsets[row] + start + left - starts[row]
+            cells[offset:offset+len(values)] = values
+
+        sums = zeros((self.rows,), uint32)
+        lightcone.advance_cone(cells, starts, stops, offsets, self.columns, self.rule_table,
+                               seed_index, sums)
+        if stats is not None:
+            stats.update_sums(sums[seed_index+1:], seed_index + 1)
+
+        self.result = lightcone.LightConeArray(cells, starts, stops, self.columns, central_line)
+        return sums[seed_index+1:]
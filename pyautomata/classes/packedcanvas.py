@@ -0,0 +1,112 @@
+# Project PyAutomata Packed Canvas Class Library
+
+# Third-Party Modules
+from numpy import ndarray, zeros, uint8, uint32, uint64
+
+# Local Modules
+from pyautomata.classes.canvas import Canvas
+from pyautomata.classes.general import Engine, Pattern
+from pyautomata.handlers import packed
+from pyautomata.instrument import phase
+from pyautomata.stats import RunningStats
+
+# Cells unpacked at a time when the rows are moved into a wider canvas
+REPACK_BLOCK_CELLS = 1 << 22
+
+class PackedCanvas(Canvas):
+    """
+    Canvas that stores each row as uint64 words, 1 bit per cell, and advances
+    them with word-wide bitwise operations derived from the rule number.
+    `result` is an unpacking view for consumers expecting a uint8 array.
+    """
+    def __init__(self, rule: int, rows: int = 100, pattern: Pattern = Pattern.STANDARD,
+                 **kwargs) -> None:
+        super().__init__(rule, rows, pattern, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'Packed Canvas: Rule {self.rule} - {self.description}'
+
+    @property
+    def result(self) -> ndarray:
+        if self.packed is None:
+            return None
+        return self.unpack()
+
+    @result.setter
+    def result(self, value: ndarray) -> None:
+        self.packed = None if value is None else packed.pack_rows(value)
+
+    @property
+    def nbytes(self) -> int:
+        return 0 if self.packed is None else self.packed.nbytes
+
+    def estimate_footprint(self) -> int:
+        """
+        Estimated bytes needed to hold the packed canvas and its sums
+        """
+        sums_bytes = self.rows * uint32().itemsize
+        if self.sums_only:
+            return sums_bytes
+        return self.rows * packed.word_count(self.columns) * uint64().itemsize + sums_bytes
+
+    def unpack(self, start: int = 0, stop: int = None) -> ndarray:
+        """
+        Unpack the rows `[start, stop)` into a `rows x columns` uint8 array
+        """
+        return packed.unpack_rows(self.packed[start:stop], self.columns)
+
+    def generate(self, pattern: Pattern = Pattern.STANDARD,
+                 force_python: bool = False, engine: Engine | str = None):
+        """
+        Generate the packed canvas.  The packed kernel is used regardless of
+        the engine selection, except that canvases served from the cache,
+        detecting cycles or recognizing their rows are generated as uint8 and
+        packed afterwards.
+        """
+        if self.sums_only or self.cache is not None or self.detect_cycles or self.recognize is not None:
+            return super().generate(pattern, force_python, engine)
+
+        with phase('canvas.initial_row', self):
+            first_row, first_sum = self.initial_row(pattern)
+        boost, central_line = self.boost_parameters(pattern)
+
+        with phase('canvas.allocate', self):
+            canvas = self.allocate_canvas((self.rows, packed.word_count(self.columns)), uint64)
+
+        self.running_stats = RunningStats()
+        self.running_stats.update(0, first_sum)
+        with phase('canvas.generate_rows', self):
+            self.packed, self.sums = packed.generate_canvas(first_row, self.rows, self.columns,
+                                                            self.rule_table, boost, central_line,
+                                                            canvas=canvas, stats=self.running_stats)
+
+    def final_rows(self, count: int = 2) -> ndarray:
+        """
+        Last `count` rows as uint8 cells, unpacking only those rows
+        """
+        if self.sums_only:
+            return self.last_rows
+        return self.unpack(max(self.rows - count, 0))
+
+    def extend_rows(self, seed: ndarray, seed_index: int, left: int, old_rows: int,
+                    old_columns: int, engine: Engine, stats: RunningStats = None) -> ndarray:
+        """
+        Re-pack the stored rows a block at a time into words of the new width,
+        `left` columns in, and generate the rows after `seed_index` from
+        `seed`.  The packed kernel is used regardless of the engine selection.
+        """
+        words = self.allocate_canvas((self.rows, packed.word_count(self.columns)), uint64)
+
+        block_rows = max(1, REPACK_BLOCK_CELLS // self.columns)
+        for start in range(0, seed_index, block_rows):
+            stop = min(start + block_rows, seed_index)
+            cells = zeros((stop - start, self.columns), uint8)
+            cells[:, left:left+old_columns] = packed.unpack_rows(self.packed[start:stop], old_columns)
+            words[start:stop] = packed.pack_rows(cells)
+
+        boost, central_line = self.boost_parameters(self.pattern)
+        _, new_sums = packed.generate_canvas(seed, self.rows - seed_index, self.columns,
+                                             self.rule_table, boost, central_line, seed_index,
+                                             words[seed_index:], stats)
+        self.packed = words
+        return new_sums[1:]
@@ -1,79 +1,299 @@
 # PyAutomata Recognizer Library
 
+# Python Modules
+from typing import Iterable
+
 # Third-Party Modules
-from numpy import ndarray
+from numpy import arange, array, asarray, concatenate, flatnonzero, log2, ndarray
 
 # Local Modules
-from pyautomata.handlers.rust import RUST_AVAILABLE, recognize_canvas
-from pyautomata.classes.general import Pattern, CENTRAL_LINE_MAP
+from pyautomata.handlers import vectorized
+from pyautomata.handlers.lightcone import LightConeArray
+from pyautomata.handlers.rust import MAX_PACKED_PATTERN_LENGTH, recognize_canvas, recognize_canvas_lengths
+from pyautomata.handlers.vectorized import window_bounds
+from pyautomata.classes.general import Engine, Pattern, CENTRAL_LINE_MAP, resolve_engine, validate_rule
+from pyautomata.instrument import PhaseRecord, phase
 
 class Recognizer:
     """
     Recognizer is the term to given to the pattern analyzer.  It iterates a canvas
     and returns the number of times repeating segments come up.  It also creates
     a new `rule set` for the new larger pattern size.
+
+    Windows are held as packed integer codes, most significant cell first, in
+    `segment_counts` (a dense histogram) and `parent_segments` (parent code to
+    segment code, -1 where unseen).  The tuple-keyed `pattern_segments` and
+    `pattern_rules` dictionaries are built from them on first access.
     """
     def __init__(self, rule: int, canvas_array: ndarray, canvas_pattern: Pattern = None,
-                 pattern_length: int = 5, force_python: bool = False) -> None:
+                 pattern_length: int = 5, force_python: bool = False,
+                 engine: Engine | str = None, recognize: bool = True) -> None:
+        self.initialize(rule, canvas_pattern, pattern_length, force_python, engine)
+        self.canvas_array = canvas_array
+        self.input_rows = len(canvas_array)
 
-        init_except_message = 'Rule must be an integer between 1 and 256'
-        if type(rule) != int:
-            raise ValueError(init_except_message)
-        if not 1 <= rule <= 256:
-            raise ValueError(init_except_message)
+        # Light cone storage carries its own bounds
+        if isinstance(canvas_array, LightConeArray):
+            self.boost, self.central_line = True, canvas_array.central_line
+        else:
+            self.boost = True if canvas_pattern in CENTRAL_LINE_MAP else False
+            self.central_line = 0 if not self.boost else CENTRAL_LINE_MAP[canvas_pattern](len(canvas_array[0]))
+
+        if recognize:
+            self.recognize_canvas(canvas_array, pattern_length, force_python, self.boost,
+                                  self.central_line, self.engine)
+
+    def initialize(self, rule: int, canvas_pattern: Pattern, pattern_length: int,
+                   force_python: bool, engine: Engine | str) -> None:
+        """
+        Validate the rule and set up the state shared with the streaming
+        recognizer, before any rows are seen
+        """
+        validate_rule(rule)
 
         self.rule = rule
-        self.canvas_array = canvas_array
-        self.input_rows = len(canvas_array)
         self.pattern_length = pattern_length
         self.canvas_pattern = canvas_pattern
+        self.engine = resolve_engine(engine, force_python)
+
+        self.segment_counts: ndarray = None
+        self.parent_segments: ndarray = None
+        self._pattern_segments: dict[tuple[int], int] = None
+        self._pattern_rules: dict[tuple[int], tuple[int]] = None
 
-        boost = True if canvas_pattern in CENTRAL_LINE_MAP else False
-        central_line = 0 if not boost else CENTRAL_LINE_MAP[canvas_pattern](len(canvas_array[0]))
+        # Phases recorded while `Instrumentation` is entered
+        self.timings: list[PhaseRecord] = []
 
-        self.recognize_canvas(canvas_array, pattern_length, force_python, boost, central_line)
+    @property
+    def pattern_segments(self) -> dict[tuple[int], int]:
+        if self._pattern_segments is None:
+            codes = flatnonzero(self.segment_counts)
+            segments = decode_windows(codes, self.pattern_length)
+            self._pattern_segments = dict(zip(segments, self.segment_counts[codes].tolist()))
+        return self._pattern_segments
+
+    @property
+    def pattern_rules(self) -> dict[tuple[int], tuple[int]]:
+        if self._pattern_rules is None:
+            codes = flatnonzero(self.parent_segments >= 0)
+            parents = decode_windows(codes, self.pattern_length + 2)
+            segments = decode_windows(self.parent_segments[codes], self.pattern_length)
+            self._pattern_rules = dict(zip(parents, segments))
+        return self._pattern_rules
+
+    @property
+    def block_entropy(self) -> float:
+        """
+        Shannon entropy in bits of the segment distribution
+        """
+        if self.segment_counts is None:
+            counts = asarray(list(self.pattern_segments.values()))
+        else:
+            counts = self.segment_counts[self.segment_counts > 0]
+        if not counts.sum():
+            return 0.0
+        probabilities = counts / counts.sum()
+        return float(-(probabilities * log2(probabilities)).sum())
 
     def recognize_canvas(self, canvas_array: ndarray, pattern_length: int = 5,
                          force_python: bool = False, boost: bool = False,
-                         central_line: int = 0) -> None:
+                         central_line: int = 0, engine: Engine | str = None,
+                         row_offset: int = 0) -> None:
         """
-        Wrapper for generating the analysis either with Rust or Python
+        Wrapper for generating the analysis with Rust, NumPy or Python.
+        Pattern lengths too long to pack fall back on Python.  Light cone
+        storage is read block by block with NumPy rather than densified for Rust.
+        A block of rows continuing a canvas from absolute row `row_offset`,
+        its first row being the parent of the second, is added to the tables
+        of the earlier blocks.
         """
+        engine = resolve_engine(engine, force_python)
+        if engine is Engine.RUST and isinstance(canvas_array, LightConeArray):
+            engine = Engine.NUMPY
+
         # Collect kwargs from the signature
-        kwargs = {k:v for k,v in locals().items() if k not in ['self', 'force_python']}
+        kwargs = {k:v for k,v in locals().items() if k not in ['self', 'force_python', 'engine']}
 
-        if RUST_AVAILABLE and not force_python:
-            rules_dict, segment_dict, segments = recognize_canvas(canvas_array.shape, **kwargs)
-            self.pattern_rules = rules_dict
-            self.pattern_segments = segment_dict
-            self.segment_count = segments
-        else:
-            self.python_recognize_canvas(**kwargs)
+        if pattern_length > MAX_PACKED_PATTERN_LENGTH:
+            engine = Engine.PYTHON
+
+        if engine is not Engine.PYTHON and row_offset and self.segment_counts is not None:
+            kwargs.update(segment_counts=self.segment_counts, parent_segments=self.parent_segments)
+
+        with phase('recognize', self):
+            if engine is Engine.RUST:
+                results = recognize_canvas(canvas_array.shape, **kwargs)
+            elif engine is Engine.NUMPY:
+                results = vectorized.recognize_canvas(**kwargs)
+            else:
+                return self.python_recognize_canvas(**kwargs)
+
+        self.segment_counts, self.parent_segments, segment_count = results
+        self.segment_count = segment_count + (self.segment_count if row_offset else 0)
+        self._pattern_segments = self._pattern_rules = None
 
     def python_recognize_canvas(self, canvas_array: ndarray, pattern_length: int = 5,
-                                boost: bool = False, central_line: int = 0) -> None:
+                                boost: bool = False, central_line: int = 0,
+                                row_offset: int = 0) -> None:
         """
         'Recognition' is a function that searches and return longer pattern sets
         """
-        self.pattern_segments: dict[tuple[int], int] = {}
-        self.pattern_rules: dict[tuple[int], tuple[int]] = {}
-        self.segment_count = 0
+        if not row_offset or self._pattern_segments is None:
+            self._pattern_segments = {}
+            self._pattern_rules = {}
+            self.segment_count = 0
 
         for i in range(1, len(canvas_array)):
 
-            stop_default = len(canvas_array[i])-pattern_length
-            start = (central_line - i - 2) if boost else 1
-            stop = min(central_line + i + 2, stop_default) if boost else stop_default
-            
-            # for j in range(1, len(canvas_array[i])-pattern_length):
+            start, stop = window_bounds(i + row_offset, len(canvas_array[i]), pattern_length, boost,
+                                        central_line)
+
+            row, parent_row = canvas_array[i], canvas_array[i-1]
+
             for j in range(start, stop):
 
-                segment = tuple(canvas_array[i][j:j+pattern_length])
-                parent_pattern = tuple(canvas_array[i-1][j-1:j+len(segment)+1])
+                segment = tuple(row[j:j+pattern_length].tolist())
+                parent_pattern = tuple(parent_row[j-1:j+len(segment)+1].tolist())
                 self.segment_count += 1
-                self.pattern_rules[parent_pattern] = segment
+                self._pattern_rules[parent_pattern] = segment
 
-                if segment in self.pattern_segments:
-                    self.pattern_segments[segment] += 1
+                if segment in self._pattern_segments:
+                    self._pattern_segments[segment] += 1
                 else:
-                    self.pattern_segments[segment] = 1
\ No newline at end of file
+                    self._pattern_segments[segment] = 1
+
+
+class StreamingRecognizer(Recognizer):
+    """
+    Recognizer fed the rows of a canvas as they are generated, such as the
+    blocks of `Canvas.iter_rows`, instead of a complete canvas array.  Only
+    the last row is kept between blocks, as the parent of the next, along
+    with the histograms, so memory does not grow with the rows.
+
+    The results match a `Recognizer` over the whole canvas.  The light cone
+    bounds of single cell patterns are taken from the width of the first row.
+    """
+    def __init__(self, rule: int, canvas_pattern: Pattern = None, pattern_length: int = 5,
+                 force_python: bool = False, engine: Engine | str = None) -> None:
+        self.initialize(rule, canvas_pattern, pattern_length, force_python, engine)
+        self.canvas_array = None
+        self.input_rows = 0
+        self.segment_count = 0
+
+        self.boost = canvas_pattern in CENTRAL_LINE_MAP
+        self.central_line = 0
+        self.last_row: ndarray = None
+
+    def update(self, rows: ndarray) -> 'StreamingRecognizer':
+        """
+        Recognize the next row or block of consecutive rows
+        """
+        rows = asarray(rows)
+        if rows.ndim == 1:
+            rows = rows[None]
+        if not len(rows):
+            return self
+
+        if self.last_row is None:
+            if self.boost:
+                self.central_line = CENTRAL_LINE_MAP[self.canvas_pattern](rows.shape[1])
+            block, row_offset = rows, 0
+        else:
+            block, row_offset = concatenate([self.last_row[None], rows]), self.input_rows - 1
+
+        self.recognize_canvas(block, self.pattern_length, False, self.boost, self.central_line,
+                              self.engine, row_offset)
+        self.input_rows += len(rows)
+        self.last_row = rows[-1].copy()
+        return self
+
+    def consume(self, stream: Iterable[ndarray]) -> 'StreamingRecognizer':
+        """
+        Recognize every row or block of rows of a stream, in order
+        """
+        for rows in stream:
+            self.update(rows)
+        return self
+
+
+class MultiRecognizer:
+    """
+    Recognition at several pattern lengths in a single traversal of the
+    canvas.  The packed engines build each window code once, for the longest
+    parent window, and take the shorter segments and parents from its leading
+    cells.  Lengths too long to pack, and the Python engine, fall back on a
+    recognition per length.
+
+    `results` maps each length to a `Recognizer` holding its histogram and
+    parent table, and `block_entropy` is the entropy curve over the lengths.
+    """
+    def __init__(self, rule: int, canvas_array: ndarray, canvas_pattern: Pattern = None,
+                 pattern_lengths: Iterable[int] = range(3, 17), force_python: bool = False,
+                 engine: Engine | str = None) -> None:
+        self.pattern_lengths = sorted(set(pattern_lengths))
+        if not self.pattern_lengths or self.pattern_lengths[0] < 1:
+            raise ValueError('Pattern lengths must be positive integers')
+
+        self.results = {length: Recognizer(rule, canvas_array, canvas_pattern, length, force_python,
+                                           engine, recognize=False)
+                        for length in self.pattern_lengths}
+
+        first = self.results[self.pattern_lengths[0]]
+        self.rule = rule
+        self.canvas_pattern = canvas_pattern
+        self.engine = first.engine
+
+        # Phases recorded while `Instrumentation` is entered
+        self.timings: list[PhaseRecord] = []
+
+        self.recognize_canvas(canvas_array, first.boost, first.central_line)
+
+    def __getitem__(self, pattern_length: int) -> Recognizer:
+        return self.results[pattern_length]
+
+    @property
+    def block_entropy(self) -> ndarray:
+        """
+        Block entropy in bits at each pattern length, in order of length
+        """
+        return array([self.results[length].block_entropy for length in self.pattern_lengths])
+
+    def recognize_canvas(self, canvas_array: ndarray, boost: bool = False,
+                         central_line: int = 0) -> None:
+        """
+        Fill the recognizer of every length, sharing one traversal between the
+        lengths that pack
+        """
+        engine = self.engine
+        if engine is Engine.RUST and isinstance(canvas_array, LightConeArray):
+            engine = Engine.NUMPY
+
+        packed = [] if engine is Engine.PYTHON else \
+            [length for length in self.pattern_lengths if length <= MAX_PACKED_PATTERN_LENGTH]
+
+        if packed:
+            with phase('recognize', self):
+                if engine is Engine.RUST:
+                    results = recognize_canvas_lengths(canvas_array.shape, canvas_array, packed,
+                                                       boost, central_line)
+                else:
+                    results = vectorized.recognize_canvas_lengths(canvas_array, packed, boost,
+                                                                  central_line)
+
+            for length, (segment_counts, parent_segments, segment_count) in zip(packed, results):
+                recognizer = self.results[length]
+                recognizer.segment_counts, recognizer.parent_segments = segment_counts, parent_segments
+                recognizer.segment_count = segment_count
+
+        for length in self.pattern_lengths:
+            if length not in packed:
+                self.results[length].recognize_canvas(canvas_array, length, engine is Engine.PYTHON,
+                                                      boost, central_line, engine)
+
+
+def decode_windows(codes: ndarray, length: int) -> list[tuple[int]]:
+    """
+    Unpack integer window codes, most significant cell first, into tuples
+    """
+    shifts = arange(length - 1, -1, -1)
+    return list(map(tuple, ((codes[:, None] >> shifts) & 1).tolist()))
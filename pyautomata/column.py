@@ -0,0 +1,44 @@
+# Project PyAutomata Column Module
+
+# Third-Party Modules
+from numpy import ndarray, packbits
+
+# Local Modules
+from pyautomata.classes.canvas import Canvas
+from pyautomata.classes.general import Engine, Pattern, CENTRAL_LINE_MAP, resolve_engine
+from pyautomata.handlers import packed, rust
+from pyautomata.instrument import phase
+
+def center_column(rule: int, rows: int = 100, pattern: Pattern = Pattern.STANDARD,
+                  column: int = None, engine: Engine | str = None, seed: int = None,
+                  as_bytes: bool = False) -> ndarray | bytes:
+    """
+    Cells of one column of a canvas, `Canvas(rule, rows, pattern).result[:, column]`,
+    without generating the canvas.  Only the shrinking backward light cone
+    of the last cell is kept, packed 64 cells per word, so memory is O(rows)
+    while each cell still costs a row of its cone.
+
+    `column` defaults to the starting cell of the pattern, or the middle of
+    the row.  With `as_bytes` the cells are packed 8 to a byte, first cell in
+    the most significant bit.  The Python engine uses the NumPy kernel.
+    """
+    pattern = pattern if isinstance(pattern, Pattern) else Pattern.from_string(pattern)
+    canvas = Canvas(rule, rows, pattern, generate=False, seed=seed)
+
+    if column is None:
+        column = CENTRAL_LINE_MAP.get(pattern, lambda columns: columns // 2)(canvas.columns)
+    if not 0 <= column < canvas.columns:
+        raise ValueError(f'Column must be between 0 and {canvas.columns - 1}, got {column}')
+
+    first_row, _ = canvas.initial_row(pattern)
+    boost, central_line = canvas.boost_parameters(pattern)
+
+    with phase('column', canvas):
+        if resolve_engine(engine) is Engine.RUST:
+            cells = rust.generate_column(first_row, rows, column, canvas.flat_rule_set,
+                                         boost, central_line)
+        else:
+            cells = packed.generate_column(first_row, rows, column, canvas.rule_table,
+                                           boost, central_line)
+
+    return packbits(cells).tobytes() if as_bytes else cells
@@ -0,0 +1,77 @@
+# Project PyAutomata Ensemble Module
+
+# Python Modules
+from dataclasses import dataclass
+
+# Third-Party Modules
+from numpy import arange, errstate, nan, nanmean, nanstd, ndarray, where
+
+# Local Modules
+from pyautomata.classes.basecanvas import build_rule_set, random_rows
+from pyautomata.classes.general import Engine, resolve_engine, validate_rule
+from pyautomata.handlers import rust, vectorized
+from pyautomata.stats import StatsContainer, calculate_continued_stats
+
+@dataclass
+class EnsembleResult:
+    rule: int
+    rows: int
+    seed: int
+    initial_rows: ndarray
+    sums: ndarray
+    canvases: ndarray = None
+
+    @property
+    def size(self) -> int:
+        return len(self.initial_rows)
+
+    @property
+    def marginal_sum_increase(self) -> ndarray:
+        """
+        `size x rows` marginal increases, NaN where a row sum is 0
+        """
+        with errstate(divide='ignore', invalid='ignore'):
+            increase = arange(self.rows) / self.sums
+        return where(self.sums == 0, nan, increase)
+
+    @property
+    def mean_increase(self) -> ndarray:
+        return nanmean(self.marginal_sum_increase, axis=1)
+
+    @property
+    def standard_deviation(self) -> ndarray:
+        return nanstd(self.marginal_sum_increase, axis=1)
+
+    def stats(self, member: int) -> StatsContainer:
+        """
+        Stats of a single member of the ensemble
+        """
+        return calculate_continued_stats(self.sums[member])
+
+
+def ensemble(rule: int, rows: int = 100, size: int = 1000, seed: int = None,
+             columns: int = None, engine: Engine | str = None,
+             sums_only: bool = False) -> EnsembleResult:
+    """
+    Generate `size` canvases from random initial rows, drawn in one call from
+    `seed`, and advance the whole batch in one engine call.  The canvases are
+    returned as a `size x rows x columns` array unless `sums_only` is set, in
+    which case only the current rows are held.  `columns` defaults to the
+    width of a RANDOM canvas.  The Python engine uses the NumPy kernel.
+    """
+    validate_rule(rule)
+
+    columns = rows * 2 if columns is None else columns
+    engine = resolve_engine(engine)
+    _, rule_table, flat_rule_set = build_rule_set(rule)
+
+    initial_rows = random_rows(size, columns, seed)
+
+    if engine is Engine.RUST:
+        canvases, sums = rust.generate_ensemble(initial_rows, rows, flat_rule_set,
+                                                sums_only=sums_only)
+    else:
+        canvases, sums = vectorized.generate_ensemble(initial_rows, rows, rule_table,
+                                                      sums_only=sums_only)
+
+    return EnsembleResult(rule, rows, seed, initial_rows, sums, canvases)
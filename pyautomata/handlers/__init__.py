@@ -1,8 +1,18 @@
 from pyautomata.handlers.rust import (
-    RUST_AVAILABLE, generate_canvas, compute_stats
+    generate_canvas, compute_stats, get_library, rust_available
 )
 
-# PENDING ADDITION: Needs refactor to prevent circular imports
-# from pyautomata.handlers.benchmark import (
-#     CalculationData, benchmark_calculation, get_comparison_benchmarks
-# )
\ No newline at end of file
+# Benchmarking imports the canvas classes, which import this package
+BENCHMARK_EXPORTS = (
+    'BenchmarkReport', 'CalculationData', 'benchmark_calculation', 'compare_benchmarks',
+    'get_comparison_benchmarks', 'run_benchmarks'
+)
+
+def __getattr__(name: str):
+    # Resolved on access so that importing the package does not load Rust
+    if name == 'RUST_AVAILABLE':
+        return rust_available()
+    if name in BENCHMARK_EXPORTS:
+        from pyautomata.handlers import benchmark
+        return getattr(benchmark, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
\ No newline at end of file
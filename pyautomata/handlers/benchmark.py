@@ -1,18 +1,38 @@
 # Project PyAutomata Benchmarking Module
 
 # Python Modules
-from dataclasses import dataclass
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from enum import Enum
-from time import perf_counter, sleep
+from io import BytesIO
+import json
+import os
+import platform
+import subprocess
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import Callable
+
+# Third-Party Modules
+import numpy
 
 # Local Modules
-from pyautomata.classes.canvas import Canvas
-from pyautomata.handlers.rust import RUST_AVAILABLE
+from pyautomata.classes.general import Engine, Pattern, CENTRAL_LINE_MAP
+from pyautomata.handlers.rust import compute_stats, generate_canvas, rust_available
+from pyautomata.version import VERSION
+
+# Stages measured by `run_benchmarks`, each timed separately from its setup
+STAGES = ('generate', 'stats', 'recognize', 'render', 'ffi', 'column', 'import')
+
+# Stages that do not depend on the engine are measured once per case
+ENGINE_FREE_STAGES = ('render',)
+
+# Stages that depend on none of the parameters are measured once per suite
+PARAMETER_FREE_STAGES = ('import',)
 
-class Engine(Enum):
-    PYTHON = 'Python'
-    RUST = 'Rust'
+# Slowdowns below this many seconds are treated as timer noise
+NOISE_FLOOR = 1e-3
 
 @dataclass
 class CalculationData:
@@ -26,24 +46,18 @@ def benchmark_calculation(engine: Engine, start: int = 100, stop: int = 1000,
     """
     Generate data on the time it takes to generate canvases
     """
-    engine_map = {
-        Engine.RUST: False,
-        Engine.PYTHON: True,
-    }
+    from pyautomata.classes.canvas import Canvas
 
-    if engine is Engine.RUST and not RUST_AVAILABLE:
+    if engine is Engine.RUST and not rust_available():
         raise RuntimeError('Rust cannot be calculated if the libraries did not load correctly')
 
     calculation_dict: dict[int, float] = {}
 
     for i in range(start, stop+step, step):
-        print(f'Working on: {i} in {engine.value} --------', end='\r')
         start_time = perf_counter()
-        Canvas(rule, i, force_python=engine_map.get(engine))
+        Canvas(rule, i, engine=engine)
         calculation_dict[i] = perf_counter() - start_time
 
-    print(f'Completed {engine.value} generation -------------', end='\r')
-
     return CalculationData(engine, rule, calculation_dict, datetime.now())
         
 def get_comparison_benchmarks(start: int = 100, stop: int = 1000,
@@ -52,6 +66,391 @@ def get_comparison_benchmarks(start: int = 100, stop: int = 1000,
     Simple function to get results for both Rust and Python
     """
     generate = lambda local_engine: benchmark_calculation(local_engine, start, stop, step, rule)
-    result = (generate(Engine.RUST), generate(Engine.PYTHON))
-    print('Completed generation benchmarks for both Rust and Python.')
-    return result
\ No newline at end of file
+    return generate(Engine.RUST), generate(Engine.PYTHON)
+
+def benchmark_ffi(sizes: tuple[int] = (1, 10, 100, 1000, 5000), repeats: int = 50,
+                  rule: int = 30) -> tuple[CalculationData, CalculationData]:
+    """
+    Micro-benchmark of the mean seconds per Rust FFI call for generation and
+    stats.  The smallest sizes approximate the fixed marshalling overhead.
+    """
+    from pyautomata.classes.canvas import Canvas
+
+    if not rust_available():
+        raise RuntimeError('Rust cannot be calculated if the libraries did not load correctly')
+
+    generation_dict: dict[int, float] = {}
+    stats_dict: dict[int, float] = {}
+
+    for rows in sizes:
+        canvas = Canvas(rule, rows, generate=False)
+        first_row, _ = canvas.initial_row(canvas.pattern)
+        boost, central_line = canvas.boost_parameters(canvas.pattern)
+
+        start_time = perf_counter()
+        for _ in range(repeats):
+            _, sums = generate_canvas(first_row, rows, canvas.columns, canvas.flat_rule_set,
+                                      boost, central_line)
+        generation_dict[rows] = (perf_counter() - start_time) / repeats
+
+        start_time = perf_counter()
+        for _ in range(repeats):
+            compute_stats(sums)
+        stats_dict[rows] = (perf_counter() - start_time) / repeats
+
+    created = datetime.now()
+    return (CalculationData(Engine.RUST, rule, generation_dict, created),
+            CalculationData(Engine.RUST, rule, stats_dict, created))
+
+def benchmark_threads(rows: int = 5000, threads: tuple[int] = (1, 2, 4, 8, None),
+                      engine: Engine = Engine.RUST, rule: int = 30,
+                      repeats: int = 3) -> CalculationData:
+    """
+    Scaling benchmark of tiled generation, keyed by thread count with `None`
+    standing for every core.  Reports the best of `repeats` runs.
+    """
+    from pyautomata.classes.canvas import Canvas
+
+    if engine is Engine.RUST and not rust_available():
+        raise RuntimeError('Rust cannot be calculated if the libraries did not load correctly')
+
+    calculation_dict: dict[int, float] = {}
+
+    for thread_count in threads:
+        thread_count = os.cpu_count() if thread_count is None else thread_count
+        timings = []
+        for _ in range(repeats):
+            start_time = perf_counter()
+            Canvas(rule, rows, engine=engine, threads=thread_count)
+            timings.append(perf_counter() - start_time)
+        calculation_dict[thread_count] = min(timings)
+
+    return CalculationData(engine, rule, calculation_dict, datetime.now())
+
+def benchmark_import(module: str = 'pyautomata', repeats: int = 5) -> float:
+    """
+    Seconds a fresh interpreter spends on `import module`, less the bare
+    interpreter startup.  Reports the best of `repeats` runs.
+    """
+    def best_run(code: str) -> float:
+        timings = []
+        for _ in range(repeats):
+            start_time = perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True)
+            timings.append(perf_counter() - start_time)
+        return min(timings)
+
+    return max(best_run(f'import {module}') - best_run('pass'), 0.0)
+
+
+# Benchmark suite
+
+def benchmark_environment() -> dict:
+    """
+    Versions and machine details recorded alongside the results
+    """
+    return {'pyautomata': VERSION, 'python': platform.python_version(),
+            'numpy': numpy.__version__, 'platform': platform.platform(),
+            'cpus': os.cpu_count(), 'rust': rust_available()}
+
+@dataclass
+class BenchmarkCase:
+    stage: str
+    engine: Engine | None
+    pattern: Pattern
+    rule: int
+    rows: int
+
+    @property
+    def key(self) -> str:
+        """
+        Identity of the case when comparing against a baseline
+        """
+        engine = 'any' if self.engine is None else self.engine.name.lower()
+        return f'{self.stage}/{engine}/{self.pattern.name.lower()}/{self.rule}/{self.rows}'
+
+
+@dataclass
+class BenchmarkResult:
+    case: BenchmarkCase
+    seconds: float
+    peak_bytes: int
+    repeats: int
+
+    def to_dict(self) -> dict:
+        case = asdict(self.case)
+        case['engine'] = None if self.case.engine is None else self.case.engine.name.lower()
+        case['pattern'] = self.case.pattern.name.lower()
+        return {'key': self.case.key, **case, 'seconds': self.seconds,
+                'peak_bytes': self.peak_bytes, 'repeats': self.repeats}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BenchmarkResult':
+        engine = None if data['engine'] is None else Engine.from_string(data['engine'])
+        case = BenchmarkCase(data['stage'], engine, Pattern.from_string(data['pattern']),
+                             data['rule'], data['rows'])
+        return cls(case, data['seconds'], data['peak_bytes'], data['repeats'])
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+@dataclass
+class BenchmarkReport:
+    results: list[BenchmarkResult]
+    created: datetime = field(default_factory=datetime.now)
+    environment: dict = field(default_factory=benchmark_environment)
+
+    def to_dict(self) -> dict:
+        return {'created': self.created.isoformat(), 'environment': self.environment,
+                'results': [result.to_dict() for result in self.results]}
+
+    def save(self, filename: str) -> None:
+        """
+        Write the report as JSON
+        """
+        with open(filename, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def load(cls, filename: str) -> 'BenchmarkReport':
+        with open(filename) as file:
+            data = json.load(file)
+        return cls([BenchmarkResult.from_dict(result) for result in data['results']],
+                   datetime.fromisoformat(data['created']), data['environment'])
+
+
+def prepare_generate(case: BenchmarkCase) -> Callable:
+    from pyautomata.classes.canvas import Canvas
+    return lambda: Canvas(case.rule, case.rows, case.pattern, engine=case.engine)
+
+def prepare_stats(case: BenchmarkCase) -> Callable:
+    """
+    Stats as each engine produces them: one Rust pass over the sums, the
+    vectorized NumPy pass, or the row by row accumulation of the pure Python
+    engine
+    """
+    from pyautomata.classes.canvas import Canvas
+    from pyautomata.stats import (
+        RunningStats, StatsContainer, marginal_increases, python_calculate_stats
+    )
+
+    canvas = Canvas(case.rule, case.rows, case.pattern, engine=case.engine)
+    if case.engine is Engine.RUST:
+        return lambda: compute_stats(canvas.sums)
+    if case.engine is Engine.NUMPY:
+        return lambda: python_calculate_stats(canvas)
+
+    sums = canvas.sums.tolist()
+    def accumulate() -> StatsContainer:
+        running = RunningStats()
+        for row, row_sum in enumerate(sums):
+            running.update(row, row_sum)
+        return StatsContainer.from_running(running, marginal_increases(canvas.sums))
+    return accumulate
+
+def prepare_recognize(case: BenchmarkCase) -> Callable:
+    from pyautomata.classes.canvas import Canvas
+    from pyautomata.classes.recognizer import Recognizer
+
+    canvas = Canvas(case.rule, case.rows, case.pattern)
+    return lambda: Recognizer(case.rule, canvas.result, case.pattern, engine=case.engine)
+
+def prepare_render(case: BenchmarkCase) -> Callable:
+    from pyautomata.classes.canvas import Canvas
+
+    canvas = Canvas(case.rule, case.rows, case.pattern)
+    def render():
+        canvas.save_png(BytesIO())
+        canvas.pyramid()
+    return render
+
+def prepare_ffi(case: BenchmarkCase) -> Callable:
+    """
+    The bare Rust call with its inputs prepared, so that comparing against
+    the generate stage isolates the Python side of a canvas
+    """
+    from pyautomata.classes.canvas import Canvas
+
+    canvas = Canvas(case.rule, case.rows, case.pattern, generate=False)
+    first_row, _ = canvas.initial_row(case.pattern)
+    boost, central_line = canvas.boost_parameters(case.pattern)
+    return lambda: generate_canvas(first_row, case.rows, canvas.columns, canvas.flat_rule_set,
+                                   boost, central_line)
+
+def prepare_column(case: BenchmarkCase) -> Callable:
+    from pyautomata.column import center_column
+    return lambda: center_column(case.rule, case.rows, case.pattern, engine=case.engine)
+
+def prepare_import(case: BenchmarkCase) -> Callable:
+    """
+    `import pyautomata` in a fresh interpreter, startup included, so that
+    heavy dependencies creeping onto the import path show up as a regression
+    """
+    return lambda: subprocess.run([sys.executable, '-c', 'import pyautomata'], check=True)
+
+STAGE_PREPARERS: dict[str, Callable[[BenchmarkCase], Callable]] = {
+    'generate': prepare_generate,
+    'stats': prepare_stats,
+    'recognize': prepare_recognize,
+    'render': prepare_render,
+    'ffi': prepare_ffi,
+    'column': prepare_column,
+    'import': prepare_import,
+}
+
+def measure(function: Callable, repeats: int = 3) -> tuple[float, int]:
+    """
+    Best wall time of `repeats` calls, then the peak bytes allocated by one
+    further call under `tracemalloc`, which is kept out of the timings
+    """
+    timings = []
+    for _ in range(repeats):
+        start_time = perf_counter()
+        function()
+        timings.append(perf_counter() - start_time)
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return min(timings), peak - baseline
+
+def benchmark_cases(stages: tuple[str] = STAGES, engines: tuple[Engine] = None,
+                    patterns: tuple[Pattern] = (Pattern.STANDARD,),
+                    sizes: tuple[int] = (100, 1000), rules: tuple[int] = (30, 90)) -> list[BenchmarkCase]:
+    """
+    Every combination of the parameters, skipping Rust when it is not
+    available and the engines a stage does not use
+    """
+    if engines is None:
+        engines = tuple(Engine)
+    engines = tuple(engine for engine in engines if engine is not Engine.RUST or rust_available())
+
+    cases = []
+    for stage in stages:
+        if stage not in STAGE_PREPARERS:
+            raise ValueError(f'No benchmark stage named: {stage}')
+        if stage in PARAMETER_FREE_STAGES:
+            cases.append(BenchmarkCase(stage, None, Pattern.STANDARD, 0, 0))
+            continue
+        if stage in ENGINE_FREE_STAGES:
+            stage_engines = (None,)
+        elif stage == 'ffi':
+            stage_engines = (Engine.RUST,) if Engine.RUST in engines else ()
+        else:
+            stage_engines = engines
+
+        for engine in stage_engines:
+            for pattern in patterns:
+                for rows in sizes:
+                    for rule in rules:
+                        cases.append(BenchmarkCase(stage, engine, pattern, rule, rows))
+    return cases
+
+def run_benchmarks(cases: list[BenchmarkCase] = None, repeats: int = 3,
+                   progress: Callable[[BenchmarkResult], None] = None) -> BenchmarkReport:
+    """
+    Measure each case, `benchmark_cases()` by default.  `progress` is called
+    with every result as it completes.
+    """
+    cases = benchmark_cases() if cases is None else cases
+
+    results = []
+    for case in cases:
+        function = STAGE_PREPARERS[case.stage](case)
+        result = BenchmarkResult(case, *measure(function, repeats), repeats)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    return BenchmarkReport(results)
+
+def compare_benchmarks(report: BenchmarkReport, baseline: BenchmarkReport,
+                       threshold: float = 0.1, noise_floor: float = NOISE_FLOOR) -> list[Regression]:
+    """
+    Cases slower or using more peak memory than the baseline by more than
+    `threshold` as a fraction.  Time differences under `noise_floor` seconds
+    are ignored, as are cases missing from either report.
+    """
+    baseline_results = {result.case.key: result for result in baseline.results}
+
+    regressions = []
+    for result in report.results:
+        previous = baseline_results.get(result.case.key)
+        if previous is None:
+            continue
+
+        if (result.seconds > previous.seconds * (1 + threshold)
+                and result.seconds - previous.seconds > noise_floor):
+            regressions.append(Regression(result.case.key, 'seconds', previous.seconds,
+                                          result.seconds))
+        if result.peak_bytes > previous.peak_bytes * (1 + threshold):
+            regressions.append(Regression(result.case.key, 'peak_bytes', previous.peak_bytes,
+                                          result.peak_bytes))
+
+    return regressions
+
+def format_result(result: BenchmarkResult) -> str:
+    return f'{result.case.key:<48} {result.seconds * 1000:>12.3f} ms {result.peak_bytes:>14,} B'
+
+def main(arguments: list[str] = None) -> int:
+    """
+    Command line entry point, returning 1 when a regression is found
+    """
+    parser = ArgumentParser(prog='python -m pyautomata.handlers.benchmark',
+                            description='Benchmark PyAutomata stages across engines')
+    parser.add_argument('--stages', nargs='+', default=list(STAGES), choices=STAGES)
+    parser.add_argument('--engines', nargs='+', type=Engine.from_string,
+                        default=list(Engine), metavar='ENGINE')
+    parser.add_argument('--patterns', nargs='+', type=lambda value: Pattern.from_string(value.lower()),
+                        default=[Pattern.STANDARD], metavar='PATTERN')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100, 1000])
+    parser.add_argument('--rules', nargs='+', type=int, default=[30, 90])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='compare against the JSON results in this file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='fractional slowdown or memory growth counted as a regression')
+    parser.add_argument('--quiet', action='store_true')
+    options = parser.parse_args(arguments)
+
+    cases = benchmark_cases(tuple(options.stages), tuple(options.engines),
+                            tuple(options.patterns), tuple(options.sizes), tuple(options.rules))
+    progress = None if options.quiet else lambda result: print(format_result(result), flush=True)
+    report = run_benchmarks(cases, options.repeats, progress)
+
+    if options.output:
+        report.save(options.output)
+
+    if not options.baseline:
+        return 0
+
+    regressions = compare_benchmarks(report, BenchmarkReport.load(options.baseline),
+                                     options.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression.key} {regression.metric}: '
+              f'{regression.baseline:g} -> {regression.current:g} ({regression.ratio:.2f}x)')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
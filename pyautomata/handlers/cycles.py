@@ -0,0 +1,177 @@
+# Project PyAutomata Cycle Detection Module
+
+# Python Modules
+from dataclasses import dataclass
+from hashlib import blake2b
+
+# Third-Party Modules
+from numpy import arange, asarray, ndarray, packbits, where, zeros_like
+
+# Rows hashed before detection gives up, bounding the memory of the hashes
+CYCLE_HISTORY_ROWS = 1 << 16
+
+@dataclass
+class Cycle:
+    """
+    Row `transient + period` repeats row `transient` moved `shift` columns
+    to the right, and so on for every later row
+    """
+    transient: int
+    period: int
+    shift: int = 0
+
+
+def first_full_row(columns: int, boost: bool = False, central_line: int = 0) -> int:
+    """
+    Index of the first row from which every later row is computed over the
+    full width, so that the evolution no longer depends on the row index
+    """
+    if not boost:
+        return 0
+    return max(central_line - 2, columns - central_line - 2, 0)
+
+def shift_rows(rows: ndarray, shift: int) -> ndarray:
+    """
+    Rows moved `shift` columns to the right, filling with dead cells
+    """
+    shifted = zeros_like(rows)
+    columns = rows.shape[-1]
+    if abs(shift) >= columns:
+        return shifted
+    if shift >= 0:
+        shifted[..., shift:] = rows[..., :columns-shift]
+    else:
+        shifted[..., :shift] = rows[..., -shift:]
+    return shifted
+
+def fill_rows(canvas: ndarray, cycle: Cycle, start: int, stop: int) -> None:
+    """
+    Fill rows `[start, stop)` of the canvas by repeating the cycle, copying
+    ever larger blocks of whole periods
+    """
+    while start < stop:
+        periods = (start - cycle.transient) // cycle.period
+        length = periods * cycle.period
+        count = min(length, stop - start)
+        source = canvas[start-length:start-length+count]
+        if cycle.shift:
+            source = shift_rows(source, periods * cycle.shift)
+        canvas[start:start+count] = source
+        start += count
+
+def fill_sums(sums: ndarray, cycle: Cycle, start: int, stop: int, base: int = 0) -> ndarray:
+    """
+    Sums of rows `[start, stop)` repeated from the cycle, `sums` holding the
+    rows from absolute index `base`
+    """
+    indices = cycle.transient + (arange(start, stop) - cycle.transient) % cycle.period
+    return sums[indices - base]
+
+
+class CycleDetector:
+    """
+    Hashes the rows of a canvas as they are generated and reports the first
+    row that repeats an earlier one.
+
+    With `shifts`, rows are also matched after trimming their dead edges, so
+    patterns that repeat while moving are found.  A moving cycle only holds
+    while it stays a cell away from the edges, as cells past the edge are
+    dead rather than evolved, and only for rules keeping dead
+    neighbourhoods dead.
+    """
+    def __init__(self, columns: int, shifts: bool = False, first_row: int = 0,
+                 history: int = CYCLE_HISTORY_ROWS) -> None:
+        self.columns = columns
+        self.shifts = shifts
+        self.first_row = first_row
+        self.history = history
+
+        self.exact: dict[tuple[bytes, int], int] = {}
+        self.shifted: dict[bytes, int] = {}
+
+        # First and last live column of each hashed row, from `first_row`
+        self.starts: list[int] = []
+        self.lasts: list[int] = []
+
+    @property
+    def exhausted(self) -> bool:
+        return len(self.starts) >= self.history
+
+    def observe(self, rows: ndarray, offset: int) -> Cycle | None:
+        """
+        Hash the block of consecutive rows starting at absolute row `offset`,
+        returning the cycle entered by the first repeating row
+        """
+        skip = max(self.first_row - offset, 0)
+        rows = asarray(rows[skip:])
+        offset += skip
+        if not len(rows) or self.exhausted:
+            return None
+
+        live = rows.any(axis=1)
+        starts = where(live, rows.argmax(axis=1), self.columns)
+        lasts = where(live, self.columns - 1 - rows[:, ::-1].argmax(axis=1), -1)
+
+        for i in range(len(rows)):
+            if self.exhausted:
+                return None
+
+            index, start, last = offset + i, int(starts[i]), int(lasts[i])
+            # Trimmed rows end in a live cell, so their packed bytes are unambiguous
+            digest = blake2b(packbits(rows[i, start:last+1]).tobytes(), digest_size=16).digest()
+
+            cycle = self.match(index, digest, start, last)
+            self.starts.append(start)
+            self.lasts.append(last)
+            if cycle is not None:
+                return cycle
+
+            self.exact[digest, start] = index
+            if self.shifts:
+                self.shifted[digest] = index
+
+        return None
+
+    def match(self, index: int, digest: bytes, start: int, last: int) -> Cycle | None:
+        """
+        Cycle ending at row `index` when it repeats an earlier row, exactly or
+        moved with every row in between clear of the edges
+        """
+        previous = self.exact.get((digest, start))
+        if previous is not None:
+            return Cycle(previous, index - previous)
+
+        previous = self.shifted.get(digest)
+        if previous is None:
+            return None
+
+        first = previous - self.first_row
+        if min(self.starts[first:] + [start]) < 1 or max(self.lasts[first:] + [last]) > self.columns - 2:
+            return None
+        return Cycle(previous, index - previous, start - self.starts[first])
+
+    def prediction_stop(self, cycle: Cycle) -> int | None:
+        """
+        Exclusive stop of the rows the cycle predicts, None when it holds
+        indefinitely.  A moving cycle holds up to the first row that reaches
+        an edge.
+        """
+        if not cycle.shift:
+            return None
+
+        stop = None
+        for i in range(cycle.period):
+            start = self.starts[cycle.transient + i - self.first_row]
+            last = self.lasts[cycle.transient + i - self.first_row]
+            if last < 0:
+                continue
+
+            if cycle.shift > 0:
+                periods = (self.columns - 2 - last) // cycle.shift + 1
+            else:
+                periods = (start - 1) // -cycle.shift + 1
+
+            row_stop = cycle.transient + i + periods * cycle.period + 1
+            stop = row_stop if stop is None else min(stop, row_stop)
+
+        return stop
@@ -0,0 +1,160 @@
+# Project PyAutomata Light Cone Storage Module
+
+# Python Modules
+from numbers import Integral
+from typing import TYPE_CHECKING
+
+# Third-Party Modules
+from numpy import array, concatenate, count_nonzero, cumsum, ndarray, zeros, int64, uint8, uint32
+
+# Local Modules
+from pyautomata.handlers.vectorized import row_bounds
+if TYPE_CHECKING:
+    from pyautomata.stats import RunningStats
+
+
+def cone_spans(rows: int, columns: int, central_line: int) -> tuple[ndarray, ndarray]:
+    """
+    Column spans `[start, stop)` of each row that can hold live cells when
+    the canvas starts from the single cell at `central_line`
+    """
+    bounds = [(central_line, central_line + 1)]
+    bounds += [row_bounds(row, columns, True, central_line) for row in range(rows-1)]
+    spans = array(bounds, int64).reshape(-1, 2)
+    return spans[:, 0].copy(), spans[:, 1].copy()
+
+def span_offsets(starts: ndarray, stops: ndarray) -> ndarray:
+    """
+    Offset of each row's span in the flat cell array, with the total cell
+    count as the last entry
+    """
+    return concatenate([zeros((1,), int64), cumsum(stops - starts)])
+
+
+class LightConeArray:
+    """
+    Storage for canvases started from a single cell, holding only the light
+    cone span of each row back to back in a flat array.  Indexing and
+    `numpy.asarray` produce dense `rows x columns` views of the requested
+    region on demand.
+    """
+    def __init__(self, cells: ndarray, starts: ndarray, stops: ndarray, columns: int,
+                 central_line: int) -> None:
+        self.cells = cells
+        self.starts = starts
+        self.stops = stops
+        self.offsets = span_offsets(starts, stops)
+        self.columns = columns
+        self.central_line = central_line
+
+    def __repr__(self) -> str:
+        return f'LightConeArray: {self.shape[0]} x {self.shape[1]}, {len(self.cells)} cells stored'
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __array__(self, dtype=None, copy=None) -> ndarray:
+        dense = self.dense()
+        return dense if dtype is None else dense.astype(dtype)
+
+    def __getitem__(self, key) -> ndarray:
+        row_key, column_key = key if isinstance(key, tuple) else (key, slice(None))
+
+        if isinstance(row_key, Integral):
+            return self[slice(row_key, row_key+1 or None), column_key][0]
+
+        if isinstance(column_key, Integral):
+            return self[row_key, slice(column_key, column_key+1 or None)][:, 0]
+
+        first, last, row_step = row_key.indices(len(self))
+        start, stop, column_step = column_key.indices(self.columns)
+        if row_step < 1 or column_step < 1:
+            raise IndexError('Light cone arrays only support forward slices')
+
+        return self.dense(first, last, start, max(start, stop))[::row_step, ::column_step]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self), self.columns
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def dtype(self) -> type:
+        return self.cells.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.cells.nbytes
+
+    def row_span(self, row: int) -> tuple[int, ndarray]:
+        """
+        Start column and stored cells of a row
+        """
+        return int(self.starts[row]), self.cells[self.offsets[row]:self.offsets[row+1]]
+
+    def dense(self, first: int = 0, last: int = None, start: int = 0,
+              stop: int = None) -> ndarray:
+        """
+        Dense copy of the rows `[first, last)` and columns `[start, stop)`
+        """
+        last = len(self) if last is None else last
+        stop = self.columns if stop is None else stop
+        dense = zeros((max(last - first, 0), max(stop - start, 0)), self.cells.dtype)
+
+        for row in range(first, last):
+            low, high = max(self.starts[row], start), min(self.stops[row], stop)
+            if high > low:
+                offset = self.offsets[row] - self.starts[row]
+                dense[row - first, low - start:high - start] = self.cells[offset + low:offset + high]
+
+        return dense
+
+
+def generate_canvas(initial_row: ndarray, rows: int, columns: int, rule_table: ndarray,
+                    central_line: int = 0, cells: ndarray = None,
+                    stats: 'RunningStats' = None) -> tuple[LightConeArray, ndarray]:
+    """
+    NumPy API to generate a light cone canvas, only computing and storing the
+    span of each row inside the cone.  `cells` is an optional zeroed buffer
+    sized for the spans of `cone_spans`.  The generated rows are added to
+    `stats` in place.
+    """
+    starts, stops = cone_spans(rows, columns, central_line)
+    offsets = span_offsets(starts, stops)
+
+    if cells is None:
+        cells = zeros((offsets[-1],), uint8)
+    sums = zeros((rows,), uint32)
+
+    cells[0] = initial_row[central_line]
+    sums[0] = count_nonzero(initial_row)
+    advance_cone(cells, starts, stops, offsets, columns, rule_table, 0, sums)
+
+    if stats is not None:
+        stats.update_sums(sums[1:], 1)
+
+    return LightConeArray(cells, starts, stops, columns, central_line), sums
+
+def advance_cone(cells: ndarray, starts: ndarray, stops: ndarray, offsets: ndarray, columns: int,
+                 rule_table: ndarray, first: int, sums: ndarray) -> None:
+    """
+    Generate the spans of the rows after `first` from the span of row
+    `first` already in `cells`, writing their sums into `sums`
+    """
+    # Each span contains the previous one, so no stale cells are left behind
+    padded_row = zeros((columns+2,), uint8)
+
+    for row in range(first, len(starts)-1):
+        start, stop = starts[row+1], stops[row+1]
+        padded_row[starts[row]+1:stops[row]+1] = cells[offsets[row]:offsets[row+1]]
+
+        index = padded_row[start:stop] << 2
+        index |= padded_row[start+1:stop+1] << 1
+        index |= padded_row[start+2:stop+2]
+
+        values = rule_table[index]
+        cells[offsets[row+1]:offsets[row+2]] = values
+        sums[row+1] = count_nonzero(values)
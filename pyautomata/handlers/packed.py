@@ -0,0 +1,155 @@
+# Project PyAutomata Bit-Packed Generation Module
+
+# Python Modules
+from typing import TYPE_CHECKING
+
+# Third-Party Modules
+from numpy import (
+    ndarray, bitwise_count, packbits, unpackbits,
+    zeros, zeros_like, uint8, uint32, uint64,
+)
+
+# Local Modules
+from pyautomata.handlers.vectorized import row_bounds
+if TYPE_CHECKING:
+    from pyautomata.stats import RunningStats
+
+WORD_BITS = 64
+FULL_WORD = uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def word_count(columns: int) -> int:
+    """
+    Number of uint64 words needed to hold `columns` cells
+    """
+    return (columns + WORD_BITS - 1) // WORD_BITS
+
+def pack_rows(rows: ndarray) -> ndarray:
+    """
+    Pack a 1-D row or 2-D array of 0/1 cells into little-endian uint64 words,
+    cell `i` of a row being bit `i % 64` of word `i // 64`
+    """
+    columns = rows.shape[-1]
+    padded = zeros(rows.shape[:-1] + (word_count(columns) * WORD_BITS,), uint8)
+    padded[..., :columns] = rows
+    return packbits(padded, axis=-1, bitorder='little').view('<u8').astype(uint64)
+
+def unpack_rows(words: ndarray, columns: int) -> ndarray:
+    """
+    Unpack uint64 words back into a uint8 array of 0/1 cells
+    """
+    as_bytes = words.astype('<u8').view(uint8)
+    return unpackbits(as_bytes, axis=-1, count=columns, bitorder='little')
+
+def rule_minterms(rule_table: ndarray) -> tuple[bool, list[tuple[int, int, int]]]:
+    """
+    Derive the word-wide boolean form of a rule from its 8-entry table.
+    Returns whether the output is inverted and the neighbourhoods to OR
+    together; the smaller of the on-set and off-set is used.
+    """
+    on_set = [(i >> 2 & 1, i >> 1 & 1, i & 1) for i in range(8) if rule_table[i]]
+    off_set = [(i >> 2 & 1, i >> 1 & 1, i & 1) for i in range(8) if not rule_table[i]]
+
+    if len(on_set) <= len(off_set):
+        return False, on_set
+    return True, off_set
+
+def step_row(words: ndarray, output: ndarray, minterms: tuple[bool, list], start: int,
+             stop: int) -> int:
+    """
+    Advance the packed span `[start, stop)` by one generation, writing into
+    `output` and returning the popcount of the new span
+    """
+    if stop <= start:
+        return 0
+
+    first, last = start // WORD_BITS, (stop - 1) // WORD_BITS + 1
+    center = words[first:last]
+
+    # Neighbours are the row shifted by one cell, carrying bits across words
+    left = center << 1
+    left[1:] |= center[:-1] >> 63
+    if first > 0:
+        left[0] |= words[first-1] >> 63
+
+    right = center >> 1
+    right[:-1] |= center[1:] << 63
+    if last < len(words):
+        right[-1] |= words[last] << 63
+
+    inverted, terms = minterms
+    result = zeros_like(center)
+    for l, c, r in terms:
+        result |= (left if l else ~left) & (center if c else ~center) & (right if r else ~right)
+    if inverted:
+        result = ~result
+
+    # Mask the bits outside of the computed span
+    result[0] &= FULL_WORD << uint64(start % WORD_BITS)
+    tail = stop - (last - 1) * WORD_BITS
+    if tail < WORD_BITS:
+        result[-1] &= (uint64(1) << uint64(tail)) - uint64(1)
+
+    output[first:last] = result
+
+    return int(bitwise_count(result).sum())
+
+def generate_canvas(initial_row: ndarray, rows: int, columns: int, rule_table: ndarray,
+                    boost: bool = False, central_line: int = 0,
+                    row_offset: int = 0, canvas: ndarray = None,
+                    stats: 'RunningStats' = None) -> tuple[ndarray, ndarray]:
+    """
+    Bit-packed API to generate the canvas as a `rows x words` uint64 array,
+    optionally into a zeroed `canvas` buffer, adding the generated rows to
+    `stats` in place
+    """
+    if canvas is None:
+        canvas = zeros((rows, word_count(columns)), uint64)
+    sums = zeros((rows,), uint32)
+
+    canvas[0] = pack_rows(initial_row)
+    sums[0] = bitwise_count(canvas[0]).sum()
+
+    minterms = rule_minterms(rule_table)
+
+    for row in range(rows-1):
+        start, stop = row_bounds(row + row_offset, columns, boost, central_line)
+        sums[row+1] = step_row(canvas[row], canvas[row+1], minterms, start, stop)
+
+    if stats is not None:
+        stats.update_sums(sums[1:], row_offset + 1)
+
+    return canvas, sums
+
+def generate_column(initial_row: ndarray, rows: int, column: int, rule_table: ndarray,
+                    boost: bool = False, central_line: int = 0) -> ndarray:
+    """
+    Bit-packed API to generate the cells of one column.  Only the backward
+    light cone of the last cell is advanced: it narrows by a cell either side
+    per row, so the cells cut off at its edges never reach the column and
+    memory stays O(rows).
+    """
+    columns = len(initial_row)
+    cells = zeros((rows,), uint8)
+    if not rows:
+        return cells
+
+    low, high = max(column - rows + 1, 0), min(column + rows, columns)
+    current = pack_rows(initial_row[low:high])
+    following = zeros_like(current)
+    column_word, column_bit = divmod(column - low, WORD_BITS)
+    cells[0] = initial_row[column]
+
+    minterms = rule_minterms(rule_table)
+
+    for row in range(rows-1):
+        # Cells of row `row + 1` that still reach the last cell of the column
+        reach = rows - 2 - row
+        start, stop = row_bounds(row, columns, boost, central_line)
+        step_row(current, following, minterms, max(start, column - reach) - low,
+                 min(stop, column + reach + 1) - low)
+
+        current, following = following, current
+        cells[row+1] = current[column_word] >> uint64(column_bit) & uint64(1)
+
+    return cells
@@ -0,0 +1,94 @@
+# Project PyAutomata PNG Encoding Module
+
+# Python Modules
+from struct import pack
+from typing import BinaryIO
+from zlib import compressobj, crc32
+
+# Third-Party Modules
+from numpy import arange, concatenate, ndarray, packbits, uint8, zeros
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Grayscale colour type of the IHDR chunk
+GRAYSCALE = 0
+
+# Bytes of compressed image data per IDAT chunk
+IDAT_BYTES = 1 << 20
+
+# Bit order reversal of every byte, turning little-endian packed words into
+# the most significant pixel first order of 1-bit PNG rows
+REVERSED_BITS = packbits(((arange(256, dtype=uint8)[:, None] >> arange(8)) & 1).astype(uint8),
+                         axis=1)[:, 0]
+
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    """
+    Length prefixed, CRC suffixed PNG chunk
+    """
+    return pack('>I', len(data)) + tag + data + pack('>I', crc32(tag + data))
+
+def ones_to_black(cells: ndarray) -> ndarray:
+    """
+    1-bit PNG rows of 0/1 cells, live cells drawn black on white
+    """
+    return packbits(cells == 0, axis=-1)
+
+def words_to_black(words: ndarray, columns: int) -> ndarray:
+    """
+    1-bit PNG rows straight from bit-packed little-endian uint64 words
+    """
+    as_bytes = words.astype('<u8').view(uint8).reshape(len(words), -1)
+    return ~REVERSED_BITS[as_bytes[:, :(columns + 7) // 8]]
+
+
+class PngWriter:
+    """
+    Streaming grayscale PNG encoder.  Rows are filtered, compressed and
+    flushed in IDAT chunks as they are written, so an image never has to be
+    held in memory whole.  Rows are 1 bit per pixel, already packed with
+    `ones_to_black` or `words_to_black`, or 8 bits per pixel.
+    """
+    def __init__(self, file: BinaryIO, width: int, height: int, bit_depth: int = 1,
+                 level: int = 6) -> None:
+        if bit_depth not in (1, 8):
+            raise ValueError(f'Bit depth must be 1 or 8, got {bit_depth}')
+
+        self.file = file
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+        self.rows_written = 0
+
+        self.compressor = compressobj(level)
+        self.pending = b''
+
+        header = pack('>IIBBBBB', width, height, bit_depth, GRAYSCALE, 0, 0, 0)
+        file.write(PNG_SIGNATURE + png_chunk(b'IHDR', header))
+
+    def write_rows(self, rows: ndarray) -> None:
+        """
+        Append a block of encoded rows
+        """
+        rows = rows.astype(uint8, copy=False)
+        filtered = concatenate([zeros((len(rows), 1), uint8), rows], axis=1)
+        self.rows_written += len(rows)
+
+        self.pending += self.compressor.compress(filtered.tobytes())
+        self.flush_chunks(IDAT_BYTES)
+
+    def flush_chunks(self, minimum: int) -> None:
+        while self.pending and len(self.pending) >= minimum:
+            self.file.write(png_chunk(b'IDAT', self.pending[:IDAT_BYTES]))
+            self.pending = self.pending[IDAT_BYTES:]
+
+    def close(self) -> None:
+        """
+        Finish the compressed stream and write the trailing chunks
+        """
+        if self.rows_written != self.height:
+            raise ValueError(f'PNG expected {self.height} rows, {self.rows_written} were written')
+
+        self.pending += self.compressor.flush()
+        self.flush_chunks(1)
+        self.file.write(png_chunk(b'IEND', b''))
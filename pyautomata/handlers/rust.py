@@ -2,209 +2,391 @@
 
 # Python Modules
 from ctypes import (
-    POINTER, sizeof, cast, string_at, CDLL, Structure, c_char,
-    c_bool, c_size_t, c_uint8, c_uint32, c_float
+    POINTER, CDLL, Structure, pointer,
+    c_bool, c_size_t, c_int32, c_uint8, c_uint32, c_uint64, c_double
 )
-from json import loads
+from functools import cache
 import os
 from os import path
+from typing import TYPE_CHECKING
+from warnings import warn
 
 # Third-Party Modules
-from numpy import ctypeslib, ndarray, copyto, zeros, uint8, uint32, float32
+from numpy import array, ascontiguousarray, cumsum, full, ndarray, zeros, int32, uint8, uint32, uint64, uintp, float64
 
+# Local Modules
+from pyautomata.instrument import phase
 
-# Path construction
 
-# Check for Nix package environment variable first
-library_path = os.environ.get('PYAUTOMATA_RUST_LIB')
+# Library loading, deferred until an engine first needs it
 
-# Docker path
-if not library_path or not path.exists(library_path):
+def find_library() -> str:
+    """
+    Path of the compiled Rust library, checking the Nix package environment
+    variable, then the Docker and local install paths
+    """
     rust_path = '/rust/target/release/libpyautomata_rust.so'
-    library_path = f'/app/pyautomata{rust_path}'
 
-# Locally install path
-if not library_path or not path.exists(library_path):
-    current_path = path.dirname(path.abspath(__file__))
-    files_path = path.abspath(path.join(current_path, '..'))
-    library_path = f'{files_path}{rust_path}'
+    library_path = os.environ.get('PYAUTOMATA_RUST_LIB')
+
+    if not library_path or not path.exists(library_path):
+        library_path = f'/app/pyautomata{rust_path}'
+
+    if not library_path or not path.exists(library_path):
+        current_path = path.dirname(path.abspath(__file__))
+        files_path = path.abspath(path.join(current_path, '..'))
+        library_path = f'{files_path}{rust_path}'
 
-try:
-    lib = CDLL(library_path)
-    RUST_AVAILABLE = True
-except (OSError, ImportError) as e:
+    return library_path
+
+@cache
+def get_library() -> CDLL | None:
     """
-    Failure to import will create a dummy instance to accept modification and
-    not error, however, the global constant will be referenced by anything that
-    uses Rust FFI APIs and will default to Python logic if not available
+    Load the Rust library and declare its signatures on first use.  Returns
+    None, warning once, when the library cannot be loaded so that callers
+    fall back on the Python and NumPy engines.
     """
-    print(e)
-    RUST_AVAILABLE = False
-    from unittest.mock import Mock
-    from warnings import warn
-    warn('PyAutomata: Rust binary not found, falling back on Python logic')
-    lib = Mock()
+    try:
+        library = CDLL(find_library())
+    except OSError:
+        warn('PyAutomata: Rust binary not found, falling back on Python logic')
+        return None
 
+    declare_signatures(library)
+    return library
+
+def rust_available() -> bool:
+    """
+    Whether the Rust library loads, loading it on the first call
+    """
+    return get_library() is not None
+
+def require_library() -> CDLL:
+    """
+    The loaded Rust library for the FFI wrappers
+    """
+    library = get_library()
+    if library is None:
+        raise RuntimeError('Rust cannot be calculated if the libraries did not load correctly')
+    return library
+
+def __getattr__(name: str):
+    # `RUST_AVAILABLE` and `lib` are resolved on access to keep the import free
+    # of the library load
+    if name == 'RUST_AVAILABLE':
+        return rust_available()
+    if name == 'lib':
+        return get_library()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if TYPE_CHECKING:
+    from pyautomata.stats import RunningStats
 
-class CanvasPointers(Structure):
-    _fields_ = [
-        ('canvas_pointer', POINTER(c_uint8)),
-        ('sums_pointer', POINTER(c_uint32))
-    ]
 
 class StatsStructure(Structure):
     _fields_ = [
-        ('standard_deviation', c_float),
-        ('mean_increase', c_float),
-        ('marginal_sum_increase_ptr', POINTER(c_float)),
+        ('standard_deviation', c_double),
+        ('mean_increase', c_double),
         ('sum_rate_length', c_size_t)
     ]
 
-class RecognitionOutput(Structure):
+class RunningStatsStructure(Structure):
     _fields_ = [
-        ('pattern_rules_pointer', POINTER(c_char)),
-        ('pattern_segments_pointer', POINTER(c_char)),
-        ('segment_count', c_size_t),
-        ('pattern_rules_length', c_size_t),
-        ('pattern_segments_legnth', c_size_t)
+        ('count', c_uint64),
+        ('mean', c_double),
+        ('m2', c_double)
     ]
 
-# Generate Canvas
-lib.generate_canvas.argtypes = [
-    POINTER(c_uint8),  # initial_row
-    c_size_t,          # rows
-    c_size_t,          # columns
-    POINTER(c_uint8),  # rules
-    c_size_t,          # rules_length
-    c_bool,            # boost
-    c_size_t,          # central_line
-    c_bool             # whole
-]
+# Upper bound of rows advanced per tile between thread synchronizations
+PARALLEL_BAND_ROWS = 64
 
-lib.generate_canvas.restype = CanvasPointers
+def default_band_rows(columns: int, threads: int) -> int:
+    """
+    Band height for tiled generation, kept well below the tile width so the
+    halo recomputed either side of each tile stays a small overhead
+    """
+    return max(1, min(PARALLEL_BAND_ROWS, columns // (threads * 4)))
 
-# Calculate Stats
-lib.calculate_stats.argtypes = [
-    POINTER(c_uint32), # canvas_sums
-    c_size_t           # sums_length 
-]
+# Longest pattern whose parent windows pack into the i32 transport table
+MAX_PACKED_PATTERN_LENGTH = 20
 
-lib.calculate_stats.restype = StatsStructure
+def declare_signatures(lib: CDLL) -> None:
+    """
+    Declare the argument and return types of the exported functions
+    """
+    # Generate Canvas
+    lib.generate_canvas.argtypes = [
+        POINTER(c_uint8),  # initial_row
+        c_size_t,          # rows
+        c_size_t,          # columns
+        POINTER(c_uint8),  # rules
+        c_size_t,          # rules_length
+        c_bool,            # boost
+        c_size_t,          # central_line
+        c_size_t,          # row_offset
+        POINTER(c_uint8),  # canvas_out
+        POINTER(c_uint32), # sums_out
+        POINTER(RunningStatsStructure) # stats_out, null to skip the running stats
+    ]
 
-# Recognize Canvas
-lib.recognize_canvas.argtypes = [
-    POINTER(c_uint8),  # canvas_pointer
-    c_size_t,          # rows
-    c_size_t,          # columns
-    c_size_t,          # pattern_length
-]
+    lib.generate_canvas.restype = None
 
-lib.recognize_canvas.restype = RecognitionOutput
+    # Generate Canvas with trapezoidal tiles across threads
+    lib.generate_canvas_parallel.argtypes = lib.generate_canvas.argtypes + [
+        c_size_t,          # threads
+        c_size_t           # band_rows
+    ]
 
-# Free Memory
-lib.free_memory.argtypes = [
-    POINTER(c_uint8),  # pointer
-    c_size_t           # size
-]
+    lib.generate_canvas_parallel.restype = None
+
+    # Generate a batch of canvases
+    lib.generate_ensemble.argtypes = [
+        POINTER(c_uint8),  # initial_rows
+        c_size_t,          # batch
+        c_size_t,          # rows
+        c_size_t,          # columns
+        POINTER(c_uint8),  # rules
+        c_size_t,          # rules_length
+        POINTER(c_uint8),  # canvas_out, null for sums only
+        POINTER(c_uint32)  # sums_out
+    ]
 
-# Free String
-lib.free_string.argtypes = [
-    POINTER(c_char)    # pointer
-]
+    lib.generate_ensemble.restype = None
+
+    # Generate a single column
+    lib.generate_column.argtypes = [
+        POINTER(c_uint8),  # initial_row
+        c_size_t,          # rows
+        c_size_t,          # columns
+        c_size_t,          # column
+        POINTER(c_uint8),  # rules
+        c_size_t,          # rules_length
+        c_bool,            # boost
+        c_size_t,          # central_line
+        POINTER(c_uint8)   # column_out
+    ]
 
-def free_memory(pointer, dtype, num_elements):
-    """
-    Free memory allocated in Rust for arrays of different types.
-    """
-    size_in_bytes = sizeof(dtype) * num_elements
-    pointer_as_u8 = cast(pointer, POINTER(c_uint8))
-    lib.free_memory(pointer_as_u8, size_in_bytes)
+    lib.generate_column.restype = None
 
-def free_string(pointer):
-    """
-    Free memory allocated to Rust/C-strings
-    """
-    lib.free_string(pointer)
+    # Calculate Stats
+    lib.calculate_stats.argtypes = [
+        POINTER(c_uint32), # canvas_sums
+        c_size_t,          # sums_length
+        POINTER(c_double)  # marginal_sum_increase_out
+    ]
+
+    lib.calculate_stats.restype = StatsStructure
+
+    # Recognize Canvas
+    lib.recognize_canvas.argtypes = [
+        POINTER(c_uint8),  # canvas_pointer
+        c_size_t,          # rows
+        c_size_t,          # columns
+        c_size_t,          # pattern_length
+        c_bool,            # boost
+        c_size_t,          # central_line
+        c_size_t,          # row_offset
+        POINTER(c_uint64), # segment_counts_out
+        POINTER(c_int32)   # parent_segments_out
+    ]
+
+    lib.recognize_canvas.restype = c_size_t
+
+    # Recognize Canvas at several pattern lengths
+    lib.recognize_canvas_lengths.argtypes = [
+        POINTER(c_uint8),  # canvas_pointer
+        c_size_t,          # rows
+        c_size_t,          # columns
+        POINTER(c_size_t), # pattern_lengths
+        c_size_t,          # lengths_count
+        c_bool,            # boost
+        c_size_t,          # central_line
+        POINTER(c_uint64), # segment_counts_out
+        POINTER(c_int32),  # parent_segments_out
+        POINTER(c_size_t)  # segment_counts_total_out
+    ]
 
+    lib.recognize_canvas_lengths.restype = None
 
-def compute_stats(canvas_sums: ndarray) -> tuple[ndarray[float32], float, float]:
+def compute_stats(canvas_sums: ndarray) -> tuple[ndarray[float64], float, float]:
     """
-    Python API for Rust FFI to calculate stats
+    Python API for Rust FFI to calculate stats.
+    Rust writes the marginal increases straight into a NumPy-owned buffer.
     """
-    # Create outbound pointer
+    # Create outbound pointers
+    canvas_sums = ascontiguousarray(canvas_sums, uint32)
     canvas_sums_pointer = canvas_sums.ctypes.data_as(POINTER(c_uint32))
-    
+    marginal_sum_increase = zeros((len(canvas_sums),), dtype=float64)
+    marginal_sum_increase_pointer = marginal_sum_increase.ctypes.data_as(POINTER(c_double))
+
     # Perform the calculations
-    stats_results: StatsStructure = lib.calculate_stats(canvas_sums_pointer, len(canvas_sums))
-    
-    # Move data into Python-owned memory space
-    sum_shape = (stats_results.sum_rate_length,)
-    marginal_sum_increase = zeros(sum_shape, dtype=float32)
-    sum_rate_result = ctypeslib.as_array(stats_results.marginal_sum_increase_ptr, shape=sum_shape)
-    copyto(marginal_sum_increase, sum_rate_result)
-
-    # Free the memory allocated in Rust after translation
-    free_memory(stats_results.marginal_sum_increase_ptr, c_uint32, stats_results.sum_rate_length)
+    with phase('rust.ffi', nbytes=canvas_sums.nbytes + marginal_sum_increase.nbytes):
+        stats_results: StatsStructure = require_library().calculate_stats(canvas_sums_pointer, len(canvas_sums),
+                                                            marginal_sum_increase_pointer)
     
     standard_deviation = stats_results.standard_deviation
     mean_increase = stats_results.mean_increase
 
-    return marginal_sum_increase, mean_increase, standard_deviation
+    return marginal_sum_increase[:stats_results.sum_rate_length], mean_increase, standard_deviation
 
 def generate_canvas(initial_row: ndarray, rows: int, columns: int,
-                    rules: dict[tuple[int], int,], boost: bool = False,
-                    central_line: int = 0, whole: bool = True):
+                    rules: ndarray, boost: bool = False, central_line: int = 0,
+                    row_offset: int = 0, canvas: ndarray = None, threads: int = 1,
+                    band_rows: int = 0, stats: 'RunningStats' = None) -> tuple[ndarray, ndarray]:
     """
-    Python API for Rust FFI to generate the canvas
+    Python API for Rust FFI to generate the canvas.
+    Rust fills NumPy-owned buffers in place: `canvas` is an optional zeroed,
+    C-contiguous `rows x columns` buffer, such as a memmap, to write into.
+    `row_offset` is the absolute index of `initial_row` when continuing a canvas.
+    With more than one thread the rows are advanced in bands of `band_rows`
+    over column tiles, 0 choosing the band size from the tile width.
+    The generated rows, not `initial_row`, are added to `stats` in place.
     """
+    if canvas is None:
+        canvas = zeros((rows, columns), dtype=uint8)
+    elif canvas.shape != (rows, columns) or not canvas.flags.c_contiguous:
+        raise ValueError(f'Canvas buffer must be a C-contiguous {(rows, columns)} array')
+    sums = zeros((rows,), dtype=uint32)
+
     # Create outbound pointers
-    initial_row_pointer = initial_row.ctypes.data_as(POINTER(c_uint8))
-    rules_pointer = rules.ctypes.data_as(POINTER(c_uint8))
+    with phase('rust.marshal'):
+        initial_row = ascontiguousarray(initial_row, uint8)
+        initial_row_pointer = initial_row.ctypes.data_as(POINTER(c_uint8))
+        rules_pointer = rules.ctypes.data_as(POINTER(c_uint8))
+        canvas_pointer = canvas.ctypes.data_as(POINTER(c_uint8))
+        sums_pointer = sums.ctypes.data_as(POINTER(c_uint32))
+
+        running = None if stats is None else RunningStatsStructure(stats.count, stats.mean, stats.m2)
+        running_pointer = None if running is None else pointer(running)
+
+    # Perform the calculations in Rust directly into the buffers
+    arguments = (initial_row_pointer, rows, columns, rules_pointer, len(rules),
+                 boost, central_line, row_offset, canvas_pointer, sums_pointer, running_pointer)
+    lib = require_library()
+    with phase('rust.ffi', nbytes=initial_row.nbytes + rules.nbytes + canvas.nbytes + sums.nbytes):
+        if threads > 1:
+            lib.generate_canvas_parallel(*arguments, threads, band_rows or default_band_rows(columns, threads))
+        else:
+            lib.generate_canvas(*arguments)
+
+    if running is not None:
+        stats.count, stats.mean, stats.m2 = running.count, running.mean, running.m2
+
+    return canvas, sums
+
+def generate_ensemble(initial_rows: ndarray, rows: int, rules: ndarray, canvas: ndarray = None,
+                      sums_only: bool = False) -> tuple[ndarray, ndarray]:
+    """
+    Python API for Rust FFI to generate a batch of canvases, one per initial
+    row, in a single call.  Returns the `batch x rows x columns` canvases, or
+    None in `sums_only` mode, and the `batch x rows` sums.
+    """
+    initial_rows = ascontiguousarray(initial_rows, uint8)
+    batch, columns = initial_rows.shape
 
-    # Perform the calculations in Rust and get the pointer to the results
-    pointers: CanvasPointers = lib.generate_canvas(initial_row_pointer, rows, columns, rules_pointer, len(rules), boost, central_line, whole)
-    canvas_result = ctypeslib.as_array(pointers.canvas_pointer, shape=(rows, columns))
-    sums_result = ctypeslib.as_array(pointers.sums_pointer, shape = (rows,))
-    
-    # Move the data into Python-owned memory
-    canvas = zeros((rows, columns), dtype=uint8)
-    copyto(canvas, canvas_result)
-    sums_array = zeros((rows,), dtype=uint32)
-    copyto(sums_array, sums_result)
+    if canvas is None and not sums_only:
+        canvas = zeros((batch, rows, columns), dtype=uint8)
+    elif canvas is not None and (canvas.shape != (batch, rows, columns) or not canvas.flags.c_contiguous):
+        raise ValueError(f'Canvas buffer must be a C-contiguous {(batch, rows, columns)} array')
+    sums = zeros((batch, rows), dtype=uint32)
+
+    # A null canvas pointer asks Rust for the sums only
+    canvas_pointer = None if canvas is None else canvas.ctypes.data_as(POINTER(c_uint8))
+
+    nbytes = initial_rows.nbytes + rules.nbytes + sums.nbytes + (0 if canvas is None else canvas.nbytes)
+    with phase('rust.ffi', nbytes=nbytes):
+        require_library().generate_ensemble(initial_rows.ctypes.data_as(POINTER(c_uint8)), batch, rows, columns,
+                              rules.ctypes.data_as(POINTER(c_uint8)), len(rules), canvas_pointer,
+                              sums.ctypes.data_as(POINTER(c_uint32)))
 
-    # Free the memory allocated in Rust after translation
-    free_memory(pointers.canvas_pointer, c_uint8, rows * columns)
-    free_memory(pointers.sums_pointer, c_uint32, rows)
+    return canvas, sums
+
+def generate_column(initial_row: ndarray, rows: int, column: int, rules: ndarray,
+                    boost: bool = False, central_line: int = 0) -> ndarray:
+    """
+    Python API for Rust FFI to generate the cells of one column, advancing
+    only the packed backward light cone of its last cell
+    """
+    with phase('rust.marshal'):
+        initial_row = ascontiguousarray(initial_row, uint8)
+        cells = zeros((rows,), uint8)
 
-    return canvas, sums_array
+    with phase('rust.ffi', nbytes=initial_row.nbytes + rules.nbytes + cells.nbytes):
+        require_library().generate_column(initial_row.ctypes.data_as(POINTER(c_uint8)), rows,
+                                          len(initial_row), column,
+                                          rules.ctypes.data_as(POINTER(c_uint8)), len(rules),
+                                          boost, central_line, cells.ctypes.data_as(POINTER(c_uint8)))
+
+    return cells
 
 def recognize_canvas(shape: tuple[int, int], canvas_array: ndarray, pattern_length: int,
-                     boost: bool = False, central_line: int = 0) -> tuple[dict, dict, int]:
+                     boost: bool = False, central_line: int = 0, row_offset: int = 0,
+                     segment_counts: ndarray = None,
+                     parent_segments: ndarray = None) -> tuple[ndarray, ndarray, int]:
     """
-    Python API for Rust FFI for running recognition
+    Python API for Rust FFI for running recognition.
+    Returns the dense segment histogram indexed by packed window code, the
+    parent to segment code table (-1 where unseen) and the segment count.
+    Blocks of a canvas starting at absolute row `row_offset` are added to
+    the tables of the earlier blocks when they are passed in.
     """
+    if pattern_length > MAX_PACKED_PATTERN_LENGTH:
+        raise ValueError(f'Pattern length cannot exceed {MAX_PACKED_PATTERN_LENGTH} for packed recognition')
+
     # Prepare outbound information
-    canvas_pointer = canvas_array.ctypes.data_as(POINTER(c_uint8))
+    with phase('rust.marshal'):
+        canvas_array = ascontiguousarray(canvas_array, uint8)
+        canvas_pointer = canvas_array.ctypes.data_as(POINTER(c_uint8))
     rows, columns = shape
 
-    # Execute
-    results: RecognitionOutput = lib.recognize_canvas(canvas_pointer, rows, columns, pattern_length, boost, central_line)
-    rules_json = loads(string_at(results.pattern_rules_pointer).decode('utf-8'))
-    segments_json = loads(string_at(results.pattern_segments_pointer).decode('utf-8'))
+    if segment_counts is None:
+        segment_counts = zeros((1 << pattern_length,), uint64)
+    if parent_segments is None:
+        parent_segments = full((1 << (pattern_length + 2),), -1, int32)
+
+    # Execute directly into the Python-owned tables
+    nbytes = canvas_array.nbytes + segment_counts.nbytes + parent_segments.nbytes
+    with phase('rust.ffi', nbytes=nbytes):
+        segment_count = require_library().recognize_canvas(canvas_pointer, rows, columns, pattern_length, boost, central_line,
+                                             row_offset, segment_counts.ctypes.data_as(POINTER(c_uint64)),
+                                             parent_segments.ctypes.data_as(POINTER(c_int32)))
 
-    # Convert to Python dictionaries
-    rules_dict = {
-        tuple(loads(k)): tuple(loads(v))
-        for k, v in rules_json.items()
-    }
+    return segment_counts, parent_segments, segment_count
 
-    segments_dict = {
-        tuple(loads(k)): v
-        for k, v in segments_json.items()
-    }
+def recognize_canvas_lengths(shape: tuple[int, int], canvas_array: ndarray, pattern_lengths: list[int],
+                             boost: bool = False, central_line: int = 0) -> list[tuple[ndarray, ndarray, int]]:
+    """
+    Python API for Rust FFI for recognition at several pattern lengths in one
+    traversal.  Rust fills the histograms and parent tables of every length
+    laid end to end, which are returned as views in the form of
+    `recognize_canvas` for each length.
+    """
+    if max(pattern_lengths) > MAX_PACKED_PATTERN_LENGTH:
+        raise ValueError(f'Pattern length cannot exceed {MAX_PACKED_PATTERN_LENGTH} for packed recognition')
 
-    # Free memory
-    free_string(results.pattern_rules_pointer)
-    free_string(results.pattern_segments_pointer)
+    with phase('rust.marshal'):
+        canvas_array = ascontiguousarray(canvas_array, uint8)
+        lengths = array(pattern_lengths, uintp)
+    rows, columns = shape
 
-    return rules_dict, segments_dict, results.segment_count
+    segment_sizes = [1 << length for length in pattern_lengths]
+    parent_sizes = [1 << (length + 2) for length in pattern_lengths]
+    segment_counts = zeros((sum(segment_sizes),), uint64)
+    parent_segments = full((sum(parent_sizes),), -1, int32)
+    totals = zeros((len(pattern_lengths),), uintp)
+
+    nbytes = canvas_array.nbytes + segment_counts.nbytes + parent_segments.nbytes + totals.nbytes
+    with phase('rust.ffi', nbytes=nbytes):
+        require_library().recognize_canvas_lengths(canvas_array.ctypes.data_as(POINTER(c_uint8)), rows, columns,
+                                                   lengths.ctypes.data_as(POINTER(c_size_t)), len(lengths),
+                                                   boost, central_line,
+                                                   segment_counts.ctypes.data_as(POINTER(c_uint64)),
+                                                   parent_segments.ctypes.data_as(POINTER(c_int32)),
+                                                   totals.ctypes.data_as(POINTER(c_size_t)))
+
+    segment_starts = cumsum([0] + segment_sizes)
+    parent_starts = cumsum([0] + parent_sizes)
+    return [(segment_counts[segment_starts[i]:segment_starts[i+1]],
+             parent_segments[parent_starts[i]:parent_starts[i+1]], int(totals[i]))
+            for i in range(len(pattern_lengths))]
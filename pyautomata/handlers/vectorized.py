@@ -0,0 +1,347 @@
+# Project PyAutomata NumPy Vectorization Module
+
+# Python Modules
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+# Third-Party Modules
+from numpy import (
+    arange, array, bincount, concatenate, count_nonzero, full, ndarray, where, zeros,
+    int32, int64, uint8, uint32, uint64,
+)
+
+# Local Modules
+from pyautomata.handlers.rust import MAX_PACKED_PATTERN_LENGTH, default_band_rows
+if TYPE_CHECKING:
+    from pyautomata.stats import RunningStats
+
+# Cells of canvas converted to window codes at a time during recognition
+RECOGNITION_BLOCK_CELLS = 1 << 22
+
+
+def row_bounds(row: int, columns: int, boost: bool = False,
+               central_line: int = 0) -> tuple[int, int]:
+    """
+    Column span `[start, stop)` of row `row+1` that is computed from row `row`.
+    Boosting masks the whitespace outside of the light cone, matching Rust.
+    """
+    if not boost:
+        return 0, columns
+    return max(central_line - row - 2, 0), min(central_line + row + 2, columns)
+
+def window_bounds(row: int, columns: int, pattern_length: int, boost: bool = False,
+                  central_line: int = 0) -> tuple[int, int]:
+    """
+    Span `[start, stop)` of window starts recognized on `row`, leaving room for
+    the parent window one cell either side.  Boosting masks the whitespace
+    outside of the light cone, matching Rust.
+    """
+    default_stop = columns - pattern_length
+    if not boost:
+        return 1, default_stop
+    return max(central_line - row - 2, 1), min(central_line + row + 2, default_stop)
+
+def generate_row(padded_row: ndarray, output_row: ndarray, rule_table: ndarray,
+                 start: int, stop: int) -> int:
+    """
+    Generate the span `[start, stop)` of the next row in one vectorized step.
+    `padded_row` is the input row with a zero cell on each side, so that the
+    left, center and right neighbours are plain shifted slices.  Returns the
+    sum of the generated span.
+    """
+    index = padded_row[start:stop] << 2
+    index |= padded_row[start+1:stop+1] << 1
+    index |= padded_row[start+2:stop+2]
+
+    values = rule_table[index]
+    output_row[start:stop] = values
+
+    return count_nonzero(values)
+
+def generate_canvas(initial_row: ndarray, rows: int, columns: int, rule_table: ndarray,
+                    boost: bool = False, central_line: int = 0,
+                    row_offset: int = 0, canvas: ndarray = None,
+                    stats: 'RunningStats' = None) -> tuple[ndarray, ndarray]:
+    """
+    NumPy API to generate the canvas, mirroring the Rust FFI call.
+    `rule_table` is the 8-entry output lookup indexed by `left<<2 | center<<1 | right`.
+    `row_offset` is the absolute index of `initial_row` when continuing a canvas.
+    `canvas` is an optional zeroed `rows x columns` buffer, such as a memmap,
+    to write into instead of allocating.  The generated rows are added to
+    `stats` in place.
+    """
+    if canvas is None:
+        canvas = zeros((rows, columns), uint8)
+    sums = zeros((rows,), uint32)
+
+    canvas[0] = initial_row
+    sums[0] = count_nonzero(initial_row)
+
+    padded_row = zeros((columns+2,), uint8)
+
+    for row in range(rows-1):
+        start, stop = row_bounds(row + row_offset, columns, boost, central_line)
+        padded_row[1:-1] = canvas[row]
+        sums[row+1] = generate_row(padded_row, canvas[row+1], rule_table, start, stop)
+
+    if stats is not None:
+        stats.update_sums(sums[1:], row_offset + 1)
+
+    return canvas, sums
+
+def generate_ensemble(initial_rows: ndarray, rows: int, rule_table: ndarray, canvas: ndarray = None,
+                      sums_only: bool = False) -> tuple[ndarray, ndarray]:
+    """
+    NumPy API to generate a batch of canvases, one per initial row, advancing
+    every member of the batch with each vectorized step.  Mirrors the Rust FFI
+    call, only holding the current rows in `sums_only` mode.
+    """
+    batch, columns = initial_rows.shape
+    if canvas is None and not sums_only:
+        canvas = zeros((batch, rows, columns), uint8)
+    sums = zeros((batch, rows), uint32)
+
+    padded_rows = zeros((batch, columns+2), uint8)
+    padded_rows[:, 1:-1] = initial_rows
+    sums[:, 0] = count_nonzero(initial_rows, axis=1)
+    if canvas is not None:
+        canvas[:, 0] = initial_rows
+
+    for row in range(1, rows):
+        index = padded_rows[:, :-2] << 2
+        index |= padded_rows[:, 1:-1] << 1
+        index |= padded_rows[:, 2:]
+
+        values = rule_table[index]
+        padded_rows[:, 1:-1] = values
+        sums[:, row] = count_nonzero(values, axis=1)
+        if canvas is not None:
+            canvas[:, row] = values
+
+    return canvas, sums
+
+def advance_tile(canvas: ndarray, rule_table: ndarray, tile: tuple[int, int], band_start: int,
+                 band: int, boost: bool = False, central_line: int = 0,
+                 row_offset: int = 0) -> ndarray:
+    """
+    Advance the columns `[a, b)` of a canvas through a band of rows from a
+    local copy with a halo of `band` cells either side.  Errors from the cut
+    halo edges travel one cell per row, so the tile's own columns are exact
+    once the band is done.  Returns the tile's share of each row sum.
+    """
+    rows, columns = canvas.shape
+    a, b = tile
+    lo, hi = max(a - band, 0), min(b + band, columns)
+    partial_sums = zeros((band,), uint32)
+
+    padded_row = zeros((hi - lo + 2,), uint8)
+    padded_row[1:-1] = canvas[band_start, lo:hi]
+
+    for step in range(band):
+        row = band_start + step
+        start, stop = row_bounds(row + row_offset, columns, boost, central_line)
+
+        index = padded_row[:-2] << 2
+        index |= padded_row[1:-1] << 1
+        index |= padded_row[2:]
+        values = rule_table[index]
+        values[:max(start - lo, 0)] = 0
+        values[max(stop - lo, 0):] = 0
+
+        canvas[row+1, a:b] = values[a-lo:b-lo]
+        partial_sums[step] = count_nonzero(values[a-lo:b-lo])
+        padded_row[1:-1] = values
+
+    return partial_sums
+
+def generate_canvas_tiled(initial_row: ndarray, rows: int, columns: int, rule_table: ndarray,
+                          boost: bool = False, central_line: int = 0, row_offset: int = 0,
+                          canvas: ndarray = None, threads: int = 2, band_rows: int = 0,
+                          stats: 'RunningStats' = None) -> tuple[ndarray, ndarray]:
+    """
+    NumPy API to generate the canvas with trapezoidal tiles across threads,
+    synchronizing only between bands of `band_rows` rows.  The output is
+    identical to `generate_canvas`.
+    """
+    if canvas is None:
+        canvas = zeros((rows, columns), uint8)
+    sums = zeros((rows,), uint32)
+
+    canvas[0] = initial_row
+    sums[0] = count_nonzero(initial_row)
+
+    band_rows = band_rows or default_band_rows(columns, threads)
+    tile_width = -(-columns // threads)
+    tiles = [(a, min(a + tile_width, columns)) for a in range(0, columns, tile_width)]
+
+    with ThreadPoolExecutor(threads) as executor:
+        for band_start in range(0, rows-1, band_rows):
+            band = min(band_rows, rows - 1 - band_start)
+            partial_sums = executor.map(lambda tile: advance_tile(canvas, rule_table, tile, band_start, band,
+                                                                  boost, central_line, row_offset), tiles)
+            sums[band_start+1:band_start+band+1] = sum(partial_sums)
+
+    if stats is not None:
+        stats.update_sums(sums[1:], row_offset + 1)
+
+    return canvas, sums
+
+def window_codes(rows: ndarray, length: int) -> ndarray:
+    """
+    Packed integer code, most significant cell first, of every window of
+    `length` cells along the last axis
+    """
+    count = rows.shape[-1] - length + 1
+    codes = zeros(rows.shape[:-1] + (count,), int32)
+    for k in range(length):
+        codes <<= 1
+        codes |= rows[..., k:k+count]
+    return codes
+
+def recognize_canvas(canvas_array: ndarray, pattern_length: int, boost: bool = False,
+                     central_line: int = 0, row_offset: int = 0, segment_counts: ndarray = None,
+                     parent_segments: ndarray = None) -> tuple[ndarray, ndarray, int]:
+    """
+    NumPy API for recognition, mirroring the Rust FFI call.  Windows are built
+    in blocks of rows with strided slices, packed into integer codes and
+    counted with `bincount` into the dense segment histogram and parent table.
+    """
+    if pattern_length > MAX_PACKED_PATTERN_LENGTH:
+        raise ValueError(f'Pattern length cannot exceed {MAX_PACKED_PATTERN_LENGTH} for packed recognition')
+
+    rows, columns = canvas_array.shape
+    if segment_counts is None:
+        segment_counts = zeros((1 << pattern_length,), uint64)
+    if parent_segments is None:
+        parent_segments = full((1 << (pattern_length + 2),), -1, int32)
+    segment_count = 0
+
+    block_rows = max(1, RECOGNITION_BLOCK_CELLS // columns)
+
+    for first in range(1, rows, block_rows):
+        last = min(first + block_rows, rows)
+
+        bounds = array([window_bounds(i + row_offset, columns, pattern_length, boost, central_line)
+                        for i in range(first, last)])
+        low, high = bounds[:, 0].min(), bounds[:, 1].max()
+        if high <= low:
+            continue
+
+        # Window starts `[low, high)` and their parents one cell either side
+        block = canvas_array[first-1:last, low-1:high+pattern_length]
+        codes = window_codes(block, pattern_length)
+
+        # A parent code is the segment code one cell left, extended by two cells
+        parents = codes[:-1, :high-low] << 2
+        parents |= block[:-1, pattern_length:high-low+pattern_length] << 1
+        parents |= block[:-1, pattern_length+1:high-low+pattern_length+1]
+        segments = codes[1:, 1:high-low+1]
+
+        starts = arange(low, high)
+        mask = (starts >= bounds[:, :1]) & (starts < bounds[:, 1:])
+        segments, parents = segments[mask], parents[mask]
+
+        segment_counts += bincount(segments, minlength=len(segment_counts)).astype(uint64)
+        parent_segments[parents] = segments
+        segment_count += len(segments)
+
+    return segment_counts, parent_segments, segment_count
+
+def recognize_canvas_lengths(canvas_array: ndarray, pattern_lengths: list[int], boost: bool = False,
+                             central_line: int = 0) -> list[tuple[ndarray, ndarray, int]]:
+    """
+    NumPy API for recognition at several pattern lengths in one traversal,
+    mirroring the Rust FFI call.  Only the windows of the longest length are
+    counted, zero-padded past the last column, and the shorter lengths are
+    summed from their leading cells at the end, longest first.  Starts past
+    the stop of the longest length are recorded per length.  Parents keep
+    the segment of the last one seen in traversal order, as in
+    `recognize_canvas`.  Returns the results of `recognize_canvas` for each
+    length.
+    """
+    longest = max(pattern_lengths)
+    if longest > MAX_PACKED_PATTERN_LENGTH:
+        raise ValueError(f'Pattern length cannot exceed {MAX_PACKED_PATTERN_LENGTH} for packed recognition')
+
+    rows, columns = canvas_array.shape
+    width = longest + 2
+    longest_index = pattern_lengths.index(longest)
+
+    longest_counts = zeros((1 << longest,), uint64)
+    # Traversal order plus one of the last write of each parent above its
+    # segment, 0 where unseen, so that the latest write of a group of parents
+    # is their maximum
+    longest_parents = zeros((1 << width,), int64)
+
+    segment_counts = [zeros((1 << length,), uint64) for length in pattern_lengths]
+    segment_totals = [0] * len(pattern_lengths)
+    extra_parents: list[list[tuple[ndarray, ndarray, ndarray]]] = [[] for _ in pattern_lengths]
+
+    block_rows = max(1, RECOGNITION_BLOCK_CELLS // columns)
+
+    for first in range(1, rows, block_rows):
+        last = min(first + block_rows, rows)
+
+        # The window starts do not depend on the length and the shortest stops last
+        bounds = [array([window_bounds(i, columns, length, boost, central_line)
+                         for i in range(first, last)]) for length in pattern_lengths]
+        low = bounds[0][:, 0].min()
+        high = max(bound[:, 1].max() for bound in bounds)
+        if high <= low:
+            continue
+
+        # Window starts `[low, high)`, their parents one cell either side and
+        # room for the longest window past the last start
+        cells = canvas_array[first-1:last, low-1:high+width-1]
+        block = zeros((last - first + 1, high - low + width), uint8)
+        block[:, :cells.shape[1]] = cells
+        codes = window_codes(block, width)
+
+        segments = codes[1:, 1:high-low+1] >> 2
+        parents = codes[:-1, :high-low]
+        starts = arange(low, high)
+        stamps = arange(first, last, dtype=int64)[:, None] * columns + starts + 1
+
+        started = starts >= bounds[0][:, :1]
+        common_stops = bounds[longest_index][:, 1:]
+        common = started & (starts < common_stops)
+        longest_counts += bincount(segments[common], minlength=len(longest_counts)).astype(uint64)
+        longest_parents[parents[common]] = stamps[common] << longest | segments[common]
+        common_count = count_nonzero(common)
+
+        for index, length in enumerate(pattern_lengths):
+            extra = started & (starts >= common_stops) & (starts < bounds[index][:, 1:])
+            segment_totals[index] += common_count + count_nonzero(extra)
+            if not extra.any():
+                continue
+
+            shift = longest - length
+            extra_segments = segments[extra] >> shift
+            segment_counts[index] += bincount(extra_segments, minlength=1 << length).astype(uint64)
+            extra_parents[index].append((parents[extra] >> shift, extra_segments, stamps[extra]))
+
+    # Sum the longest windows into every length, longest first, halving the
+    # tables a cell at a time: parents sharing their leading cells are
+    # adjacent, so their latest write is the larger of each pair
+    level, level_counts, level_parents = longest, longest_counts, longest_parents
+    results = [None] * len(pattern_lengths)
+    for index in sorted(range(len(pattern_lengths)), key=lambda index: -pattern_lengths[index]):
+        length = pattern_lengths[index]
+        while level > length:
+            level_counts = level_counts.reshape(-1, 2).sum(axis=1, dtype=uint64)
+            level_parents = level_parents.reshape(-1, 2).max(axis=1)
+            level -= 1
+
+        latest = level_parents >> longest
+        parent_segments = where(latest > 0, (level_parents & ((1 << longest) - 1)) >> (longest - length),
+                                -1).astype(int32)
+
+        if extra_parents[index]:
+            parent_codes, extra_segments, extra_stamps = (concatenate(column) for column in
+                                                          zip(*extra_parents[index]))
+            later = extra_stamps > latest[parent_codes]
+            parent_segments[parent_codes[later]] = extra_segments[later]
+
+        results[index] = segment_counts[index] + level_counts, parent_segments, segment_totals[index]
+
+    return results
@@ -0,0 +1,314 @@
+# Project PyAutomata HashLife Module
+
+# Third-Party Modules
+from numpy import asarray, frombuffer, ndarray, packbits, uint8, unpackbits, zeros
+
+# Local Modules
+from pyautomata.classes.general import validate_rule
+
+# Level of the leaves, held as integers of 2**LEAF_LEVEL cells with the
+# leftmost cell in the least significant bit
+LEAF_LEVEL = 6
+LEAF_CELLS = 1 << LEAF_LEVEL
+LEAF_MASK = (1 << LEAF_CELLS) - 1
+
+# Nodes held before the table and the memoized steps are collected
+DEFAULT_MAX_NODES = 1 << 20
+
+class Node:
+    """
+    Hash-consed macro-cell of `2**level` cells made of two halves, which are
+    leaf integers at `LEAF_LEVEL + 1`.  `steps` memoizes the centre half
+    advanced `2**j` generations, keyed by `j`.
+    """
+    __slots__ = ('level', 'left', 'right', 'population', 'steps')
+
+    def __init__(self, level: int, left: 'Node | int', right: 'Node | int',
+                 population: int) -> None:
+        self.level = level
+        self.left = left
+        self.right = right
+        self.population = population
+        self.steps: dict[int, 'Node | int'] = {}
+
+
+def population(node: Node | int) -> int:
+    return node.bit_count() if isinstance(node, int) else node.population
+
+def node_cells(node: Node | int) -> int:
+    return LEAF_CELLS if isinstance(node, int) else 1 << node.level
+
+
+class HashLife:
+    """
+    Memoized macro-cell engine for deep evolutions from a finite pattern on
+    an infinite dead background, HashLife adapted to elementary rules.
+
+    Generations are advanced in jumps of `2**j` through a hash-consed node
+    table, so regular rules reuse the regions they have already advanced and
+    reach far generations in time logarithmic in the generation.  Chaotic
+    rules share little and degrade towards one node per region per jump.
+    The table is collected down to the nodes of the root, dropping the
+    memoized steps, whenever it grows past `max_nodes`, including part way
+    through a jump.  Nodes of the jump in progress are then no longer
+    shared, which costs time but not correctness.
+
+    Cells are addressed by their offset from the first of `cells`, which
+    defaults to the single live cell of a STANDARD canvas, so row `n` of
+    that canvas is `row(n)`.  Only rules that keep dead neighbourhoods dead
+    have a dead background to pad with.
+    """
+    def __init__(self, rule: int, cells: ndarray = None,
+                 max_nodes: int = DEFAULT_MAX_NODES) -> None:
+        validate_rule(rule)
+        if rule & 1:
+            raise ValueError(f'HashLife needs a rule that keeps dead neighbourhoods dead, got rule {rule}')
+
+        self.rule = rule
+        self.max_nodes = max_nodes
+        self.initial_cells = asarray([1] if cells is None else cells, uint8)
+
+        # Neighbourhoods, as `left<<2 | center<<1 | right`, that give a live cell
+        self.live_patterns = [pattern for pattern in range(8) if rule >> pattern & 1]
+
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f'HashLife: Rule {self.rule} - Generation {self.generation}'
+
+    @property
+    def node_count(self) -> int:
+        return len(self.table)
+
+    @property
+    def population(self) -> int:
+        return population(self.root)
+
+    def reset(self) -> None:
+        """
+        Return to generation 0 with an empty node table
+        """
+        self.table: dict[tuple, Node] = {}
+        self.empty_nodes: list[Node | int] = [0]
+        # Table size triggering the next collection, raised when the root
+        # alone holds more than `max_nodes` so collections do not repeat
+        self.collect_at = self.max_nodes
+        self.generation = 0
+        self.root = self.build(self.initial_cells)
+        # Offset of the first cell of the root
+        self.origin = 0
+
+    # Node table
+
+    def join(self, left: Node | int, right: Node | int) -> Node:
+        """
+        Interned node of the two halves
+        """
+        node = self.table.get((left, right))
+        if node is None:
+            level = LEAF_LEVEL + 1 if isinstance(left, int) else left.level + 1
+            node = Node(level, left, right, population(left) + population(right))
+            self.table[left, right] = node
+            if len(self.table) > self.collect_at:
+                self.collect()
+        return node
+
+    def empty(self, level: int) -> Node | int:
+        """
+        Dead node of `2**level` cells
+        """
+        while len(self.empty_nodes) <= level - LEAF_LEVEL:
+            below = self.empty_nodes[-1]
+            self.empty_nodes.append(self.join(below, below))
+        return self.empty_nodes[level - LEAF_LEVEL]
+
+    def build(self, cells: ndarray) -> Node:
+        """
+        Root node holding the cells from its first cell on
+        """
+        leaf_count = max(2, -(-len(cells) // LEAF_CELLS))
+        padded = zeros((leaf_count * LEAF_CELLS,), uint8)
+        padded[:len(cells)] = cells
+
+        packed = packbits(padded, bitorder='little').tobytes()
+        width = LEAF_CELLS // 8
+        nodes = [int.from_bytes(packed[i:i+width], 'little') for i in range(0, len(packed), width)]
+
+        while len(nodes) > 1:
+            if len(nodes) % 2:
+                level = LEAF_LEVEL if isinstance(nodes[0], int) else nodes[0].level
+                nodes.append(self.empty(level))
+            nodes = [self.join(nodes[i], nodes[i+1]) for i in range(0, len(nodes), 2)]
+
+        return nodes[0]
+
+    def collect(self) -> None:
+        """
+        Drop the memoized steps and every node no longer reachable from the
+        root, bounding the memory of the table
+        """
+        self.table = {}
+        self.empty_nodes = [0]
+
+        stack, seen = [self.root], set()
+        while stack:
+            node = stack.pop()
+            if isinstance(node, int) or id(node) in seen:
+                continue
+            seen.add(id(node))
+            node.steps = {}
+            self.table[node.left, node.right] = node
+            stack.extend((node.left, node.right))
+
+        self.collect_at = max(self.max_nodes, 2 * len(self.table))
+
+    # Evolution
+
+    def advance_bits(self, bits: int, width: int, generations: int) -> int:
+        """
+        Advance `width` cells packed into an integer with dead cells past
+        either end.  Only the cells further than `generations` from the ends
+        match the infinite line.
+        """
+        mask = (1 << width) - 1
+        for _ in range(generations):
+            left, right = (bits << 1) & mask, bits >> 1
+            cells = ((~left & mask, left), (~bits & mask, bits), (~right & mask, right))
+            bits = 0
+            for pattern in self.live_patterns:
+                bits |= cells[0][pattern >> 2] & cells[1][pattern >> 1 & 1] & cells[2][pattern & 1]
+        return bits
+
+    def centre(self, node: Node) -> Node | int:
+        """
+        Centre half of a node, without advancing it
+        """
+        if isinstance(node.left, int):
+            half = LEAF_CELLS // 2
+            return (node.left >> half) | ((node.right << half) & LEAF_MASK)
+        return self.join(node.left.right, node.right.left)
+
+    def step(self, node: Node, j: int) -> Node | int:
+        """
+        Centre half of a node advanced `2**j` generations, `j` being at most
+        `node.level - 2`.  The outer quarters bound the light cone of the
+        centre, so the result is exact.
+        """
+        result = node.steps.get(j)
+        if result is not None:
+            return result
+
+        if isinstance(node.left, int):
+            bits = self.advance_bits(node.left | node.right << LEAF_CELLS, 2 * LEAF_CELLS, 1 << j)
+            result = (bits >> LEAF_CELLS // 2) & LEAF_MASK
+        else:
+            # Three overlapping halves, advanced half way when jumping the
+            # full `2**(level-2)` and only cropped otherwise
+            parts = (node.left, self.join(node.left.right, node.right.left), node.right)
+            if j == node.level - 2:
+                first, second = [self.step(part, j - 1) for part in parts], j - 1
+            else:
+                first, second = [self.centre(part) for part in parts], j
+            result = self.join(self.step(self.join(first[0], first[1]), second),
+                               self.step(self.join(first[1], first[2]), second))
+
+        node.steps[j] = result
+        return result
+
+    def pad(self) -> None:
+        """
+        Double the root with dead cells, keeping it centred
+        """
+        level = self.root.level
+        empty = self.empty(level - 1)
+        self.root = self.join(self.join(empty, self.root.left), self.join(self.root.right, empty))
+        self.origin -= 1 << (level - 1)
+
+    def centred(self) -> bool:
+        """
+        Whether the live cells of the root lie in its centre half
+        """
+        left, right = self.root.left, self.root.right
+        if isinstance(left, int):
+            half = LEAF_CELLS // 2
+            return not (left & ((1 << half) - 1)) and not (right >> half)
+        return not population(left.left) and not population(right.right)
+
+    def jump(self, j: int) -> None:
+        """
+        Advance `2**j` generations in one step of the root
+        """
+        # Centred with room for the jump, then doubled so that the live
+        # cells cannot grow past the centre half the step returns
+        while self.root.level < j + 2 or not self.centred():
+            self.pad()
+        self.pad()
+
+        self.origin += 1 << (self.root.level - 2)
+        self.root = self.step(self.root, j)
+        self.generation += 1 << j
+
+        # Crop the dead margins back off
+        while self.root.level > LEAF_LEVEL + 2 and self.centred():
+            self.origin += 1 << (self.root.level - 2)
+            self.root = self.centre(self.root)
+
+    def advance(self, generations: int) -> None:
+        """
+        Advance by `generations`, one jump per set bit
+        """
+        if generations < 0:
+            raise ValueError(f'Generations to advance by cannot be negative, got {generations}')
+        while generations:
+            j = generations.bit_length() - 1
+            self.jump(j)
+            generations -= 1 << j
+
+    def goto(self, generation: int) -> None:
+        """
+        Move to `generation`, starting over when it was already passed
+        """
+        if generation < self.generation:
+            self.reset()
+        self.advance(generation - self.generation)
+
+    # Queries
+
+    def row_sum(self, generation: int) -> int:
+        """
+        Live cells of a generation
+        """
+        self.goto(generation)
+        return self.population
+
+    def cells(self, generation: int, start: int, stop: int) -> ndarray:
+        """
+        Cells `[start, stop)` of a generation, reading only the nodes that
+        overlap them
+        """
+        self.goto(generation)
+        cells = zeros((max(stop - start, 0),), uint8)
+        self.read(self.root, self.origin, start, stop, cells)
+        return cells
+
+    def row(self, generation: int) -> ndarray:
+        """
+        The light cone of the first cell at a generation, which is the row of
+        a STANDARD canvas from a single cell
+        """
+        return self.cells(generation, -generation, generation + 1)
+
+    def read(self, node: Node | int, origin: int, start: int, stop: int, cells: ndarray) -> None:
+        size = node_cells(node)
+        if not population(node) or origin >= stop or origin + size <= start:
+            return
+
+        if isinstance(node, int):
+            leaf = unpackbits(frombuffer(node.to_bytes(LEAF_CELLS // 8, 'little'), uint8),
+                              bitorder='little')
+            low, high = max(start, origin), min(stop, origin + size)
+            cells[low-start:high-start] = leaf[low-origin:high-origin]
+            return
+
+        self.read(node.left, origin, start, stop, cells)
+        self.read(node.right, origin + size // 2, start, stop, cells)
@@ -0,0 +1,151 @@
+# Project PyAutomata Instrumentation Module
+
+# Python Modules
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+import tracemalloc
+from typing import Callable, Iterator
+
+@dataclass
+class PhaseRecord:
+    name: str
+    seconds: float
+    nbytes: int = 0
+    allocated_bytes: int = None
+
+
+@dataclass
+class PhaseSummary:
+    name: str
+    calls: int
+    seconds: float
+    nbytes: int
+    allocated_bytes: int = None
+
+
+class Instrumentation:
+    """
+    Opt-in recorder of the hot path phases.  Phases run while it is entered
+    as a context manager are appended to `records`, passed to `callback` and
+    added to the `timings` of the canvas or recognizer they ran for.
+
+    `nbytes` is the size of the buffers handed across the Rust FFI.  With
+    `track_allocations` each phase also records the net bytes it left
+    allocated, as traced by `tracemalloc`, which slows the phases down.  The
+    blocks left allocated are counted once for the whole session, into
+    `allocations`, as counting them takes a snapshot of every live block.
+    Nested phases are recorded separately, so their times overlap.
+    """
+    def __init__(self, callback: Callable[[PhaseRecord], None] = None,
+                 track_allocations: bool = False) -> None:
+        self.callback = callback
+        self.track_allocations = track_allocations
+        self.records: list[PhaseRecord] = []
+        self.started_tracing = False
+        self.allocations: int = None
+        self.start_blocks = 0
+
+    def __enter__(self) -> 'Instrumentation':
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracing = True
+            self.start_blocks = traced_blocks()
+        ACTIVE.append(self)
+        return self
+
+    def __exit__(self, *_) -> None:
+        ACTIVE.remove(self)
+        if self.track_allocations:
+            self.allocations = traced_blocks() - self.start_blocks
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def record(self, record: PhaseRecord) -> None:
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def summary(self) -> dict[str, PhaseSummary]:
+        return summarize(self.records)
+
+
+class NoPhase:
+    """
+    Slotted no-op context manager, cheaper to enter than `nullcontext`
+    """
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_) -> None:
+        return None
+
+
+# Entered instrumentation and the objects whose phases are running
+ACTIVE: list[Instrumentation] = []
+OWNERS: list[object] = []
+
+# Shared no-op returned by `phase` while nothing is recording
+DISABLED = NoPhase()
+
+def phase(name: str, owner: object = None, nbytes: int = 0):
+    """
+    Context manager timing a phase when instrumentation is entered, and a
+    shared no-op otherwise.  Phases without an `owner` are credited to the
+    innermost owned phase they run in.
+    """
+    if not ACTIVE:
+        return DISABLED
+    return measure_phase(name, owner, nbytes)
+
+def traced_blocks() -> int:
+    """
+    Blocks currently traced by `tracemalloc`, which walks every one of them
+    """
+    return len(tracemalloc.take_snapshot().traces)
+
+@contextmanager
+def measure_phase(name: str, owner: object, nbytes: int) -> Iterator[None]:
+    instruments = list(ACTIVE)
+    tracking = tracemalloc.is_tracing() and any(
+        instrument.track_allocations for instrument in instruments)
+    owner = owner if owner is not None else (OWNERS[-1] if OWNERS else None)
+
+    OWNERS.append(owner)
+    if tracking:
+        start_bytes, _ = tracemalloc.get_traced_memory()
+    start_time = perf_counter()
+    try:
+        yield
+    finally:
+        seconds = perf_counter() - start_time
+        OWNERS.pop()
+
+        record = PhaseRecord(name, seconds, nbytes)
+        if tracking:
+            end_bytes, _ = tracemalloc.get_traced_memory()
+            record.allocated_bytes = end_bytes - start_bytes
+
+        for instrument in instruments:
+            instrument.record(record)
+        timings = getattr(owner, 'timings', None)
+        if timings is not None:
+            timings.append(record)
+
+def summarize(records: list[PhaseRecord]) -> dict[str, PhaseSummary]:
+    """
+    Totals of the records per phase name, in order of first appearance
+    """
+    summaries: dict[str, PhaseSummary] = {}
+    for record in records:
+        summary = summaries.setdefault(record.name, PhaseSummary(record.name, 0, 0.0, 0))
+        summary.calls += 1
+        summary.seconds += record.seconds
+        summary.nbytes += record.nbytes
+        if record.allocated_bytes is not None:
+            summary.allocated_bytes = (summary.allocated_bytes or 0) + record.allocated_bytes
+    return summaries
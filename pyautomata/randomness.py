@@ -0,0 +1,299 @@
+# Project PyAutomata Randomness Module
+
+# Python Modules
+from dataclasses import dataclass
+from math import erfc, exp, lgamma, log, sqrt
+from typing import Iterable
+
+# Third-Party Modules
+from numpy import (
+    asarray, bincount, concatenate, count_nonzero, ndarray,
+    zeros, int64, uint8, uint16, uint32, log as log_array,
+)
+
+# Local Modules
+from pyautomata.instrument import phase
+
+# Bits passed over per vectorized step, bounding the temporary arrays
+RANDOMNESS_CHUNK_BITS = 1 << 22
+
+# Significance level below which a p-value fails its test
+SIGNIFICANCE = 0.01
+
+# Longest overlapping pattern counted, bounding the histogram to 2**20 entries
+MAX_PATTERN_LENGTH = 20
+
+# Convergence of the incomplete gamma expansions
+GAMMA_EPSILON = 1e-15
+GAMMA_TINY = 1e-300
+
+def igamc(a: float, x: float) -> float:
+    """
+    Regularized upper incomplete gamma function Q(a, x), by its series below
+    `a + 1` and its continued fraction above
+    """
+    if x <= 0:
+        return 1.0
+    prefactor = exp(-x + a * log(x) - lgamma(a))
+
+    if x < a + 1:
+        term = total = 1.0 / a
+        denominator = a
+        while abs(term) > abs(total) * GAMMA_EPSILON:
+            denominator += 1
+            term *= x / denominator
+            total += term
+        return max(0.0, 1.0 - total * prefactor)
+
+    # Modified Lentz evaluation
+    b = x + 1 - a
+    c, d = 1 / GAMMA_TINY, 1 / b
+    fraction = d
+    i = 1
+    while True:
+        numerator = -i * (i - a)
+        b += 2
+        d = numerator * d + b
+        d = 1 / (d if abs(d) > GAMMA_TINY else GAMMA_TINY)
+        c = b + numerator / c
+        c = c if abs(c) > GAMMA_TINY else GAMMA_TINY
+        delta = c * d
+        fraction *= delta
+        if abs(delta - 1) < GAMMA_EPSILON:
+            return prefactor * fraction
+        i += 1
+
+
+@dataclass
+class RandomnessResult:
+    name: str
+    statistic: float
+    p_value: float
+
+    @property
+    def passed(self) -> bool:
+        return self.p_value >= SIGNIFICANCE
+
+
+class RandomnessTests:
+    """
+    Battery of randomness tests after NIST SP 800-22, run incrementally over
+    a stream of bits: monobit, runs, block frequency, serial, approximate
+    entropy and autocorrelation at `lag`.
+
+    Each `update` folds a block of 0/1 cells into counters, with only the
+    last bits, the first bits for the circular pattern counts and a
+    `2**pattern_length` histogram, with at most as many window codes waiting
+    to be counted into it, carried between blocks, so memory does not grow
+    with the length of the stream.
+    """
+    def __init__(self, block_length: int = 128, serial_length: int = 16,
+                 entropy_length: int = 10, lag: int = 1) -> None:
+        if block_length < 1 or lag < 1:
+            raise ValueError('Block length and lag must be positive')
+        if serial_length < 3 or entropy_length < 1:
+            raise ValueError('Serial length must be at least 3 and entropy length at least 1')
+
+        self.block_length = block_length
+        self.serial_length = serial_length
+        self.entropy_length = entropy_length
+        self.lag = lag
+
+        # Counts of every overlapping pattern, from which the shorter ones are summed
+        self.pattern_length = max(serial_length, entropy_length + 1)
+        if self.pattern_length > MAX_PATTERN_LENGTH:
+            raise ValueError(f'Pattern lengths cannot exceed {MAX_PATTERN_LENGTH}')
+        self.counted_patterns = zeros((1 << self.pattern_length,), int64)
+        self.code_type = uint16 if self.pattern_length <= 16 else uint32
+
+        # Window codes not yet in the histogram, counted once there are about
+        # as many as it has bins so each bincount is paid for by its codes
+        self.pending_codes: list[ndarray] = []
+        self.pending_windows = 0
+
+        self.count = 0
+        self.ones = 0
+        self.transitions = 0
+        self.lag_differences = 0
+
+        # Completed blocks and the squared deviations of their proportions
+        self.blocks = 0
+        self.block_deviation = 0.0
+        self.pending = zeros((0,), uint8)
+
+        # First bits, wrapped around by the circular pattern counts, and the
+        # last bits preceding the next update
+        self.history = max(self.pattern_length - 1, lag)
+        self.head = zeros((0,), uint8)
+        self.tail = zeros((0,), uint8)
+
+    def update(self, bits: ndarray) -> 'RandomnessTests':
+        """
+        Add the cells of a row, block of rows or stretch of a bit stream,
+        flattened in row order
+        """
+        bits = asarray(bits, uint8).ravel()
+        with phase('randomness'):
+            for start in range(0, len(bits), RANDOMNESS_CHUNK_BITS):
+                self.update_chunk(bits[start:start+RANDOMNESS_CHUNK_BITS])
+        return self
+
+    def update_chunk(self, chunk: ndarray) -> None:
+        if not len(chunk):
+            return
+
+        previous = len(self.tail)
+        extended = concatenate([self.tail, chunk])
+
+        self.ones += count_nonzero(chunk)
+        joined = extended[max(previous - 1, 0):]
+        self.transitions += count_nonzero(joined[1:] != joined[:-1])
+        joined = extended[max(previous - self.lag, 0):]
+        self.lag_differences += count_nonzero(joined[self.lag:] != joined[:-self.lag])
+
+        pending = concatenate([self.pending, chunk])
+        complete = len(pending) // self.block_length * self.block_length
+        if complete:
+            proportions = pending[:complete].reshape(-1, self.block_length).sum(axis=1, dtype=int64)
+            proportions = proportions / self.block_length
+            self.blocks += len(proportions)
+            self.block_deviation += float(((proportions - 0.5) ** 2).sum())
+        self.pending = pending[complete:].copy()
+
+        self.count_patterns(extended[max(previous - self.pattern_length + 1, 0):])
+
+        if len(self.head) < self.pattern_length - 1:
+            needed = self.pattern_length - 1 - len(self.head)
+            self.head = concatenate([self.head, chunk[:needed]])
+        self.tail = extended[-self.history:].copy()
+        self.count += len(chunk)
+
+    def count_patterns(self, bits: ndarray) -> None:
+        """
+        Add every window of `pattern_length` bits, first bit most significant
+        """
+        windows = len(bits) - self.pattern_length + 1
+        if windows <= 0:
+            return
+        codes = zeros((windows,), self.code_type)
+        for offset in range(self.pattern_length):
+            codes <<= 1
+            codes |= bits[offset:offset+windows]
+        self.pending_codes.append(codes)
+        self.pending_windows += windows
+        if self.pending_windows >= len(self.counted_patterns):
+            self.flush_patterns()
+
+    def flush_patterns(self) -> None:
+        """
+        Fold the pending window codes into the histogram
+        """
+        if self.pending_codes:
+            self.counted_patterns += bincount(concatenate(self.pending_codes),
+                                              minlength=len(self.counted_patterns))
+        self.pending_codes = []
+        self.pending_windows = 0
+
+    @property
+    def pattern_counts(self) -> ndarray:
+        """
+        Counts of every overlapping window of `pattern_length` bits so far
+        """
+        self.flush_patterns()
+        return self.counted_patterns
+
+    def circular_counts(self) -> ndarray:
+        """
+        Pattern counts with the stream wrapped around onto its first bits
+        """
+        counts = self.pattern_counts.copy()
+        wrapped = concatenate([self.tail[len(self.tail) - self.pattern_length + 1:], self.head])
+        windows = len(wrapped) - self.pattern_length + 1
+        for start in range(windows):
+            code = 0
+            for bit in wrapped[start:start+self.pattern_length]:
+                code = code << 1 | int(bit)
+            counts[code] += 1
+        return counts
+
+    def results(self) -> dict[str, RandomnessResult]:
+        """
+        Statistic and p-value of each test the stream is long enough for
+        """
+        n = self.count
+        results: dict[str, RandomnessResult] = {}
+        if n < 2:
+            return results
+
+        # Monobit
+        statistic = abs(2 * self.ones - n) / sqrt(n)
+        results['monobit'] = RandomnessResult('monobit', statistic, erfc(statistic / sqrt(2)))
+
+        # Runs, which fail outright when the proportion of ones is already off
+        proportion = self.ones / n
+        runs = self.transitions + 1
+        if abs(proportion - 0.5) >= 2 / sqrt(n):
+            p_value = 0.0
+        else:
+            spread = proportion * (1 - proportion)
+            p_value = erfc(abs(runs - 2 * n * spread) / (2 * sqrt(2 * n) * spread))
+        results['runs'] = RandomnessResult('runs', runs, p_value)
+
+        # Block frequency
+        if self.blocks:
+            statistic = 4 * self.block_length * self.block_deviation
+            results['block_frequency'] = RandomnessResult('block_frequency', statistic,
+                                                          igamc(self.blocks / 2, statistic / 2))
+
+        # Serial and approximate entropy over the circular pattern counts
+        if n >= self.pattern_length:
+            counts = self.circular_counts()
+            def pattern_counts(length: int) -> ndarray:
+                return counts.reshape(1 << length, -1).sum(axis=1)
+
+            def psi_squared(length: int) -> float:
+                if length <= 0:
+                    return 0.0
+                return float((pattern_counts(length) ** 2).sum()) * (1 << length) / n - n
+
+            m = self.serial_length
+            first = psi_squared(m) - psi_squared(m - 1)
+            second = psi_squared(m) - 2 * psi_squared(m - 1) + psi_squared(m - 2)
+            results['serial_1'] = RandomnessResult('serial_1', first, igamc(2 ** (m - 2), first / 2))
+            results['serial_2'] = RandomnessResult('serial_2', second, igamc(2 ** (m - 3), second / 2))
+
+            def phi(length: int) -> float:
+                frequencies = pattern_counts(length)
+                frequencies = frequencies[frequencies > 0] / n
+                return float((frequencies * log_array(frequencies)).sum())
+
+            m = self.entropy_length
+            entropy = phi(m) - phi(m + 1)
+            statistic = 2 * n * (log(2) - entropy)
+            results['approximate_entropy'] = RandomnessResult('approximate_entropy', entropy,
+                                                              igamc(2 ** (m - 1), statistic / 2))
+
+        # Autocorrelation at the lag
+        if n > self.lag:
+            pairs = n - self.lag
+            statistic = 2 * (self.lag_differences - pairs / 2) / sqrt(pairs)
+            results['autocorrelation'] = RandomnessResult('autocorrelation', statistic,
+                                                          erfc(abs(statistic) / sqrt(2)))
+
+        return results
+
+
+def calculate_randomness(stream: ndarray | Iterable[ndarray], block_length: int = 128,
+                         serial_length: int = 16, entropy_length: int = 10,
+                         lag: int = 1) -> dict[str, RandomnessResult]:
+    """
+    Run the battery over a bit array, or an iterator of rows or bit blocks
+    such as `Canvas.iter_rows` or chunks of `center_column`, holding one
+    block at a time
+    """
+    tests = RandomnessTests(block_length, serial_length, entropy_length, lag)
+    if isinstance(stream, ndarray):
+        stream = (stream,)
+    for bits in stream:
+        tests.update(bits)
+    return tests.results()
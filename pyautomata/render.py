@@ -1,23 +1,46 @@
 # PyAutomata Rendering Module
 
 # Python Modules
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from io import BytesIO
+from math import ceil, sqrt
+from typing import BinaryIO, Iterator, TYPE_CHECKING
 
 # Third-Party Modules
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-from numpy import arange, random
+from numpy import (
+    arange, asarray, concatenate, float32, ndarray, pad, random, rint, uint8, uint64, unpackbits
+)
 
 # Local Modules
+from pyautomata.handlers.packed import unpack_rows
+from pyautomata.handlers.png import PngWriter, ones_to_black, words_to_black
+from pyautomata.instrument import phase
 from pyautomata.stats import StatsContainer
 if TYPE_CHECKING:
     from pyautomata.classes.canvas import Canvas
 
+# matplotlib is imported by the drawing functions on first use, keeping it out
+# of `import pyautomata`
+
+# Largest image handed to matplotlib before the canvas is strided down
+MAX_RENDER_PIXELS = 4_000_000
+
+# Largest image produced for previews, such as Jupyter's PNG display
+MAX_PREVIEW_PIXELS = 1 << 20
+
+# Cells read from the canvas per block when streaming it to an image
+STREAM_BLOCK_CELLS = 1 << 24
+
+# Set bits of every byte, for counting live cells of bit-packed canvases
+BIT_COUNTS = unpackbits(arange(256, dtype=uint8)[:, None], axis=1).sum(axis=1).astype(uint8)
+
 def prepare_plot(x_label: str, y_label: str, title: str, grid: bool = True,
                  legend: bool = False):
     """
     Wrapper function for de-cluttering common pyplot items
     """
+    import matplotlib.pyplot as plt
+
     plt.xlabel(x_label)
     plt.ylabel(y_label)
     plt.title(title)
@@ -30,6 +53,8 @@ def prepare_scatter_plot(x: list, y: list):
     """
     Wrapper function for de-cluttering scatter plot creation
     """
+    import matplotlib.pyplot as plt
+
     plt.style.use('_mpl-gallery')
 
     # size and color:
@@ -51,6 +76,8 @@ def prepare_bar_chart(inputs: list):
     """
     Wrapper function for de-cluttering bar chart creation
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
 
     x = 0.5 + arange(len(inputs))
@@ -68,6 +95,9 @@ def draw_plot(canvas: 'Canvas', max_depth: int = None, filename: str = None,
     """
     Draw a canvas plot
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap
+
     if max_depth is None:
         max_depth = canvas.rows+1
 
@@ -76,24 +106,45 @@ def draw_plot(canvas: 'Canvas', max_depth: int = None, filename: str = None,
 
     inverted_cmap = LinearSegmentedColormap.from_list('inverted_gray', ['white', 'black'])
 
-    plt.imshow(canvas.result[:, 1:max_depth*2], cmap=inverted_cmap)
-    plt.title(title)
-    
-    if plt.isinteractive():
-        plt.show()
-    else:
-        if filename is None:
-            filename = title
-        plt.savefig(filename)
+    with phase('plot.slice', canvas):
+        image = plot_image(canvas, max_depth)
+
+    with phase('plot.draw', canvas):
+        plt.imshow(image, cmap=inverted_cmap)
+        plt.title(title)
+
+        if plt.isinteractive():
+            plt.show()
+        else:
+            if filename is None:
+                filename = title
+            plt.savefig(filename)
+
+def plot_image(canvas: 'Canvas', max_depth: int) -> ndarray:
+    """
+    The cells drawn by `draw_plot`, strided down to `MAX_RENDER_PIXELS`.
+    Striding in the slice keeps memory-mapped and light cone canvases from
+    being read or densified in whole, and only the sampled rows of a
+    bit-packed canvas are unpacked.
+    """
+    stop = min(max_depth*2, canvas.columns)
+    step = max(1, ceil(sqrt(canvas.rows * max(stop - 1, 0) / MAX_RENDER_PIXELS)))
+
+    words = getattr(canvas, 'packed', None)
+    if words is not None:
+        return unpack_rows(words[::step], stop)[:, 1::step]
+    return asarray(canvas.result[::step, 1:stop:step])
 
 def draw_standard_deviation(stats: StatsContainer, start: int = None, end: int = None) -> None:
     """
     Draw the standard deviations plots
     """
+    import matplotlib.pyplot as plt
+
     plt.title('Row sum increase rate')
     start = start if start else 0
     end = end if end else len(stats.marginal_sum_increase)-1
-    plot_values = [stats.marginal_sum_increase[i] for i in range(start, end+1)]
+    plot_values = stats.marginal_sum_increase[start:end+1]
     plt.plot(plot_values)
 
     color_iterator = iter(['red', 'purple', 'orange', 'blue'])
@@ -108,3 +159,221 @@ def draw_standard_deviation(stats: StatsContainer, start: int = None, end: int =
 
     plt.grid()
     plt.show()
+
+
+# Direct PNG output
+
+def has_rows(canvas: 'Canvas') -> bool:
+    """
+    Whether the canvas kept its rows, without unpacking a bit-packed canvas
+    """
+    return getattr(canvas, 'packed', None) is not None or canvas.result is not None
+
+def iter_row_blocks(canvas: 'Canvas', block_rows: int, packed: bool = False) -> Iterator[ndarray]:
+    """
+    Stream the canvas `block_rows` rows at a time as uint8 cells, or as the
+    packed words of a bit-packed canvas when `packed` is set
+    """
+    words = getattr(canvas, 'packed', None)
+    for start in range(0, canvas.rows, block_rows):
+        stop = min(start + block_rows, canvas.rows)
+        if packed:
+            yield words[start:stop]
+        elif words is not None:
+            yield canvas.unpack(start, stop)
+        else:
+            yield asarray(canvas.result[start:stop])
+
+def open_output(file: str | BinaryIO) -> tuple[BinaryIO, bool]:
+    """
+    Binary file object for a path or an open file, and whether to close it
+    """
+    if isinstance(file, str):
+        return open(file, 'wb'), True
+    return file, False
+
+def write_png(canvas: 'Canvas', file: str | BinaryIO, bit_depth: int = 1) -> None:
+    """
+    Write the canvas as a full resolution PNG without matplotlib, streaming
+    the rows from uint8 or bit-packed storage.  1-bit images take one bit
+    per cell, 8-bit images are 0 for live and 255 for dead cells.
+    """
+    if not has_rows(canvas):
+        raise ValueError('Canvas has no rows to draw, it was generated with sums only')
+
+    output, close = open_output(file)
+    try:
+        writer = PngWriter(output, canvas.columns, canvas.rows, bit_depth)
+        block_rows = max(1, STREAM_BLOCK_CELLS // canvas.columns)
+        packed = bit_depth == 1 and getattr(canvas, 'packed', None) is not None
+
+        for block in iter_row_blocks(canvas, block_rows, packed):
+            if packed:
+                writer.write_rows(words_to_black(block, canvas.columns))
+            elif bit_depth == 1:
+                writer.write_rows(ones_to_black(block))
+            else:
+                writer.write_rows((1 - block) * uint8(255))
+        writer.close()
+    finally:
+        if close:
+            output.close()
+
+def density_png(density: ndarray, file: str | BinaryIO = None) -> bytes | None:
+    """
+    Write a density map as an 8-bit PNG, fully live blocks black.  Returns the
+    PNG bytes when no file is given.
+    """
+    output, close = (BytesIO(), False) if file is None else open_output(file)
+    try:
+        writer = PngWriter(output, density.shape[1], density.shape[0], 8)
+        writer.write_rows(rint((1 - density) * 255).astype(uint8))
+        writer.close()
+    finally:
+        if close:
+            output.close()
+    return output.getvalue() if file is None else None
+
+
+@dataclass
+class DensityPyramid:
+    """
+    Live cell density of a canvas per block, with each level averaging 2 x 2
+    blocks of the one before.  Level `k` covers `block * 2**k` cells square
+    per value, so previews and zooms read a small array instead of the canvas.
+    """
+    rows: int
+    columns: int
+    block: int
+    levels: list[ndarray]
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def scale(self, level: int) -> int:
+        """
+        Canvas cells per side of a value at `level`
+        """
+        return self.block * 2 ** level
+
+    def level_for(self, height: int = None, width: int = None,
+                  max_pixels: int = MAX_PREVIEW_PIXELS) -> int:
+        """
+        Finest level showing a `height x width` region of the canvas within
+        `max_pixels`, the whole canvas by default
+        """
+        height = self.rows if height is None else height
+        width = self.columns if width is None else width
+        for level in range(len(self.levels)):
+            scale = self.scale(level)
+            if ceil(height / scale) * ceil(width / scale) <= max_pixels:
+                return level
+        return len(self.levels) - 1
+
+    def view(self, top: int = 0, left: int = 0, height: int = None, width: int = None,
+             max_pixels: int = MAX_PREVIEW_PIXELS) -> ndarray:
+        """
+        Densities of the region of the canvas starting at row `top` and column
+        `left`, at the finest level within `max_pixels`
+        """
+        height = self.rows - top if height is None else height
+        width = self.columns - left if width is None else width
+        level = self.level_for(height, width, max_pixels)
+        scale = self.scale(level)
+        return self.levels[level][top // scale:ceil((top + height) / scale),
+                                  left // scale:ceil((left + width) / scale)]
+
+    def to_png(self, file: str | BinaryIO = None, max_pixels: int = MAX_PREVIEW_PIXELS,
+               **region) -> bytes | None:
+        """
+        Draw `view` as an 8-bit PNG, returning the bytes when no file is given
+        """
+        return density_png(self.view(max_pixels=max_pixels, **region), file)
+
+    def _repr_png_(self) -> bytes:
+        return self.to_png()
+
+
+def block_counts(cells: ndarray, block: int) -> ndarray:
+    """
+    Live cells per `block x block` square of a block of rows, the edges
+    padded with dead cells
+    """
+    rows, columns = cells.shape
+    padded = pad(cells, ((0, -rows % block), (0, -columns % block)))
+    return padded.reshape(len(padded) // block, block, -1, block).sum(axis=(1, 3), dtype=uint64)
+
+def packed_block_counts(words: ndarray, columns: int, block: int) -> ndarray:
+    """
+    `block_counts` straight from bit-packed words, counting the set bits of
+    each byte.  `block` must be a multiple of 8 so squares hold whole bytes.
+    """
+    rows = len(words)
+    counts = BIT_COUNTS[words.astype('<u8', copy=False).view(uint8).reshape(rows, -1)]
+    counts = counts[:, :ceil(columns / block) * block // 8]
+    counts = pad(counts, ((0, -rows % block), (0, -counts.shape[1] % (block // 8))))
+    return counts.reshape(len(counts) // block, block, -1, block // 8).sum(axis=(1, 3), dtype=uint64)
+
+def build_pyramid(canvas: 'Canvas', block: int = 8, levels: int = None) -> DensityPyramid:
+    """
+    Build the density pyramid of a canvas in one streaming pass over its rows,
+    halving the resolution until a level fits in one value or `levels` are
+    built
+    """
+    if not has_rows(canvas):
+        raise ValueError('Canvas has no rows to draw, it was generated with sums only')
+
+    # Whole block rows are read at a time so no square straddles two reads
+    block_rows = block * max(1, STREAM_BLOCK_CELLS // (canvas.columns * block))
+    if block % 8 == 0 and getattr(canvas, 'packed', None) is not None:
+        counts = [packed_block_counts(words, canvas.columns, block)
+                  for words in iter_row_blocks(canvas, block_rows, packed=True)]
+    else:
+        counts = [block_counts(cells, block) for cells in iter_row_blocks(canvas, block_rows)]
+    counts = concatenate(counts)
+
+    # Cells per square, smaller along the right and bottom edges
+    row_area = block_counts_area(canvas.rows, block)
+    column_area = block_counts_area(canvas.columns, block)
+    areas = row_area[:, None] * column_area[None, :]
+
+    pyramid = []
+    while True:
+        pyramid.append((counts / areas).astype(float32))
+        if max(counts.shape) <= 1 or (levels is not None and len(pyramid) >= levels):
+            break
+        counts, areas = halve(counts), halve(areas)
+
+    return DensityPyramid(canvas.rows, canvas.columns, block, pyramid)
+
+def block_counts_area(length: int, block: int) -> ndarray:
+    """
+    Cells covered along one axis by each block of `block` cells
+    """
+    area = [block] * (length // block)
+    if length % block:
+        area.append(length % block)
+    return asarray(area, uint64)
+
+def halve(values: ndarray) -> ndarray:
+    """
+    Sum 2 x 2 squares, padding odd edges with zeros
+    """
+    padded = pad(values, ((0, len(values) % 2), (0, values.shape[1] % 2)))
+    return padded.reshape(len(padded) // 2, 2, -1, 2).sum(axis=(1, 3))
+
+def preview_png(canvas: 'Canvas', max_pixels: int = MAX_PREVIEW_PIXELS) -> bytes | None:
+    """
+    PNG bytes of the whole canvas, 1-bit when it fits in `max_pixels` and
+    otherwise an 8-bit density map with blocks sized to fit
+    """
+    if not has_rows(canvas):
+        return None
+
+    if canvas.rows * canvas.columns <= max_pixels:
+        output = BytesIO()
+        write_png(canvas, output)
+        return output.getvalue()
+
+    block = ceil(sqrt(canvas.rows * canvas.columns / max_pixels))
+    return build_pyramid(canvas, block, levels=1).to_png(max_pixels=max_pixels)
@@ -1,330 +1,618 @@
 // PyAutomata Rust Support Library
 
-use serde_json;
-use std::collections::HashMap;
 use std::slice;
-// use serde::{Serialize, Deserialize};
-use std::ffi::CString;
-use std::os::raw::c_char;
 
-#[repr(C)]
-pub struct CanvasPointers {
-    canvas_pointer: *mut u8,
-    sums_pointer: *mut u32,
-}
-
-#[repr(C)]
-pub struct RecognitionOutput {
-    pattern_rules_pointer: *const c_char,
-    pattern_segments_pointer: *const c_char,
-    segment_count: usize,
-}
-
-fn process_rules(rules: &[u8]) -> HashMap<(u8 , u8, u8), u8> {
-    // Convert and create a hash map from the rules
-    let mut rules_map = HashMap::with_capacity(rules.len() / 4);
+fn process_rules(rules: &[u8]) -> [u8; 8] {
+    // Convert the rules into a table indexed by `left << 2 | center << 1 | right`
+    let mut rules_table = [0u8; 8];
 
     // Rules are 4 members, 3 inputs and 1 output
     for chunk in rules.chunks_exact(4) {
         for &value in chunk {
             assert!(value == 0 || value == 1, "Pattern rules must be either 0 or 1");
         }
-        let key = (chunk[0], chunk[1], chunk[2]);
-        let value = chunk[3];
-        rules_map.insert(key, value);
+        let key = (chunk[0] << 2 | chunk[1] << 1 | chunk[2]) as usize;
+        rules_table[key] = chunk[3];
     }
 
-    rules_map
+    rules_table
 }
 
-fn prepare_cstring_pointer(input: String) -> *const c_char {
-    let c_string = CString::new(input).unwrap();
-    let string_pointer = c_string.as_ptr();
-    std::mem::forget(c_string);
-
-    string_pointer
+fn row_bounds(row: usize, columns: usize, boost: bool, central_line: usize) -> (usize, usize) {
+    // Span of row `row + 1` computed from row `row`, boosting masks untouched whitespace
+    if boost {
+        (central_line.saturating_sub(row + 2), std::cmp::min(central_line + row + 2, columns))
+    } else {
+        (0, columns)
+    }
 }
 
-fn generate_row(rules_map: &HashMap<(u8 , u8, u8), u8>, input_row: &[u8], output_row: &mut [u8],
+fn generate_span(rules_table: &[u8; 8], input_row: &[u8], output_row: &mut [u8],
     start: usize, stop: usize) -> u32 {
-    // Function to generate a single row given proper inputs
+    // Generate `[start, stop)` of the next row, cells beyond the row are 0
     let mut row_sum: u32 = 0;
+    let last = input_row.len() - 1;
 
-    for i in start..stop {
-        let left = if i == 0 { 0 } else { input_row[i - 1] };
-        let center = input_row[i];
-        let right = if i == input_row.len() - 1 { 0 } else { input_row[i + 1] };
+    for col in start..stop {
+        let left = if col == 0 { 0 } else { input_row[col - 1] };
+        let center = input_row[col];
+        let right = if col == last { 0 } else { input_row[col + 1] };
 
-        if let Some(&new_value) = rules_map.get(&(left as u8, center as u8, right as u8)) {
-            output_row[i] = new_value as u8;
-            row_sum += new_value as u32;
-        }
+        let new_value = rules_table[(left << 2 | center << 1 | right) as usize];
+        output_row[col] = new_value;
+        row_sum += new_value as u32;
     }
     row_sum
 }
 
-#[no_mangle]
-pub extern "C" fn generate_canvas(
-    initial_row: *const u8,
-    rows: usize,
-    columns: usize,
-    rules: *const u8,
-    rules_length: usize,
-    boost: bool,
-    central_line: usize,
-    whole: bool
-) -> CanvasPointers {
-    // Determines whether the functions should be broken up
-    if whole {
-        generate_canvas_whole(initial_row, rows, columns, rules, rules_length, boost, central_line)
-    }
-    else {
-        generate_canvas_by_row(initial_row, rows, columns, rules, rules_length, boost, central_line)
-    }
+#[repr(C)]
+pub struct RunningStats {
+    count: u64,
+    mean: f64,
+    m2: f64,
 }
 
-fn generate_canvas_by_row(
-    initial_row: *const u8,
-    rows: usize,
-    columns: usize,
-    rules: *const u8,
-    rules_length: usize,
-    boost: bool,
-    central_line: usize
-) -> CanvasPointers {
+impl RunningStats {
+    fn update(&mut self, row: usize, sum: u32) {
+        // Welford step for the marginal increase of a row with a non-zero sum
+        if sum == 0 {
+            return;
+        }
+        let increase = row as f64 / sum as f64;
+        self.count += 1;
+        let delta = increase - self.mean;
+        self.mean += delta / self.count as f64;
+        self.m2 += delta * (increase - self.mean);
+    }
+}
 
-    let mut working_canvas = Vec::with_capacity(rows);
-    let mut sums = vec![0; rows];
+fn read_inputs<'a>(initial_row: *const u8, rows: usize, columns: usize, rules: *const u8,
+    rules_length: usize, canvas_out: *mut u8, sums_out: *mut u32)
+    -> ([u8; 8], &'a mut [u8], &'a mut [u32]) {
+    // Validates the inputs and seeds the first row of the Python-owned buffers
+    assert!(!canvas_out.is_null() && !sums_out.is_null(), "Null output buffer passed");
 
-    let (initial_row_slice, rules_slice) = unsafe {
+    let (initial_row_slice, rules_slice, canvas, sums) = unsafe {
         (
             slice::from_raw_parts(initial_row, columns),
             slice::from_raw_parts(rules, rules_length),
+            slice::from_raw_parts_mut(canvas_out, rows * columns),
+            slice::from_raw_parts_mut(sums_out, rows),
         )
     };
 
-    let rules_map = process_rules(rules_slice);
-
     let mut first_row_sum: u32 = 0;
-    for &value in initial_row_slice.iter() {
+    for (i, &value) in initial_row_slice.iter().enumerate() {
         assert!(value == 0 || value == 1, "Initial row must contain only 0s and 1s");
+        canvas[i] = value as u8;
         first_row_sum = first_row_sum + value as u32;
     }
-    working_canvas.push(initial_row_slice.to_vec());
     sums[0] = first_row_sum;
 
-    for row in 0..rows-1 {
-        let mut output_row = vec![0u8; columns];
-
-        let mut start: usize = 0;
-        let mut stop: usize = columns;
-
-        // Boosting masks untouched whitespace when appropriate
-        if boost {
-            start = central_line.saturating_sub(row + 2);
-            stop = std::cmp::min(central_line + row + 2, columns);
-        }
-
-        let input_row = &working_canvas[row];
-
-        let row_sum = generate_row(&rules_map, &input_row, &mut output_row, start, stop);
-
-        working_canvas.push(output_row.to_vec());
-        sums[row] = row_sum;
-    }
-
-    let mut canvas: Vec<u8> = working_canvas.into_iter().flat_map(|row| row.into_iter()).collect();
-
-    // Capture the pointers and forget them to prevent automatic memory management
-    let canvas_ptr = canvas.as_mut_ptr();
-    let sums_ptr = sums.as_mut_ptr();
-    std::mem::forget(canvas);
-    std::mem::forget(sums);
-
-    CanvasPointers {
-        canvas_pointer: canvas_ptr,
-        sums_pointer: sums_ptr
-    }
+    (process_rules(rules_slice), canvas, sums)
 }
 
-fn generate_canvas_whole(
+#[no_mangle]
+pub extern "C" fn generate_canvas(
     initial_row: *const u8,
     rows: usize,
     columns: usize,
     rules: *const u8,
     rules_length: usize,
     boost: bool,
-    central_line: usize
-) -> CanvasPointers {
-
-    let mut canvas = vec![0; rows * columns];
-    let mut sums = vec![0; rows];
+    central_line: usize,
+    row_offset: usize,
+    canvas_out: *mut u8,
+    sums_out: *mut u32,
+    stats_out: *mut RunningStats
+) {
+    // Generates the canvas into Python-owned, zeroed buffers of `rows * columns` and `rows`.
+    // The generated rows are added to the running stats unless `stats_out` is null.
+    let (rules_table, canvas, sums) = read_inputs(initial_row, rows, columns, rules, rules_length,
+        canvas_out, sums_out);
+    let mut stats = unsafe { stats_out.as_mut() };
+
+    for row in 0..rows.saturating_sub(1) {
+        let (start, stop) = row_bounds(row + row_offset, columns, boost, central_line);
+        let (previous, next) = canvas[row * columns..(row + 2) * columns].split_at_mut(columns);
+        sums[row + 1] = generate_span(&rules_table, previous, next, start, stop);
+        if let Some(stats) = stats.as_mut() {
+            stats.update(row + row_offset + 1, sums[row + 1]);
+        }
+    }
+}
 
-    let (initial_row_slice, rules_slice) = unsafe {
+#[no_mangle]
+pub extern "C" fn generate_ensemble(
+    initial_rows: *const u8,
+    batch: usize,
+    rows: usize,
+    columns: usize,
+    rules: *const u8,
+    rules_length: usize,
+    canvas_out: *mut u8,
+    sums_out: *mut u32
+) {
+    // Generates `batch` canvases from `batch * columns` initial rows in one call, into
+    // Python-owned, zeroed buffers of `batch * rows * columns` and `batch * rows`.  A null
+    // `canvas_out` only keeps the sums, holding two rows at a time.
+    assert!(!sums_out.is_null(), "Null output buffer passed");
+
+    let (initial_rows_slice, rules_slice, sums) = unsafe {
         (
-            slice::from_raw_parts(initial_row, columns),
+            slice::from_raw_parts(initial_rows, batch * columns),
             slice::from_raw_parts(rules, rules_length),
+            slice::from_raw_parts_mut(sums_out, batch * rows),
         )
     };
-
-    let rules_map = process_rules(rules_slice);
-
-    let mut first_row_sum: u32 = 0;
-    for (i, &value) in initial_row_slice.iter().enumerate() {
-        assert!(value == 0 || value == 1, "Initial row must contain only 0s and 1s");
-        canvas[i] = value as u8;
-        first_row_sum = first_row_sum + value as u32;
+    let rules_table = process_rules(rules_slice);
+
+    let mut current = vec![0u8; columns];
+    let mut next = vec![0u8; columns];
+
+    for member in 0..batch {
+        let first_row = &initial_rows_slice[member * columns..(member + 1) * columns];
+        assert!(first_row.iter().all(|&value| value == 0 || value == 1),
+            "Initial rows must contain only 0s and 1s");
+        let member_sums = &mut sums[member * rows..(member + 1) * rows];
+        member_sums[0] = first_row.iter().map(|&value| value as u32).sum();
+
+        if canvas_out.is_null() {
+            current.copy_from_slice(first_row);
+            for row in 1..rows {
+                member_sums[row] = generate_span(&rules_table, &current, &mut next, 0, columns);
+                std::mem::swap(&mut current, &mut next);
+            }
+        } else {
+            let canvas = unsafe {
+                slice::from_raw_parts_mut(canvas_out.add(member * rows * columns), rows * columns)
+            };
+            canvas[..columns].copy_from_slice(first_row);
+            for row in 0..rows.saturating_sub(1) {
+                let (previous, next) = canvas[row * columns..(row + 2) * columns].split_at_mut(columns);
+                member_sums[row + 1] = generate_span(&rules_table, previous, next, 0, columns);
+            }
+        }
     }
-    sums[0] = first_row_sum;
-
-    for row in 0..rows-1 {
-        let mut row_sum: u32 = 0;
-
-        // Boosting masks untouched whitespace when appropriate
-        let start = if boost { central_line.saturating_sub(row + 2) } else { 0 };
-        let stop = if boost { std::cmp::min(central_line + row + 2, columns) } else { columns };
+}
 
-        for col in start..stop {
-            let left = if col == 0 { 0 } else { canvas[row * columns + col - 1] };
-            let center = canvas[row * columns + col];
-            let right = if col == columns - 1 { 0 } else { canvas[row * columns + col + 1] };
+struct SharedCanvas(*mut u8);
+unsafe impl Send for SharedCanvas {}
+unsafe impl Sync for SharedCanvas {}
 
-            if let Some(&new_value) = rules_map.get(&(left as u8, center as u8, right as u8)) {
-                canvas[(row + 1) * columns + col] = new_value as u8;
-                row_sum = row_sum + new_value as u32;
+#[no_mangle]
+pub extern "C" fn generate_canvas_parallel(
+    initial_row: *const u8,
+    rows: usize,
+    columns: usize,
+    rules: *const u8,
+    rules_length: usize,
+    boost: bool,
+    central_line: usize,
+    row_offset: usize,
+    canvas_out: *mut u8,
+    sums_out: *mut u32,
+    stats_out: *mut RunningStats,
+    threads: usize,
+    band_rows: usize
+) {
+    // Trapezoidal tiling: each band of `band_rows` rows is split into one column tile per
+    // thread.  A tile copies its columns plus a halo of `band_rows` cells either side and
+    // advances the whole band locally; errors from the cut halo edges travel one cell per
+    // row, so the tile's own columns are exact when the band is done.  Threads only
+    // synchronize between bands and write disjoint columns, so the output is identical to
+    // the serial engine.
+    let (rules_table, canvas, sums) = read_inputs(initial_row, rows, columns, rules, rules_length,
+        canvas_out, sums_out);
+
+    let threads = std::cmp::max(threads, 1);
+    let band_rows = std::cmp::max(band_rows, 1);
+    let tile_width = (columns + threads - 1) / threads;
+    let shared = SharedCanvas(canvas.as_mut_ptr());
+    let mut stats = unsafe { stats_out.as_mut() };
+
+    let mut band_start = 0;
+    while band_start + 1 < rows {
+        let band = std::cmp::min(band_rows, rows - 1 - band_start);
+
+        let tile_sums: Vec<Vec<u32>> = std::thread::scope(|scope| {
+            let handles: Vec<_> = (0..threads).map(|tile| {
+                let shared = &shared;
+                let rules_table = &rules_table;
+                scope.spawn(move || {
+                    let mut partial_sums = vec![0u32; band];
+                    let a = std::cmp::min(tile * tile_width, columns);
+                    let b = std::cmp::min(a + tile_width, columns);
+                    if a >= b {
+                        return partial_sums;
+                    }
+
+                    // Local window with the halo, clipped at the real canvas edges
+                    let lo = a.saturating_sub(band);
+                    let hi = std::cmp::min(b + band, columns);
+                    let width = hi - lo;
+
+                    let mut current = vec![0u8; width];
+                    let mut next = vec![0u8; width];
+                    unsafe {
+                        std::ptr::copy_nonoverlapping(shared.0.add(band_start * columns + lo),
+                            current.as_mut_ptr(), width);
+                    }
+
+                    for step in 0..band {
+                        let row = band_start + step;
+                        let (start, stop) = row_bounds(row + row_offset, columns, boost, central_line);
+
+                        for col in 0..width {
+                            let absolute = lo + col;
+                            next[col] = if absolute < start || absolute >= stop {
+                                0
+                            } else {
+                                let left = if col == 0 { 0 } else { current[col - 1] };
+                                let right = if col == width - 1 { 0 } else { current[col + 1] };
+                                rules_table[(left << 2 | current[col] << 1 | right) as usize]
+                            };
+                        }
+
+                        let own = &next[a - lo..b - lo];
+                        partial_sums[step] = own.iter().map(|&value| value as u32).sum();
+                        unsafe {
+                            std::ptr::copy_nonoverlapping(own.as_ptr(),
+                                shared.0.add((row + 1) * columns + a), b - a);
+                        }
+                        std::mem::swap(&mut current, &mut next);
+                    }
+                    partial_sums
+                })
+            }).collect();
+            handles.into_iter().map(|handle| handle.join().unwrap()).collect()
+        });
+
+        for step in 0..band {
+            let row = band_start + step + 1;
+            sums[row] = tile_sums.iter().map(|partial| partial[step]).sum();
+            if let Some(stats) = stats.as_mut() {
+                stats.update(row + row_offset, sums[row]);
             }
-        sums[row] = row_sum;
         }
-    }
-    // Capture the pointers and forget them to prevent automatic memory management
-    let canvas_ptr = canvas.as_mut_ptr();
-    let sums_ptr = sums.as_mut_ptr();
-    std::mem::forget(canvas);
-    std::mem::forget(sums);
-
-    CanvasPointers {
-        canvas_pointer: canvas_ptr,
-        sums_pointer: sums_ptr
+        band_start += band;
     }
 }
 
 #[repr(C)]
 pub struct StatsStruct {
-    standard_deviation: f32,
-    mean_increase: f32,
-    marginal_sum_increase_ptr: *mut f32,
+    standard_deviation: f64,
+    mean_increase: f64,
     sum_rate_length: usize,
 }
 
 #[no_mangle]
-pub extern "C" fn calculate_stats(canvas_sums: *const u32, sums_length: usize) -> StatsStruct {
-    // Stat calculation
+pub extern "C" fn calculate_stats(canvas_sums: *const u32, sums_length: usize,
+    marginal_sum_increase_out: *mut f64) -> StatsStruct {
+    // Single pass Welford stat calculation in f64, writing the marginal increases into a
+    // Python-owned buffer of `sums_length`
+    assert!(!marginal_sum_increase_out.is_null(), "Null output buffer passed");
 
-    let sums_slice = unsafe {
-        slice::from_raw_parts(canvas_sums, sums_length)
+    let (sums_slice, marginal_sum_increase) = unsafe {
+        (
+            slice::from_raw_parts(canvas_sums, sums_length),
+            slice::from_raw_parts_mut(marginal_sum_increase_out, sums_length),
+        )
     };
 
-    let mut marginal_sum_increase = Vec::new();
-    let mut total_sum_increase = 0.0;
+    let mut stats = RunningStats { count: 0, mean: 0.0, m2: 0.0 };
     for (i, &sum) in sums_slice.iter().enumerate() {
         if sum != 0 {
-            let increase = i as f32 / sum as f32;
-            marginal_sum_increase.push(increase);
-            total_sum_increase += increase;
+            marginal_sum_increase[stats.count as usize] = i as f64 / sum as f64;
+            stats.update(i, sum);
         }
     }
 
-    let mean_increase = total_sum_increase / marginal_sum_increase.len() as f32;
-
-    let variance_sum: f32 = marginal_sum_increase.iter().map(|&x| (x - mean_increase).powi(2)).sum();
-    let standard_deviation = f32::sqrt(variance_sum / marginal_sum_increase.len() as f32);
-
-    let sum_rate_length: usize = marginal_sum_increase.len();
-
-    let marginal_sum_increase_ptr = marginal_sum_increase.as_mut_ptr();
-    std::mem::forget(marginal_sum_increase);
+    let standard_deviation = if stats.count == 0 { 0.0 } else { f64::sqrt(stats.m2 / stats.count as f64) };
 
     StatsStruct {
         standard_deviation: standard_deviation,
-        mean_increase: mean_increase,
-        marginal_sum_increase_ptr: marginal_sum_increase_ptr,
-        sum_rate_length: sum_rate_length,
+        mean_increase: stats.mean,
+        sum_rate_length: stats.count as usize,
     }
 }
 
 #[no_mangle]
-pub extern "C" fn recognize_canvas(canvas_pointer: *const u8, rows: usize,
-    columns: usize, pattern_length: usize, boost: bool, central_line: usize) -> RecognitionOutput {
+pub extern "C" fn recognize_canvas(canvas_pointer: *const u8, rows: usize, columns: usize,
+    pattern_length: usize, boost: bool, central_line: usize, row_offset: usize,
+    segment_counts_out: *mut u64, parent_segments_out: *mut i32) -> usize {
+    // Windows are packed into integers, most significant bit first.  Segment counts are
+    // added to a dense `2^pattern_length` histogram and each parent window of
+    // `pattern_length + 2` cells maps to its segment code in a `2^(pattern_length + 2)`
+    // table, both Python-owned with unseen parents left at -1.  `row_offset` is the
+    // absolute index of the first row when recognizing a canvas block by block.
 
     assert!(!canvas_pointer.is_null(), "Null pointer passed");
+    assert!(!segment_counts_out.is_null() && !parent_segments_out.is_null(), "Null output buffer passed");
+    assert!(pattern_length >= 1 && pattern_length + 2 < 32, "Pattern length must pack into an i32");
 
-    let canvas_slice = unsafe {
-            slice::from_raw_parts(canvas_pointer, rows * columns)
+    let (canvas_slice, segment_counts, parent_segments) = unsafe {
+        (
+            slice::from_raw_parts(canvas_pointer, rows * columns),
+            slice::from_raw_parts_mut(segment_counts_out, 1 << pattern_length),
+            slice::from_raw_parts_mut(parent_segments_out, 1 << (pattern_length + 2)),
+        )
     };
 
-    let mut pattern_segments: HashMap<String, usize> = HashMap::new();
-    let mut pattern_rules: HashMap<String, String> = HashMap::new();
+    let segment_mask: u64 = (1 << pattern_length) - 1;
+    let parent_mask: u64 = (1 << (pattern_length + 2)) - 1;
     let mut segment_count: usize = 0;
 
     for row in 1..rows {
         // Boost masks known whitespace to speed up calculation
-        let start = if boost { central_line - row - 2 } else { 1 };
-        let stop = if boost {
-            std::cmp::min(central_line + row + 2, columns - pattern_length)
-        } else {
-            columns - pattern_length
-        };
+        let default_stop = columns.saturating_sub(pattern_length);
+        let absolute = row + row_offset;
+        let start = if boost { std::cmp::max(central_line.saturating_sub(absolute + 2), 1) } else { 1 };
+        let stop = if boost { std::cmp::min(central_line + absolute + 2, default_stop) } else { default_stop };
+
+        if start >= stop {
+            continue;
+        }
+
+        let current = &canvas_slice[row * columns..(row + 1) * columns];
+        let previous = &canvas_slice[(row - 1) * columns..row * columns];
+
+        // Prime the rolling codes with every cell of the first windows but the last
+        let mut segment: u64 = 0;
+        let mut parent: u64 = 0;
+        for k in 0..pattern_length - 1 {
+            segment = (segment << 1) | current[start + k] as u64;
+        }
+        for k in 0..pattern_length + 1 {
+            parent = (parent << 1) | previous[start - 1 + k] as u64;
+        }
 
         for column in start..stop {
-            if column + pattern_length > columns {
-                continue;
-            }
-            // Identify the segment
-            let segment_start = row * columns + column;
-            let segment_end = segment_start + pattern_length;
-            let segment = &canvas_slice[segment_start..segment_end];
-            let segment_key = serde_json::to_string(&segment).unwrap();
-
-            // Identify the parent that created it
-            let parent_start = (row - 1) * columns + column - 1;
-            let parent_end = parent_start + pattern_length + 2;
-            let parent_pattern = &canvas_slice[parent_start..parent_end];
-            let parent_string = serde_json::to_string(&parent_pattern).unwrap();
-
-            if pattern_segments.contains_key(&segment_key) {
-                *pattern_segments.get_mut(&segment_key).unwrap() += 1;
-            } else {
-                pattern_segments.insert(segment_key.clone(), 1);
-            }
+            segment = ((segment << 1) | current[column + pattern_length - 1] as u64) & segment_mask;
+            parent = ((parent << 1) | previous[column + pattern_length] as u64) & parent_mask;
 
-            pattern_rules.insert(parent_string, segment_key);
+            segment_counts[segment as usize] += 1;
+            parent_segments[parent as usize] = segment as i32;
             segment_count += 1;
         }
     }
 
-    // Prepare the hashmaps for transport
-    let pattern_rules_string: String = serde_json::to_string(&pattern_rules).unwrap();
-    let pattern_segments_string: String = serde_json::to_string(&pattern_segments).unwrap();
-
-    RecognitionOutput {
-        pattern_rules_pointer: prepare_cstring_pointer(pattern_rules_string),
-        pattern_segments_pointer: prepare_cstring_pointer(pattern_segments_string),
-        segment_count: segment_count,
-    }
+    segment_count
 }
 
 #[no_mangle]
-pub extern "C" fn free_memory(ptr: *mut u8, size_in_bytes: usize) {
-    // Function to release the memory after it has been transferred into Python-owned memory
-    if !ptr.is_null() {
-        let _ = unsafe { Vec::from_raw_parts(ptr, size_in_bytes, size_in_bytes) };
+pub extern "C" fn generate_column(initial_row: *const u8, rows: usize, columns: usize,
+    column: usize, rules: *const u8, rules_length: usize, boost: bool, central_line: usize,
+    column_out: *mut u8) {
+    // Writes the cells of `column` in the first `rows` rows into a Python-owned buffer of
+    // `rows`.  Only the backward light cone of the last cell is advanced, packed 64 cells per
+    // u64 word: it narrows by a cell either side per row, so the cells cut off at its edges
+    // never reach the column and memory stays O(rows).
+    assert!(!column_out.is_null(), "Null output buffer passed");
+    assert!(column < columns, "Column must lie within the row");
+    if rows == 0 {
+        return;
+    }
+
+    let (initial_row_slice, rules_slice, column_cells) = unsafe {
+        (
+            slice::from_raw_parts(initial_row, columns),
+            slice::from_raw_parts(rules, rules_length),
+            slice::from_raw_parts_mut(column_out, rows),
+        )
+    };
+    let rules_table = process_rules(rules_slice);
+
+    // Word-wide form of the rule as a multiplexer on the left, center and right cells,
+    // branch free so that the interior words vectorize
+    let mask = |key: usize| if rules_table[key] == 1 { !0u64 } else { 0 };
+    let masks: [u64; 8] = [mask(0), mask(1), mask(2), mask(3), mask(4), mask(5), mask(6), mask(7)];
+    let evaluate = |left: u64, center: u64, right: u64| -> u64 {
+        let pick = |high: u64, low: u64, select: u64| (select & high) | (!select & low);
+        let on_right = |key: usize| pick(masks[key + 1], masks[key], right);
+        let on_center = |key: usize| pick(on_right(key + 2), on_right(key), center);
+        pick(on_center(4), on_center(0), left)
+    };
+
+    let low = column.saturating_sub(rows - 1);
+    let high = std::cmp::min(column + rows, columns);
+    let words = (high - low + 63) / 64;
+
+    let mut current = vec![0u64; words];
+    let mut next = vec![0u64; words];
+    for (i, &value) in initial_row_slice[low..high].iter().enumerate() {
+        assert!(value == 0 || value == 1, "Initial row must contain only 0s and 1s");
+        current[i / 64] |= (value as u64) << (i % 64);
+    }
+
+    let (column_word, column_bit) = ((column - low) / 64, (column - low) % 64);
+    column_cells[0] = initial_row_slice[column];
+
+    for row in 0..rows - 1 {
+        // Cells of row `row + 1` that still reach the last cell of the column
+        let reach = rows - 2 - row;
+        let (start, stop) = row_bounds(row, columns, boost, central_line);
+        let start = std::cmp::max(start, column.saturating_sub(reach));
+        let stop = std::cmp::min(stop, column + reach + 1);
+
+        if start < stop {
+            let (start, stop) = (start - low, stop - low);
+            let (first, last) = (start / 64, (stop - 1) / 64 + 1);
+
+            let edge = |word: usize| {
+                let center = current[word];
+                let left = center << 1 | if word > 0 { current[word - 1] >> 63 } else { 0 };
+                let right = center >> 1 | if word + 1 < words { current[word + 1] << 63 } else { 0 };
+                evaluate(left, center, right)
+            };
+            next[first] = edge(first);
+            next[last - 1] = edge(last - 1);
+            if last > first + 2 {
+                let interior = next[first + 1..last - 1].iter_mut().zip(current[first..last].windows(3));
+                for (output, window) in interior {
+                    let (previous, center, following) = (window[0], window[1], window[2]);
+                    *output = evaluate(center << 1 | previous >> 63, center, center >> 1 | following << 63);
+                }
+            }
+
+            // Mask the bits outside of the computed span
+            next[first] &= !0u64 << (start % 64);
+            let tail = stop - (last - 1) * 64;
+            if tail < 64 {
+                next[last - 1] &= (1u64 << tail) - 1;
+            }
+        }
+
+        std::mem::swap(&mut current, &mut next);
+        column_cells[row + 1] = (current[column_word] >> column_bit & 1) as u8;
     }
 }
 
 #[no_mangle]
-pub extern "C" fn free_string(ptr: *mut c_char) {
-    // Function to release the memory of a string pointer after transferring to Python-owned memory
-    if !ptr.is_null() {
-        let _ = unsafe { CString::from_raw(ptr) };
+pub extern "C" fn recognize_canvas_lengths(canvas_pointer: *const u8, rows: usize, columns: usize,
+    pattern_lengths: *const usize, lengths_count: usize, boost: bool, central_line: usize,
+    segment_counts_out: *mut u64, parent_segments_out: *mut i32, segment_counts_total_out: *mut usize) {
+    // Recognition at several pattern lengths in one traversal.  Only the windows of the
+    // longest length are counted, with rolling codes zero past the last column; the shorter
+    // lengths take their segments and parents as the leading cells of those windows and are
+    // summed from them at the end.  Starts past the stop of the longest length are recorded
+    // per length as they are met.  Parent tables keep the segment of the last parent seen in
+    // traversal order, matching `recognize_canvas`, by stamping each write with its order.
+    //
+    // The histograms and parent tables of the lengths are laid end to end in the
+    // Python-owned buffers, in the layout of `recognize_canvas`, and the segment count of
+    // each length is written to `segment_counts_total_out`.
+
+    assert!(!canvas_pointer.is_null() && !pattern_lengths.is_null(), "Null pointer passed");
+    assert!(!segment_counts_out.is_null() && !parent_segments_out.is_null()
+        && !segment_counts_total_out.is_null(), "Null output buffer passed");
+
+    let (canvas_slice, lengths, totals) = unsafe {
+        (
+            slice::from_raw_parts(canvas_pointer, rows * columns),
+            slice::from_raw_parts(pattern_lengths, lengths_count),
+            slice::from_raw_parts_mut(segment_counts_total_out, lengths_count),
+        )
+    };
+    assert!(lengths_count > 0 && lengths.iter().all(|&length| length >= 1 && length + 2 < 32),
+        "Pattern lengths must pack into an i32");
+
+    let segment_size: usize = lengths.iter().map(|&length| 1usize << length).sum();
+    let parent_size: usize = lengths.iter().map(|&length| 1usize << (length + 2)).sum();
+    let (segment_counts, parent_segments) = unsafe {
+        (
+            slice::from_raw_parts_mut(segment_counts_out, segment_size),
+            slice::from_raw_parts_mut(parent_segments_out, parent_size),
+        )
+    };
+
+    // Each length as its slices of the laid out buffers
+    let mut tables: Vec<(usize, &mut [u64], &mut [i32])> = Vec::with_capacity(lengths_count);
+    let (mut segment_rest, mut parent_rest) = (segment_counts, parent_segments);
+    for &length in lengths {
+        let (counts, rest) = segment_rest.split_at_mut(1 << length);
+        let (parents, others) = parent_rest.split_at_mut(1 << (length + 2));
+        tables.push((length, counts, parents));
+        segment_rest = rest;
+        parent_rest = others;
+    }
+    totals.fill(0);
+
+    let longest = lengths.iter().copied().max().unwrap();
+    let width = longest + 2;
+    let segment_mask: u64 = (1 << longest) - 1;
+    let parent_mask: u64 = (1 << width) - 1;
+    assert!(((rows * columns) as u64) < 1 << (64 - longest), "Canvas too large to stamp the parents");
+    let cell = |row: &[u8], column: usize| if column < columns { row[column] as u64 } else { 0 };
+
+    let mut longest_counts = vec![0u64; 1 << longest];
+    // Traversal order plus one of the last write of each parent above its segment, 0 where
+    // unseen, so that the latest write of a group of parents is their maximum
+    let mut longest_parents = vec![0u64; 1 << width];
+    // Stamps of the starts past the longest stop, allocated for the lengths that have any
+    let mut length_stamps: Vec<Vec<u64>> = vec![Vec::new(); lengths_count];
+
+    for row in 1..rows {
+        let start = if boost { std::cmp::max(central_line.saturating_sub(row + 2), 1) } else { 1 };
+        let stops: Vec<usize> = lengths.iter().map(|&length| {
+            let default_stop = columns.saturating_sub(length);
+            if boost { std::cmp::min(central_line + row + 2, default_stop) } else { default_stop }
+        }).collect();
+        let common = stops.iter().copied().min().unwrap();
+        let stop = stops.iter().copied().max().unwrap();
+
+        if start >= stop {
+            continue;
+        }
+
+        let current = &canvas_slice[row * columns..(row + 1) * columns];
+        let previous = &canvas_slice[(row - 1) * columns..row * columns];
+
+        // Prime the rolling codes with every cell of the first windows but the last
+        let mut segment: u64 = 0;
+        let mut parent: u64 = 0;
+        for k in 0..longest - 1 {
+            segment = (segment << 1) | cell(current, start + k);
+        }
+        for k in 0..width - 1 {
+            parent = (parent << 1) | cell(previous, start - 1 + k);
+        }
+
+        for column in start..stop {
+            segment = ((segment << 1) | cell(current, column + longest - 1)) & segment_mask;
+            parent = ((parent << 1) | cell(previous, column + width - 2)) & parent_mask;
+            let stamp = (row * columns + column + 1) as u64;
+
+            if column < common {
+                longest_counts[segment as usize] += 1;
+                longest_parents[parent as usize] = stamp << longest | segment;
+                continue;
+            }
+
+            for (index, (length, counts, parents)) in tables.iter_mut().enumerate() {
+                if column >= stops[index] {
+                    continue;
+                }
+                let shift = longest - *length;
+                let (code, parent_code) = ((segment >> shift) as usize, (parent >> shift) as usize);
+                counts[code] += 1;
+                parents[parent_code] = code as i32;
+                if length_stamps[index].is_empty() {
+                    length_stamps[index] = vec![0u64; 1 << (*length + 2)];
+                }
+                length_stamps[index][parent_code] = stamp;
+                totals[index] += 1;
+            }
+        }
+
+        let shared = common.saturating_sub(start);
+        totals.iter_mut().for_each(|total| *total += shared);
+    }
+
+    // Sum the longest windows into every length, longest first, halving the tables a cell
+    // at a time: parents sharing their leading cells are adjacent, so their latest write is
+    // the larger of each pair
+    let mut order: Vec<usize> = (0..lengths_count).collect();
+    order.sort_by_key(|&index| std::cmp::Reverse(lengths[index]));
+
+    let (mut level, mut level_counts, mut level_parents) = (longest, longest_counts, longest_parents);
+    for index in order {
+        let (length, counts, parents) = &mut tables[index];
+        while level > *length {
+            level_counts = level_counts.chunks_exact(2).map(|pair| pair[0] + pair[1]).collect();
+            level_parents = level_parents.chunks_exact(2).map(|pair| std::cmp::max(pair[0], pair[1])).collect();
+            level -= 1;
+        }
+
+        let shift = longest - level;
+        counts.iter_mut().zip(&level_counts).for_each(|(count, &longest_count)| *count += longest_count);
+
+        let stamps = &length_stamps[index];
+        for (parent_code, &latest) in level_parents.iter().enumerate() {
+            let stamp = latest >> longest;
+            if stamp > 0 && stamp > stamps.get(parent_code).copied().unwrap_or(0) {
+                parents[parent_code] = ((latest & segment_mask) >> shift) as i32;
+            }
+        }
     }
 }
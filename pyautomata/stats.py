@@ -6,20 +6,139 @@ from functools import cached_property
 from math import sqrt
 from typing import TYPE_CHECKING
 
+# Third-Party Modules
+from numpy import arange, asarray, concatenate, ndarray, float64
+
 # Local Modules
 if TYPE_CHECKING:
     from pyautomata.classes.canvas import Canvas
 
 # Foreign Function Interfacing and checking
-from pyautomata.handlers import compute_stats, RUST_AVAILABLE
+from pyautomata.handlers import compute_stats, rust_available
+from pyautomata.instrument import phase
 
 # Stats for Sums
 
+def combine_moments(count_a: int, mean_a: float, m2_a: float, count_b: int, mean_b: float,
+                    m2_b: float) -> tuple[int, float, float]:
+    """
+    Pool the count, mean and sum of squared deviations of two runs of values
+    """
+    if count_b == 0:
+        return count_a, mean_a, m2_a
+    if count_a == 0:
+        return count_b, mean_b, m2_b
+
+    count = count_a + count_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * count_b / count
+    m2 = m2_a + m2_b + delta ** 2 * count_a * count_b / count
+    return count, mean, m2
+
+def marginal_increases(sums: ndarray, start: int = 0) -> ndarray:
+    """
+    Marginal increase `row / sum` of each row with a non-zero sum, rows
+    numbered from `start`
+    """
+    sums = asarray(sums)
+    rows = arange(start, start + len(sums))
+    nonzero = sums != 0
+    return rows[nonzero] / sums[nonzero].astype(float64)
+
+
+@dataclass
+class RunningStats:
+    """
+    Welford accumulator of the marginal increases in float64, filled by the
+    generation engines as the rows are produced
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @property
+    def standard_deviation(self) -> float:
+        return sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def update(self, row: int, row_sum: int) -> None:
+        """
+        Add the marginal increase of a single row
+        """
+        if row_sum == 0:
+            return
+        increase = row / row_sum
+        self.count += 1
+        delta = increase - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (increase - self.mean)
+
+    def remove(self, row: int, row_sum: int) -> None:
+        """
+        Take back the marginal increase of a row added before
+        """
+        if row_sum == 0:
+            return
+        increase = row / row_sum
+        if self.count == 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean = (self.count * self.mean - increase) / (self.count - 1)
+        self.m2 -= (increase - mean) * (increase - self.mean)
+        self.count -= 1
+        self.mean = mean
+
+    def update_sums(self, sums: ndarray, start: int = 0) -> None:
+        """
+        Add a block of rows numbered from `start` in one vectorized step
+        """
+        increases = marginal_increases(sums, start)
+        if len(increases) == 0:
+            return
+        mean = float(increases.mean())
+        m2 = float(((increases - mean) ** 2).sum())
+        self.merge(RunningStats(len(increases), mean, m2))
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Pool another accumulator into this one
+        """
+        self.count, self.mean, self.m2 = combine_moments(self.count, self.mean, self.m2,
+                                                         other.count, other.mean, other.m2)
+        return self
+
+
 @dataclass
 class StatsContainer:
-    marginal_sum_increase: list[float]
+    marginal_sum_increase: ndarray
     mean_increase: float
     standard_deviation: float
+    count: int = None
+    m2: float = None
+
+    def __post_init__(self):
+        self.marginal_sum_increase = asarray(self.marginal_sum_increase, float64)
+
+        # Accumulator state for merging partial results
+        if self.count is None:
+            self.count = len(self.marginal_sum_increase)
+        if self.m2 is None:
+            self.m2 = self.standard_deviation ** 2 * self.count
+
+    @classmethod
+    def from_running(cls, running: RunningStats, marginal_sum_increase: ndarray) -> 'StatsContainer':
+        return cls(marginal_sum_increase, running.mean, running.standard_deviation,
+                   running.count, running.m2)
+
+    def merge(self, other: 'StatsContainer') -> 'StatsContainer':
+        """
+        Combine with the stats of the rows that follow, pooling the means and
+        variances without revisiting the marginal increases
+        """
+        count, mean, m2 = combine_moments(self.count, self.mean_increase, self.m2,
+                                          other.count, other.mean_increase, other.m2)
+        marginal_sum_increase = concatenate([self.marginal_sum_increase, other.marginal_sum_increase])
+        return StatsContainer(marginal_sum_increase, mean, sqrt(m2 / count) if count else 0.0,
+                              count, m2)
 
     def offset_increase_standard_deviation(self, factor: int):
         return self.standard_deviation * factor
@@ -35,31 +154,30 @@ class StatsContainer:
 
 def calculate_stats(canvas: 'Canvas') -> StatsContainer:
     """
-    Rust-powered API for calculating stats
+    Stats of a canvas, taken from the running accumulator the engines filled
+    during generation when there is one.  Otherwise the sums are passed over
+    once with Rust, or NumPy when Rust is not available.
     """
-    if RUST_AVAILABLE:
-        results = compute_stats(canvas.sums)
-        return StatsContainer(*results)
-    else:
-        return python_calculate_stats(canvas)
+    with phase('stats', canvas):
+        running = getattr(canvas, 'running_stats', None)
+        if running is not None:
+            return StatsContainer.from_running(running, marginal_increases(canvas.sums))
 
+        if rust_available():
+            return StatsContainer(*compute_stats(canvas.sums))
+        else:
+            return python_calculate_stats(canvas)
 
-def python_calculate_stats(canvas: 'Canvas') -> StatsContainer:
+def calculate_continued_stats(sums: ndarray, start: int = 0) -> StatsContainer:
     """
-    Native Python API for calculating stats if Rust is not available
+    Stats of the sums of rows continuing a canvas from row `start`
     """
-    marginal_sum_increase = []
-    total_sum_increase = 0
-
-    for i, sum_value in enumerate(canvas.sums):
-        if sum_value != 0:
-            increase = i / sum_value
-            marginal_sum_increase.append(increase)
-            total_sum_increase += increase
-
-    mean_increase = total_sum_increase / len(marginal_sum_increase)
-
-    variance_sum = sum((x - mean_increase) ** 2 for x in marginal_sum_increase)
-    standard_deviation = sqrt(variance_sum / len(marginal_sum_increase))
+    running = RunningStats()
+    running.update_sums(sums, start)
+    return StatsContainer.from_running(running, marginal_increases(sums, start))
 
-    return StatsContainer(marginal_sum_increase, mean_increase, standard_deviation)
\ No newline at end of file
+def python_calculate_stats(canvas: 'Canvas') -> StatsContainer:
+    """
+    Native API for calculating stats if Rust is not available
+    """
+    return calculate_continued_stats(canvas.sums)
@@ -0,0 +1,112 @@
+# Project PyAutomata Sweep Module
+
+# Python Modules
+from dataclasses import dataclass
+import os
+from typing import Iterable
+
+# Third-Party Modules
+from numpy import array, ndarray, stack
+
+# Local Modules
+from pyautomata.classes.canvas import Canvas
+from pyautomata.classes.general import Engine, Pattern
+from pyautomata.handlers.cycles import Cycle
+from pyautomata.stats import StatsContainer
+
+# The 255 elementary rules a canvas can be built for.  Rule 0 is left out
+# as canvases reject it: it blanks every row after the first.
+NONZERO_RULES = range(1, 256)
+
+@dataclass
+class SweepResult:
+    rules: list[int]
+    rows: int
+    pattern: Pattern
+    sums: ndarray
+    stats: list[StatsContainer]
+    canvases: ndarray = None
+    cycles: list[Cycle] = None
+
+    @property
+    def mean_increase(self) -> ndarray:
+        return array([stats.mean_increase for stats in self.stats])
+
+    @property
+    def standard_deviation(self) -> ndarray:
+        return array([stats.standard_deviation for stats in self.stats])
+
+    def index(self, rule: int) -> int:
+        """
+        Row of `sums`, `stats` and `canvases` holding the supplied rule
+        """
+        return self.rules.index(rule)
+
+
+def sweep_rules(rules: list[int], rows: int, pattern: Pattern, engine: Engine | str = None,
+                keep_canvases: bool = False,
+                detect_cycles: bool = False) -> list[tuple[ndarray, StatsContainer, ndarray, Cycle]]:
+    """
+    Worker procedure generating a batch of rules serially.  Only the canvas
+    sums travel back unless the canvases are kept.
+    """
+    results = []
+    for rule in rules:
+        canvas = Canvas(rule, rows, pattern, engine=engine, sums_only=not keep_canvases,
+                        detect_cycles=detect_cycles)
+        results.append((canvas.sums, canvas.stats, canvas.result, canvas.cycle))
+    return results
+
+def sweep(rules: Iterable[int] = NONZERO_RULES, rows: int | Iterable[int] = 100,
+          pattern: Pattern | str = Pattern.STANDARD, engine: Engine | str = None,
+          workers: int = None, keep_canvases: bool = False,
+          detect_cycles: bool = False) -> SweepResult | dict[int, SweepResult]:
+    """
+    Generate many rules at once across a process pool, returning the stacked
+    `rules x rows` sums, the per-rule stats and optionally the canvases.
+    Rules are batched per task so the process and rule table setup is paid
+    once per batch.  Several sizes may be passed as `rows`, in which case a
+    result is returned for each size.  With `detect_cycles` the rules that
+    settle into a cycle stop generating once it is found, and the cycles are
+    returned per rule.  Every rule but 0 is swept by default.
+    """
+    if not isinstance(rows, int):
+        return {size: sweep(rules, size, pattern, engine, workers, keep_canvases, detect_cycles)
+                for size in rows}
+
+    rules = list(rules)
+    pattern = pattern if isinstance(pattern, Pattern) else Pattern.from_string(pattern)
+    workers = os.cpu_count() if workers is None else workers
+
+    # Several batches per worker keep the pool balanced across fast and slow rules
+    batch_count = min(len(rules), max(1, workers * 4))
+    batches = [rules[i::batch_count] for i in range(batch_count)]
+
+    if workers <= 1:
+        batch_results = [sweep_rules(batch, rows, pattern, engine, keep_canvases, detect_cycles)
+                         for batch in batches]
+    else:
+        # Imported here as it pulls in multiprocessing, which plain imports do not need
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(sweep_rules, batch, rows, pattern, engine, keep_canvases,
+                                       detect_cycles)
+                       for batch in batches]
+            batch_results = [future.result() for future in futures]
+
+    # Restore the order of the requested rules from the interleaved batches
+    by_rule = {}
+    for batch, results in zip(batches, batch_results):
+        by_rule.update(zip(batch, results))
+    ordered = [by_rule[rule] for rule in rules]
+
+    return SweepResult(
+        rules=rules,
+        rows=rows,
+        pattern=pattern,
+        sums=stack([sums for sums, _, _, _ in ordered]),
+        stats=[stats for _, stats, _, _ in ordered],
+        canvases=stack([canvas for _, _, canvas, _ in ordered]) if keep_canvases else None,
+        cycles=[cycle for _, _, _, cycle in ordered] if detect_cycles else None,
+    )
@@ -0,0 +1,88 @@
+# Project PyAutomata Batch Tests
+
+# Python Modules
+from contextlib import redirect_stdout
+from io import StringIO
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal
+
+# Local Modules
+from pyautomata import BatchSpec, BatchStore, Canvas, Pattern, Recognizer, run_batch
+from pyautomata.batch import main as batch_main, parse_size
+
+class BatchTestCase(TestCase):
+    def test_store(self):
+        spec = BatchSpec(rules=[30, 90, 137], sizes=[40, 80], patterns=[Pattern.STANDARD, Pattern.RANDOM],
+                         analyses=('recognition', 'stats'), pattern_length=4, seed=7)
+        with TemporaryDirectory() as directory:
+            store = run_batch(spec, directory, workers=1, shard_jobs=5)
+            self.assertEqual(len(store), 12)
+            self.assertEqual(len(os.listdir(os.path.join(directory, 'shards'))), 3)
+
+            store = BatchStore(directory)
+            for job in spec.jobs():
+                result = store.load(job)
+                canvas = Canvas(job.rule, job.rows, job.pattern, seed=7)
+                recognizer = Recognizer(job.rule, canvas.result, job.pattern, 4)
+                self.assertTrue(array_equal(result['sums'], canvas.sums))
+                self.assertAlmostEqual(result['mean_increase'], canvas.stats.mean_increase)
+                self.assertAlmostEqual(result['standard_deviation'], canvas.stats.standard_deviation)
+                self.assertTrue(array_equal(result['segment_counts'], recognizer.segment_counts))
+                self.assertTrue(array_equal(result['parent_segments'], recognizer.parent_segments))
+                self.assertEqual(result['segment_count'], recognizer.segment_count)
+
+    def test_resume(self):
+        spec = BatchSpec(rules=[30, 90, 110], sizes=[50])
+        with TemporaryDirectory() as directory:
+            run_batch(spec, directory, workers=1)
+
+            # A crash part way through writing the last line of the index
+            index_path = os.path.join(directory, 'index.jsonl')
+            with open(index_path) as file:
+                lines = file.readlines()
+            with open(index_path, 'w') as file:
+                file.writelines(lines[:-1] + [lines[-1][:20]])
+
+            ran = []
+            store = run_batch(spec, directory, workers=1, progress=lambda job, _: ran.append(job.key))
+            self.assertEqual(len(ran), 1)
+            self.assertEqual(len(store), 3)
+            self.assertTrue(all(len(store.load(job)['sums']) == 50 for job in spec.jobs()))
+
+            ran = []
+            run_batch(spec, directory, workers=1, progress=lambda job, _: ran.append(job.key))
+            self.assertEqual(ran, [])
+
+    def test_command_line(self):
+        arguments = ['--rules', '30', '90', '--sizes', '30', '--analyses', 'stats', 'render',
+                     '--workers', '2', '--memory-limit', '1G', '--quiet']
+        with TemporaryDirectory() as directory:
+            self.assertEqual(batch_main(arguments + ['--output', directory]), 0)
+            store = BatchStore(directory)
+            self.assertEqual(len(store), 2)
+            for job in BatchSpec(rules=[30, 90], sizes=[30], analyses=('stats', 'render')).jobs():
+                self.assertTrue(os.path.exists(os.path.join(directory, store.load(job)['render'])))
+
+            output = StringIO()
+            with redirect_stdout(output):
+                batch_main(arguments[:-1] + ['--output', directory])
+            self.assertEqual(output.getvalue(), '')
+
+    def test_validation(self):
+        for data in [{'rules': [0]}, {'analyses': ['plot']}, {'sizes': [0]}, {'workers': 2}]:
+            with self.assertRaises(ValueError):
+                BatchSpec.from_dict(data)
+        self.assertEqual(len(BatchSpec.from_dict({'rules': 'all'}).jobs()), 255)
+
+        self.assertEqual(parse_size('512M'), 512 << 20)
+        self.assertEqual(parse_size('2G'), 2 << 30)
+        with self.assertRaises(ValueError):
+            parse_size('lots')
+
+
+if __name__ == '__main__':
+    main()
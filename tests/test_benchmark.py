@@ -0,0 +1,78 @@
+# Project PyAutomata Benchmark Tests
+
+# Python Modules
+from contextlib import redirect_stdout
+from copy import deepcopy
+from io import StringIO
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from pyautomata import Canvas, Engine, Pattern
+from pyautomata.handlers import BenchmarkReport, compare_benchmarks, rust_available, run_benchmarks
+from pyautomata.handlers.benchmark import (
+    STAGES, BenchmarkCase, benchmark_cases, main as benchmark_main, prepare_stats
+)
+
+class BenchmarkTestCase(TestCase):
+    def test_cases(self):
+        cases = benchmark_cases(sizes=(20,), rules=(30,))
+        stages = {case.stage for case in cases}
+        self.assertEqual(stages, set(STAGES) if rust_available() else set(STAGES) - {'ffi'})
+        self.assertEqual(len({case.key for case in cases}), len(cases))
+        self.assertEqual([case.engine for case in cases if case.stage == 'render'], [None])
+
+        # Import time is measured once whatever the parameters
+        cases = benchmark_cases(stages=('import',), sizes=(20, 40), rules=(30, 90))
+        self.assertEqual([case.key for case in cases], ['import/any/standard/0/0'])
+
+        with self.assertRaises(ValueError):
+            benchmark_cases(stages=('plot',))
+
+    def test_stats_engines(self):
+        expected = Canvas(30, 200).stats
+        for engine in [Engine.PYTHON, Engine.NUMPY]:
+            stats = prepare_stats(BenchmarkCase('stats', engine, Pattern.STANDARD, 30, 200))()
+            self.assertAlmostEqual(stats.mean_increase, expected.mean_increase)
+            self.assertAlmostEqual(stats.standard_deviation, expected.standard_deviation)
+
+    def test_report(self):
+        report = run_benchmarks(benchmark_cases(engines=(Engine.NUMPY,), sizes=(20,), rules=(30,)),
+                                repeats=1)
+        self.assertTrue(all(result.seconds > 0 and result.peak_bytes > 0 for result in report.results))
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            report.save(path)
+            loaded = BenchmarkReport.load(path)
+        self.assertEqual(loaded.results, report.results)
+        self.assertEqual(compare_benchmarks(report, loaded), [])
+
+        slower = deepcopy(report)
+        slower.results[0].seconds += 1
+        slower.results[1].peak_bytes *= 2
+        regressions = compare_benchmarks(slower, report)
+        self.assertEqual([(regression.key, regression.metric) for regression in regressions],
+                         [(report.results[0].case.key, 'seconds'),
+                          (report.results[1].case.key, 'peak_bytes')])
+
+    def test_command_line(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            arguments = ['--stages', 'generate', '--engines', 'numpy', '--sizes', '20',
+                         '--rules', '30', '--repeats', '1']
+            with redirect_stdout(StringIO()) as output:
+                self.assertEqual(benchmark_main(arguments + ['--output', path]), 0)
+            self.assertIn('generate/numpy/standard/30/20', output.getvalue())
+
+            report = BenchmarkReport.load(path)
+            report.results[0].peak_bytes = 1
+            report.save(path)
+            with redirect_stdout(StringIO()) as output:
+                self.assertEqual(benchmark_main(arguments + ['--baseline', path, '--quiet']), 1)
+            self.assertIn('REGRESSION', output.getvalue())
+
+
+if __name__ == '__main__':
+    main()
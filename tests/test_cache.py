@@ -0,0 +1,86 @@
+# Project PyAutomata Cache Tests
+
+# Python Modules
+from os import listdir
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal
+
+# Local Modules
+from pyautomata import Canvas, CanvasCache, Pattern
+
+class CacheTestCase(TestCase):
+    def test_hits_and_misses(self):
+        cache = CanvasCache()
+        first = cache.canvas(30, 50)
+        second = cache.canvas(30, 50)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertTrue(array_equal(first.result, second.result))
+        self.assertFalse(second.result.flags.writeable)
+
+        cache.canvas(90, 50)
+        cache.canvas(30, 50, Pattern.LEFT)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_slicing(self):
+        for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RIGHT, Pattern.ALTERNATING]:
+            for rule in [1, 30, 110]:
+                cache = CanvasCache()
+                cache.canvas(rule, 80, pattern)
+                sliced = cache.canvas(rule, 33, pattern)
+                expected = Canvas(rule, 33, pattern)
+                self.assertTrue(array_equal(sliced.result, expected.result))
+                self.assertTrue(array_equal(sliced.sums, expected.sums))
+                self.assertAlmostEqual(sliced.stats.standard_deviation, expected.stats.standard_deviation)
+
+                # Only single cell patterns can be cut from a larger canvas
+                self.assertEqual(cache.hits, 1 if pattern is not Pattern.ALTERNATING else 0)
+
+        # Rule 7 grows cells left of where a smaller right-hand canvas starts
+        cache = CanvasCache()
+        cache.canvas(7, 50, Pattern.RIGHT)
+        sliced = cache.canvas(7, 5, Pattern.RIGHT)
+        self.assertTrue(array_equal(sliced.sums, Canvas(7, 5, Pattern.RIGHT).sums))
+        self.assertEqual(cache.hits, 1)
+
+    def test_memory_eviction(self):
+        cache = CanvasCache(memory_budget=3 * 40 * 80 + 3 * 40 * 4)
+        for rule in [1, 2, 3, 4]:
+            cache.canvas(rule, 40)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.memory_bytes, cache.memory_budget)
+
+        cache.canvas(1, 40)
+        self.assertEqual(cache.misses, 5)
+
+    def test_disk_tier(self):
+        with TemporaryDirectory() as directory:
+            cache = CanvasCache(memory_budget=0, directory=directory)
+            expected = cache.canvas(30, 60)
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(len(listdir(directory)), 1)
+
+            fresh = CanvasCache(directory=directory)
+            canvas = fresh.canvas(30, 40)
+            self.assertEqual((fresh.hits, fresh.disk_hits), (1, 1))
+            self.assertTrue(array_equal(canvas.result, expected.result[:40, 20:100]))
+
+            bounded = CanvasCache(memory_budget=0, directory=directory, disk_budget=1)
+            bounded.canvas(90, 20)
+            self.assertEqual(len(listdir(directory)), 0)
+            self.assertEqual(bounded.info().disk_bytes, 0)
+
+
+    def test_extend_cached_sums(self):
+        cache = CanvasCache()
+        cache.canvas(30, 80)
+        canvas = cache.canvas(30, 50, sums_only=True)
+        self.assertEqual(cache.hits, 1)
+        canvas.extend(30)
+        self.assertTrue(array_equal(canvas.sums, Canvas(30, 80).sums))
+
+if __name__ == '__main__':
+    main()
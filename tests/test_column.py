@@ -0,0 +1,41 @@
+# Project PyAutomata Column Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal, packbits
+
+# Local Modules
+from pyautomata import Canvas, Engine, Pattern, center_column
+from pyautomata.handlers import rust_available
+
+class ColumnTestCase(TestCase):
+    def test_matches_canvas(self):
+        engines = [Engine.NUMPY, Engine.RUST] if rust_available() else [Engine.NUMPY]
+        for engine in engines:
+            for pattern in Pattern:
+                for rule in [30, 45, 90, 110, 137]:
+                    canvas = Canvas(rule, 150, pattern, seed=7)
+                    for column in [0, 37, canvas.columns // 2, canvas.columns - 1]:
+                        self.assertTrue(array_equal(
+                            center_column(rule, 150, pattern, column, engine, seed=7),
+                            canvas.result[:, column]))
+
+    def test_default_column(self):
+        canvas = Canvas(30, 200)
+        bits = center_column(30, 200)
+        self.assertTrue(array_equal(bits, canvas.result[:, canvas.columns // 2]))
+        self.assertEqual(center_column(30, 200, as_bytes=True), packbits(bits).tobytes())
+
+        right = Canvas(30, 64, Pattern.RIGHT)
+        self.assertTrue(array_equal(center_column(30, 64, Pattern.RIGHT), right.result[:, -1]))
+
+    def test_invalid_column(self):
+        for column in [-1, 200]:
+            with self.assertRaises(ValueError):
+                center_column(30, 100, column=column)
+
+
+if __name__ == '__main__':
+    main()
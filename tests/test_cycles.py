@@ -0,0 +1,57 @@
+# Project PyAutomata Cycle Detection Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal
+
+# Local Modules
+from pyautomata import Canvas, Cycle, Engine, Pattern, sweep
+from pyautomata.handlers import rust_available
+
+class CycleTestCase(TestCase):
+    def test_detected_cycles(self):
+        cases = [
+            (4, Pattern.STANDARD, Cycle(0, 1, 0)),
+            (2, Pattern.STANDARD, Cycle(0, 1, -1)),
+            (16, Pattern.LEFT, Cycle(1, 1, 1)),
+            (51, Pattern.ALTERNATING, Cycle(0, 2, 0)),
+            (30, Pattern.STANDARD, None),
+        ]
+        for rule, pattern, cycle in cases:
+            canvas = Canvas(rule, 80, pattern, detect_cycles=True)
+            self.assertEqual(canvas.cycle, cycle)
+            self.assertIsNone(Canvas(rule, 80, pattern).cycle)
+
+    def test_matches_generation(self):
+        engines = [Engine.NUMPY, Engine.RUST] if rust_available() else [Engine.NUMPY]
+        for engine in engines:
+            for pattern in Pattern:
+                for rule in range(1, 256):
+                    expected = Canvas(rule, 90, pattern, engine=engine, seed=7)
+                    canvas = Canvas(rule, 90, pattern, engine=engine, seed=7, detect_cycles=True)
+                    streamed = Canvas(rule, 90, pattern, engine=engine, seed=7, sums_only=True,
+                                      detect_cycles=True)
+
+                    self.assertTrue(array_equal(canvas.result, expected.result))
+                    self.assertTrue(array_equal(canvas.sums, expected.sums))
+                    self.assertTrue(array_equal(streamed.sums, expected.sums))
+                    self.assertTrue(array_equal(streamed.last_rows, expected.result[-2:]))
+                    self.assertEqual(streamed.cycle, canvas.cycle)
+                    self.assertAlmostEqual(canvas.stats.standard_deviation,
+                                           expected.stats.standard_deviation)
+
+    def test_extend_after_cycle(self):
+        canvas = Canvas(2, 50, sums_only=True, detect_cycles=True)
+        canvas.extend(30)
+        self.assertTrue(array_equal(canvas.sums, Canvas(2, 80).sums))
+
+    def test_sweep_cycles(self):
+        result = sweep([4, 30], 60, workers=1, detect_cycles=True)
+        self.assertEqual(result.cycles, [Cycle(0, 1, 0), None])
+        self.assertIsNone(sweep([4], 60, workers=1).cycles)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# Project PyAutomata Ensemble Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal
+
+# Local Modules
+from pyautomata import Canvas, Engine, Pattern, ensemble
+
+class EnsembleTestCase(TestCase):
+    def test_members_match_canvases(self):
+        for engine in [Engine.NUMPY, Engine.RUST]:
+            for rule in [30, 90, 110]:
+                result = ensemble(rule, 40, 6, seed=7, engine=engine)
+                self.assertEqual(result.canvases.shape, (6, 40, 80))
+
+                for member in range(result.size):
+                    canvas = Canvas(rule, 40, Pattern.RANDOM, generate=False, engine=Engine.NUMPY)
+                    expected, sums = canvas.generate_rows(result.initial_rows[member], 40, Engine.NUMPY)
+                    self.assertTrue(array_equal(result.canvases[member], expected))
+                    self.assertTrue(array_equal(result.sums[member], sums))
+
+                    canvas.sums = sums
+                    self.assertAlmostEqual(result.mean_increase[member], canvas.stats.mean_increase, places=4)
+                    self.assertAlmostEqual(result.standard_deviation[member],
+                                           canvas.stats.standard_deviation, places=4)
+
+    def test_seeding(self):
+        first = ensemble(30, 50, 20, seed=3, sums_only=True)
+        second = ensemble(30, 50, 20, seed=3, engine=Engine.NUMPY)
+        self.assertIsNone(first.canvases)
+        self.assertTrue(array_equal(first.initial_rows, second.initial_rows))
+        self.assertTrue(array_equal(first.sums, second.sums))
+        self.assertFalse(array_equal(first.sums, ensemble(30, 50, 20, seed=4, sums_only=True).sums))
+
+        canvas = Canvas(30, 50, Pattern.RANDOM, seed=3)
+        self.assertTrue(array_equal(canvas.result, Canvas(30, 50, Pattern.RANDOM, seed=3).result))
+        self.assertTrue(array_equal(canvas.result[0], ensemble(30, 50, 1, seed=3).initial_rows[0]))
+
+    def test_invalid_rule(self):
+        for bad_case in [0, 257, '30']:
+            with self.assertRaises(ValueError):
+                ensemble(bad_case, 10, 2)
+
+
+if __name__ == '__main__':
+    main()
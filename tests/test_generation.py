@@ -1,14 +1,16 @@
 # PyAutomata Classes Tests
 
 # Python Modules
+from os import path
 from unittest import TestCase, main
 
 # Third-Party Modules
-from numpy import array_equal
+from numpy import array, array_equal, asarray, memmap, ones, uint8, vstack
 
 # Local Modules
 from tests.common import PATTERN_TEST_MAP
-from pyautomata.classes import Canvas, Pattern
+from pyautomata.classes import Canvas, Engine, LightConeCanvas, PackedCanvas, Pattern, Recognizer
+from pyautomata.handlers.lightcone import LightConeArray
 
 class GenerationTestCase(TestCase):
     """
@@ -16,14 +18,14 @@ class GenerationTestCase(TestCase):
     """
     def check_canvas_array(self, input_pattern: str|Pattern,
                            matching_pattern: str|Pattern = None,
-                           force_python: bool = False) -> bool:
+                           force_python: bool = False, engine: Engine = None) -> bool:
         """
         Method to generate and return test canvases for evaluation
         """
         if matching_pattern is None:
             matching_pattern = PATTERN_TEST_MAP.get(input_pattern)
             
-        result = Canvas(30, 5, input_pattern, force_python).result
+        result = Canvas(30, 5, input_pattern, force_python, engine=engine).result
 
         if not array_equal(result, matching_pattern):
             if result.shape != matching_pattern.shape:
@@ -71,6 +73,184 @@ class GenerationTestCase(TestCase):
         test_result = self.check_canvas_array(Pattern.ALTERNATING, force_python=True)
         self.assertEqual(test_result, True)
 
+    def test_numpy_generation_standard(self):
+        test_result = self.check_canvas_array(Pattern.STANDARD, engine=Engine.NUMPY)
+        self.assertEqual(test_result, True)
+
+    def test_numpy_generation_right(self):
+        for test_case in [Pattern.RIGHT, 'right']:
+            test_result = self.check_canvas_array(test_case, engine='numpy')
+            self.assertEqual(test_result, True)
+
+    def test_numpy_generation_alternating(self):
+        test_result = self.check_canvas_array(Pattern.ALTERNATING, engine=Engine.NUMPY)
+        self.assertEqual(test_result, True)
+
+    def test_engines_agree(self):
+        for rule in [1, 30, 90, 110, 255]:
+            for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.ALTERNATING]:
+                python_canvas = Canvas(rule, 20, pattern, engine=Engine.PYTHON)
+                numpy_canvas = Canvas(rule, 20, pattern, engine=Engine.NUMPY)
+                self.assertTrue(array_equal(python_canvas.result, numpy_canvas.result))
+                self.assertTrue(array_equal(python_canvas.sums, numpy_canvas.sums))
+                self.assertTrue(array_equal(numpy_canvas.sums, numpy_canvas.result.sum(axis=1)))
+
+    def test_packed_generation(self):
+        for pattern, expected in PATTERN_TEST_MAP.items():
+            self.assertTrue(array_equal(PackedCanvas(30, 5, pattern).result, expected))
+
+        # Span more than one word so carries between words are exercised
+        for rule in [1, 30, 110, 225]:
+            for pattern in [Pattern.STANDARD, Pattern.RIGHT, Pattern.ALTERNATING]:
+                canvas = Canvas(rule, 100, pattern, engine=Engine.NUMPY)
+                packed_canvas = PackedCanvas(rule, 100, pattern)
+                self.assertTrue(array_equal(canvas.result, packed_canvas.result))
+                self.assertTrue(array_equal(canvas.sums, packed_canvas.sums))
+
+        # The keywords of Canvas are forwarded, including those that generate as uint8
+        seeded = PackedCanvas(30, 100, Pattern.RANDOM, seed=1)
+        self.assertTrue(array_equal(seeded.result, Canvas(30, 100, Pattern.RANDOM, seed=1).result))
+        self.assertTrue(array_equal(PackedCanvas(30, 100, Pattern.RANDOM, seed=1).packed, seeded.packed))
+        recognizing = PackedCanvas(30, 100, recognize=5)
+        expected = Canvas(30, 100)
+        self.assertTrue(array_equal(recognizing.result, expected.result))
+        self.assertEqual(recognizing.recognizer.pattern_rules, Recognizer(30, expected.result).pattern_rules)
+
+    def test_iter_rows(self):
+        for engine in [Engine.PYTHON, Engine.NUMPY, Engine.RUST]:
+            for pattern in [Pattern.STANDARD, Pattern.RIGHT, Pattern.ALTERNATING]:
+                canvas = Canvas(30, 40, pattern, engine=engine)
+                self.assertTrue(array_equal(array(list(canvas.iter_rows())), canvas.result))
+                chunks = list(canvas.iter_rows(chunk_size=7))
+                self.assertEqual(len(chunks), 6)
+                self.assertTrue(array_equal(vstack(chunks), canvas.result))
+
+    def test_sums_only(self):
+        for rule in [1, 30, 110]:
+            canvas = Canvas(rule, 600)
+            sums_canvas = Canvas(rule, 600, sums_only=True)
+            self.assertIsNone(sums_canvas.result)
+            self.assertTrue(array_equal(canvas.sums, sums_canvas.sums))
+            self.assertTrue(array_equal(canvas.stats.marginal_sum_increase,
+                                        sums_canvas.stats.marginal_sum_increase))
+            self.assertEqual(canvas.stats.standard_deviation, sums_canvas.stats.standard_deviation)
+
+    def test_memory_budget_spill(self):
+        for engine in [Engine.NUMPY, Engine.RUST]:
+            canvas = Canvas(30, 300, engine=engine)
+            spilled = Canvas(30, 300, engine=engine, memory_budget=1024)
+            self.assertIsInstance(spilled.result, memmap)
+            self.assertTrue(path.exists(spilled.spill_path))
+            self.assertTrue(array_equal(canvas.result, spilled.result))
+            self.assertTrue(array_equal(canvas.sums, spilled.sums))
+
+            spill_path = spilled.spill_path
+            del spilled
+            self.assertFalse(path.exists(spill_path))
+
+        packed_canvas = PackedCanvas(30, 300, memory_budget=1024)
+        self.assertIsInstance(packed_canvas.packed, memmap)
+        self.assertTrue(array_equal(canvas.result, packed_canvas.result))
+
+    def test_supplied_buffer(self):
+        buffer = ones((50, 100), uint8)
+        canvas = Canvas(30, 50, buffer=buffer)
+        self.assertIs(canvas.result, buffer)
+        self.assertTrue(array_equal(canvas.result, Canvas(30, 50).result))
+
+        with self.assertRaises(ValueError):
+            Canvas(30, 40, buffer=buffer)
+
+    def test_parallel_generation(self):
+        for engine in [Engine.NUMPY, Engine.RUST]:
+            for rule in [1, 30, 110, 225]:
+                for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.ALTERNATING]:
+                    canvas = Canvas(rule, 150, pattern, engine=engine)
+                    for threads in [2, 3, 8]:
+                        tiled = Canvas(rule, 150, pattern, engine=engine, threads=threads)
+                        self.assertTrue(array_equal(canvas.result, tiled.result))
+                        self.assertTrue(array_equal(canvas.sums, tiled.sums))
+
+    def test_light_cone_storage(self):
+        for pattern, expected in PATTERN_TEST_MAP.items():
+            if pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RIGHT]:
+                self.assertTrue(array_equal(asarray(LightConeCanvas(30, 5, pattern).result), expected))
+
+        for rule in [1, 30, 110, 225]:
+            for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RIGHT]:
+                canvas = Canvas(rule, 120, pattern, engine=Engine.NUMPY)
+                cone = LightConeCanvas(rule, 120, pattern)
+                self.assertTrue(array_equal(canvas.result, asarray(cone.result)))
+                self.assertTrue(array_equal(canvas.sums, cone.sums))
+                self.assertTrue(array_equal(canvas.result[7], cone.result[7]))
+                self.assertTrue(array_equal(canvas.result[5:90:3, 10:200:7], cone.result[5:90:3, 10:200:7]))
+
+        cone = LightConeCanvas(30, 200)
+        self.assertLess(cone.nbytes, 0.51 * Canvas(30, 200).result.nbytes)
+        self.assertEqual(cone.nbytes, cone.estimate_footprint() - 200 * 4)
+
+        self.assertTrue(array_equal(LightConeCanvas(30, 200, sums_only=True, seed=1, detect_cycles=True).sums,
+                                    cone.sums))
+
+        with self.assertRaises(ValueError):
+            LightConeCanvas(30, 10, Pattern.RANDOM)
+        with self.assertRaises(ValueError):
+            LightConeCanvas(30, 10, recognize=5)
+
+    def test_extend(self):
+        for engine in [Engine.PYTHON, Engine.NUMPY, Engine.RUST]:
+            for rule in [1, 30, 110]:
+                for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RIGHT]:
+                    canvas = Canvas(rule, 30, pattern, engine=engine)
+                    canvas.extend(25)
+                    canvas.extend(1)
+                    expected = Canvas(rule, 56, pattern, engine=engine)
+                    self.assertEqual(canvas.result.shape, expected.result.shape)
+                    self.assertTrue(array_equal(canvas.result, expected.result))
+                    self.assertTrue(array_equal(canvas.sums, expected.sums))
+                    self.assertAlmostEqual(canvas.stats.mean_increase,
+                                           expected.stats.mean_increase, places=4)
+                    self.assertAlmostEqual(canvas.stats.standard_deviation,
+                                           expected.stats.standard_deviation, places=4)
+
+        # Other patterns keep their width and continue the same rows
+        canvas = Canvas(30, 40, Pattern.ALTERNATING)
+        canvas.extend(20)
+        expected = Canvas(30, 60, Pattern.ALTERNATING, generate=False)
+        expected.columns = 80
+        expected.generate(Pattern.ALTERNATING)
+        self.assertTrue(array_equal(canvas.result, expected.result))
+
+        sums_canvas = Canvas(30, 300, sums_only=True)
+        sums_canvas.extend(400)
+        self.assertIsNone(sums_canvas.result)
+        self.assertTrue(array_equal(sums_canvas.sums, Canvas(30, 700).sums))
+
+        with self.assertRaises(ValueError):
+            canvas.extend(0)
+
+    def test_extend_storage(self):
+        for rule in [1, 30, 110]:
+            for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RIGHT]:
+                expected = Canvas(rule, 76, pattern)
+
+                packed = PackedCanvas(rule, 40, pattern)
+                packed.extend(35)
+                packed.extend(1)
+                self.assertEqual(packed.packed.shape, (76, -(-expected.columns // 64)))
+                self.assertTrue(array_equal(packed.result, expected.result))
+                self.assertTrue(array_equal(packed.sums, expected.sums))
+
+                cone = LightConeCanvas(rule, 40, pattern)
+                cone.extend(35)
+                cone.extend(1)
+                self.assertIsInstance(cone.result, LightConeArray)
+                self.assertEqual(cone.nbytes, cone.cell_count())
+                self.assertTrue(array_equal(asarray(cone.result), expected.result))
+                self.assertTrue(array_equal(cone.sums, expected.sums))
+                self.assertAlmostEqual(cone.stats.mean_increase, expected.stats.mean_increase,
+                                       places=4)
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
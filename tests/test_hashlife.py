@@ -0,0 +1,61 @@
+# Project PyAutomata HashLife Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal
+
+# Local Modules
+from pyautomata import Canvas, HashLife
+
+class HashLifeTestCase(TestCase):
+    def test_matches_canvas(self):
+        rows = 300
+        for rule in [2, 4, 18, 30, 90, 110, 150, 184]:
+            canvas = Canvas(rule, rows)
+            hashlife = HashLife(rule)
+            for generation in [0, 1, 5, 63, 64, 65, 128, 200, 299, 100]:
+                self.assertTrue(array_equal(
+                    hashlife.row(generation),
+                    canvas.result[generation, rows-generation:rows+generation+1]))
+                self.assertEqual(hashlife.row_sum(generation), canvas.sums[generation])
+
+            self.assertTrue(array_equal(hashlife.cells(250, -10, 20),
+                                        canvas.result[250, rows-10:rows+20]))
+
+    def test_deep_jump(self):
+        # Rule 90 from one cell has 2**popcount(n) live cells at generation n
+        hashlife = HashLife(90)
+        for generation in [10**6, 10**9, 10**12]:
+            self.assertEqual(hashlife.row_sum(generation), 2 ** bin(generation).count('1'))
+        self.assertEqual(hashlife.cells(2**40, 2**40 - 2, 2**40 + 2).tolist(), [0, 0, 1, 0])
+
+    def test_collection(self):
+        canvas = Canvas(30, 400)
+        hashlife = HashLife(30, max_nodes=200)
+        for generation in range(0, 400, 37):
+            self.assertEqual(hashlife.row_sum(generation), canvas.sums[generation])
+            self.assertLessEqual(hashlife.node_count, 4 * 400)
+
+        # A single deep jump of a chaotic rule is collected part way through
+        hashlife = HashLife(30, max_nodes=200)
+        peak, join = 0, hashlife.join
+        def tracked_join(left, right):
+            nonlocal peak
+            peak = max(peak, hashlife.node_count)
+            return join(left, right)
+        hashlife.join = tracked_join
+        self.assertEqual(hashlife.row_sum(2048), Canvas(30, 2049, sums_only=True).sums[2048])
+        self.assertLessEqual(peak, 400)
+
+    def test_rules(self):
+        for rule in [1, 31, 255, 0, 257, '30']:
+            with self.assertRaises(ValueError):
+                HashLife(rule)
+        with self.assertRaises(ValueError):
+            HashLife(30).advance(-1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+# Project PyAutomata Import Tests
+
+# Python Modules
+import subprocess
+import sys
+from unittest import TestCase, main
+
+class ImportTestCase(TestCase):
+    def loaded_after(self, code: str) -> list[bool]:
+        """
+        Run `code` in a fresh interpreter and report whether matplotlib,
+        multiprocessing, the batch runner and the Rust library were loaded by it
+        """
+        probe = (f'{code}\n'
+                 'import sys\n'
+                 'from pyautomata.handlers.rust import get_library\n'
+                 "print('matplotlib' in sys.modules, 'multiprocessing' in sys.modules,\n"
+                 "      'pyautomata.batch' in sys.modules,\n"
+                 '      get_library.cache_info().currsize > 0)')
+        output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                                check=True).stdout
+        return [value == 'True' for value in output.split()]
+
+    def test_lazy_import(self):
+        self.assertEqual(self.loaded_after('import pyautomata'), [False, False, False, False])
+
+        # Sums only workers never need the plotting stack
+        matplotlib, _, _, _ = self.loaded_after('import pyautomata\n'
+                                             'pyautomata.Canvas(30, 50, sums_only=True).stats')
+        self.assertFalse(matplotlib)
+
+
+if __name__ == '__main__':
+    main()
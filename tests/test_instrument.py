@@ -0,0 +1,56 @@
+# Project PyAutomata Instrumentation Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Local Modules
+from pyautomata import Canvas, Instrumentation, Pattern, Recognizer
+from pyautomata.handlers import rust_available
+from pyautomata.instrument import ACTIVE, DISABLED, phase
+
+class InstrumentationTestCase(TestCase):
+    def test_disabled(self):
+        self.assertIs(phase('stats'), DISABLED)
+        canvas = Canvas(30, 50)
+        canvas.stats
+        self.assertEqual(canvas.timings, [])
+
+    def test_phases(self):
+        seen = []
+        with Instrumentation(callback=seen.append) as instrumentation:
+            canvas = Canvas(30, 50)
+            canvas.stats
+            recognizer = Recognizer(30, canvas.result, Pattern.STANDARD)
+        self.assertEqual(ACTIVE, [])
+        self.assertEqual(seen, instrumentation.records)
+
+        canvas_phases = [record.name for record in canvas.timings]
+        self.assertEqual(canvas_phases[:2], ['canvas.initial_row', 'canvas.allocate'])
+        self.assertIn('canvas.generate_rows', canvas_phases)
+        self.assertEqual(canvas_phases[-1], 'stats')
+        self.assertEqual(recognizer.timings[-1].name, 'recognize')
+
+        summary = instrumentation.summary()
+        self.assertEqual(summary['canvas.generate_rows'].calls, 1)
+        self.assertTrue(all(record.seconds >= 0 for record in instrumentation.records))
+
+        # Buffers shared with Rust are reported with the call that used them
+        if rust_available():
+            ffi = [record for record in canvas.timings if record.name == 'rust.ffi']
+            self.assertGreaterEqual(ffi[0].nbytes, canvas.result.nbytes + canvas.sums.nbytes)
+
+    def test_allocations(self):
+        with Instrumentation(track_allocations=True) as instrumentation:
+            canvas = Canvas(30, 50)
+        allocate = instrumentation.summary()['canvas.allocate']
+        self.assertGreaterEqual(allocate.allocated_bytes, canvas.result.nbytes)
+        self.assertGreater(instrumentation.allocations, 0)
+
+        with Instrumentation() as instrumentation:
+            Canvas(30, 50)
+        self.assertIsNone(instrumentation.records[0].allocated_bytes)
+        self.assertIsNone(instrumentation.allocations)
+
+
+if __name__ == '__main__':
+    main()
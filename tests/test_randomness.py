@@ -0,0 +1,67 @@
+# Project PyAutomata Randomness Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array, uint8
+from numpy.random import default_rng
+
+# Local Modules
+from pyautomata import Canvas, RandomnessTests, calculate_randomness, center_column
+from pyautomata.randomness import igamc
+
+def bits(text: str):
+    return array([int(bit) for bit in text], uint8)
+
+class RandomnessTestCase(TestCase):
+    def test_reference_values(self):
+        # Worked examples of NIST SP 800-22
+        cases = [
+            ('1011010101', {}, 'monobit', 0.527089),
+            ('1001101011', {}, 'runs', 0.147232),
+            ('0110011010', {'block_length': 3}, 'block_frequency', 0.801252),
+            ('0011011101', {}, 'serial_1', 0.808792),
+            ('0011011101', {}, 'serial_2', 0.670320),
+            ('0100110101', {'entropy_length': 3}, 'approximate_entropy', 0.261961),
+        ]
+        for text, options, name, p_value in cases:
+            options = {'serial_length': 3, 'entropy_length': 2, **options}
+            results = calculate_randomness(bits(text), **options)
+            self.assertAlmostEqual(results[name].p_value, p_value, places=6)
+
+        self.assertAlmostEqual(igamc(2.5, 1.0), 0.849145, places=6)
+        self.assertAlmostEqual(igamc(2.5, 10.0), 0.001250, places=6)
+
+    def test_streaming(self):
+        stream = default_rng(5).integers(0, 2, 50_001, uint8)
+        whole = calculate_randomness(stream, lag=3)
+
+        # Reading results part way folds in the buffered patterns early
+        tests = RandomnessTests(lag=3)
+        for start in range(0, len(stream), 777):
+            tests.update(stream[start:start+777])
+            if start == 777 * 20:
+                tests.results()
+        self.assertEqual(tests.results(), whole)
+        self.assertEqual(tests.pattern_counts.sum(), len(stream) - tests.pattern_length + 1)
+        self.assertTrue(all(result.passed for result in whole.values()))
+
+        canvas = Canvas(30, 120)
+        rows = calculate_randomness(canvas.iter_rows(chunk_size=16))
+        self.assertEqual(rows, calculate_randomness(canvas.result))
+
+    def test_center_column(self):
+        self.assertTrue(all(result.passed for result in
+                            calculate_randomness(center_column(30, 20_000), serial_length=8,
+                                                 entropy_length=6).values()))
+        self.assertFalse(calculate_randomness(center_column(90, 20_000))['monobit'].passed)
+
+    def test_invalid_lengths(self):
+        for options in [{'block_length': 0}, {'serial_length': 2}, {'entropy_length': 20}]:
+            with self.assertRaises(ValueError):
+                RandomnessTests(**options)
+
+
+if __name__ == '__main__':
+    main()
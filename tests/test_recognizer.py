@@ -6,7 +6,9 @@ from unittest import TestCase, main
 # Third-Party Modules
 
 # Local Modules
-from pyautomata import Recognizer
+from pyautomata import (
+    Canvas, Engine, LightConeCanvas, MultiRecognizer, Pattern, Recognizer, StreamingRecognizer
+)
 from tests.common import RULE_30_STANDARD
 
 EXPECTED_PATTERNS = {
@@ -33,12 +35,14 @@ class RecognizerTestCase(TestCase):
         for bad_case in [500, 'abc']:
             with self.assertRaises(ValueError):
                 Recognizer(bad_case, None)
+            with self.assertRaises(ValueError):
+                StreamingRecognizer(bad_case)
 
-    def recognition_results(self, force_python: bool):
+    def recognition_results(self, force_python: bool, engine: Engine = None):
         """
         Support function to de-duplicate code in Python and Rust tests
         """
-        recognizer = Recognizer(30, RULE_30_STANDARD, force_python=force_python)
+        recognizer = Recognizer(30, RULE_30_STANDARD, force_python=force_python, engine=engine)
         self.assertEqual(recognizer.pattern_rules, EXPECTED_PATTERNS)
 
     def test_python_recognition(self):
@@ -47,6 +51,92 @@ class RecognizerTestCase(TestCase):
     def test_rust_recognition(self):
         self.recognition_results(False)
 
+    def test_numpy_recognition(self):
+        self.recognition_results(False, Engine.NUMPY)
+
+    def test_engines_agree(self):
+        for pattern in [Pattern.STANDARD, Pattern.RIGHT, Pattern.ALTERNATING]:
+            canvas = Canvas(30, 60, pattern)
+            for pattern_length in [3, 6]:
+                python = Recognizer(30, canvas.result, pattern, pattern_length, force_python=True)
+                for engine in [Engine.RUST, Engine.NUMPY]:
+                    recognizer = Recognizer(30, canvas.result, pattern, pattern_length, engine=engine)
+                    self.assertEqual(recognizer.segment_count, python.segment_count)
+                    self.assertEqual(recognizer.pattern_segments, python.pattern_segments)
+                    self.assertEqual(recognizer.pattern_rules, python.pattern_rules)
+
+    def test_light_cone_recognition(self):
+        for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RIGHT]:
+            canvas = Canvas(30, 60, pattern)
+            cone = LightConeCanvas(30, 60, pattern)
+            expected = Recognizer(30, canvas.result, pattern, 5, engine=Engine.NUMPY)
+            for engine in [Engine.PYTHON, Engine.NUMPY, Engine.RUST]:
+                recognizer = Recognizer(30, cone.result, pattern_length=5, engine=engine)
+                self.assertEqual(recognizer.segment_count, expected.segment_count)
+                self.assertEqual(recognizer.pattern_segments, expected.pattern_segments)
+                self.assertEqual(recognizer.pattern_rules, expected.pattern_rules)
+
+    def test_multi_recognition(self):
+        for rule in [30, 90, 137]:
+            for pattern in [Pattern.STANDARD, Pattern.RIGHT, Pattern.ALTERNATING]:
+                canvas = Canvas(rule, 60, pattern)
+                for engine in [Engine.PYTHON, Engine.NUMPY, Engine.RUST]:
+                    multi = MultiRecognizer(rule, canvas.result, pattern, [6, 1, 3, 3], engine=engine)
+                    self.assertEqual(list(multi.results), [1, 3, 6])
+                    for length in [1, 3, 6]:
+                        expected = Recognizer(rule, canvas.result, pattern, length, engine=Engine.NUMPY)
+                        self.assertEqual(multi[length].segment_count, expected.segment_count)
+                        self.assertEqual(multi[length].pattern_segments, expected.pattern_segments)
+                        self.assertEqual(multi[length].pattern_rules, expected.pattern_rules)
+                        self.assertAlmostEqual(multi[length].block_entropy, expected.block_entropy)
+
+        cone = LightConeCanvas(30, 60)
+        multi = MultiRecognizer(30, cone.result, pattern_lengths=[3, 5, 21])
+        for length in [3, 5, 21]:
+            expected = Recognizer(30, cone.result, pattern_length=length, force_python=True)
+            self.assertEqual(multi[length].pattern_rules, expected.pattern_rules)
+
+    def test_block_entropy(self):
+        canvas = Canvas(30, 60)
+        multi = MultiRecognizer(30, canvas.result, pattern_lengths=range(1, 5))
+        # Entropy of a block never exceeds its length nor that of a longer block
+        self.assertTrue(all(0 < entropy <= length for length, entropy in
+                            zip(range(1, 5), multi.block_entropy)))
+        self.assertTrue(all(multi.block_entropy[1:] >= multi.block_entropy[:-1]))
+
+        for lengths in [[], [0, 3]]:
+            with self.assertRaises(ValueError):
+                MultiRecognizer(30, canvas.result, pattern_lengths=lengths)
+
+    def test_streaming_recognition(self):
+        for pattern in [Pattern.STANDARD, Pattern.RIGHT, Pattern.ALTERNATING]:
+            canvas = Canvas(137, 60, pattern)
+            for pattern_length in [3, 6, 21]:
+                expected = Recognizer(137, canvas.result, pattern, pattern_length, force_python=True)
+                for engine in [Engine.PYTHON, Engine.NUMPY, Engine.RUST]:
+                    for chunk_size in [None, 7]:
+                        recognizer = StreamingRecognizer(137, pattern, pattern_length, engine=engine)
+                        recognizer.consume(canvas.iter_rows(chunk_size))
+                        self.assertEqual(recognizer.input_rows, 60)
+                        self.assertEqual(recognizer.segment_count, expected.segment_count)
+                        self.assertEqual(recognizer.pattern_segments, expected.pattern_segments)
+                        self.assertEqual(recognizer.pattern_rules, expected.pattern_rules)
+
+    def test_canvas_recognition(self):
+        for pattern in [Pattern.STANDARD, Pattern.LEFT, Pattern.RANDOM]:
+            expected_canvas = Canvas(30, 600, pattern, seed=5)
+            expected = Recognizer(30, expected_canvas.result, pattern, 5)
+            for engine in [Engine.NUMPY, Engine.RUST]:
+                for sums_only in [False, True]:
+                    canvas = Canvas(30, 600, pattern, engine=engine, sums_only=sums_only, seed=5,
+                                    recognize=5)
+                    self.assertTrue((canvas.sums == expected_canvas.sums).all())
+                    self.assertEqual(canvas.recognizer.segment_count, expected.segment_count)
+                    self.assertEqual(canvas.recognizer.pattern_rules, expected.pattern_rules)
+
+        with self.assertRaises(ValueError):
+            Canvas(30, 60, recognize=5, detect_cycles=True)
+
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
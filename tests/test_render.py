@@ -0,0 +1,111 @@
+# Project PyAutomata Rendering Tests
+
+# Python Modules
+from io import BytesIO
+from struct import unpack
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from zlib import decompress
+import os
+
+# Third-Party Modules
+from numpy import array_equal, asarray, frombuffer, unpackbits, uint8
+
+# Local Modules
+from pyautomata import Canvas, LightConeCanvas, PackedCanvas, Pattern
+from pyautomata.render import build_pyramid, plot_image
+
+def decode_png(data: bytes):
+    """
+    Decode the unfiltered grayscale PNGs written by the renderer
+    """
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    position, compressed = 8, b''
+    while position < len(data):
+        length, = unpack('>I', data[position:position + 4])
+        tag = data[position + 4:position + 8]
+        body = data[position + 8:position + 8 + length]
+        if tag == b'IHDR':
+            width, height, bit_depth = unpack('>IIB', body[:9])
+        elif tag == b'IDAT':
+            compressed += body
+        position += length + 12
+
+    stride = (width * bit_depth + 7) // 8
+    rows = frombuffer(decompress(compressed), uint8).reshape(height, stride + 1)
+    assert not rows[:, 0].any()
+    if bit_depth == 1:
+        return unpackbits(rows[:, 1:], axis=1)[:, :width], bit_depth
+    return rows[:, 1:], bit_depth
+
+class RenderTestCase(TestCase):
+    def test_png(self):
+        for canvas_class in [Canvas, PackedCanvas, LightConeCanvas]:
+            for rule in [30, 90, 110]:
+                canvas = canvas_class(rule, 37, Pattern.RIGHT)
+                expected = asarray(canvas.result)
+                for bit_depth in [1, 8]:
+                    output = BytesIO()
+                    canvas.save_png(output, bit_depth)
+                    pixels, depth = decode_png(output.getvalue())
+                    self.assertEqual(depth, bit_depth)
+                    live = 1 if bit_depth == 1 else 255
+                    self.assertTrue(array_equal(pixels == 0, expected == 1))
+                    self.assertTrue(array_equal(pixels == live, expected == 0))
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'rule_30.png')
+            Canvas(30, 70).save_png(path)
+            with open(path, 'rb') as file:
+                pixels, _ = decode_png(file.read())
+            self.assertEqual(pixels.shape, (70, 140))
+
+        with self.assertRaises(ValueError):
+            Canvas(30, 20, sums_only=True).save_png(BytesIO())
+
+    def test_plot_image(self):
+        cells = Canvas(30, 300).result
+        for canvas_class in [Canvas, PackedCanvas, LightConeCanvas]:
+            canvas = canvas_class(30, 300)
+            self.assertTrue(array_equal(plot_image(canvas, 301), cells[:, 1:]))
+            self.assertTrue(array_equal(plot_image(canvas, 40), cells[:, 1:80]))
+
+        # Only the sampled rows are unpacked
+        canvas = PackedCanvas(30, 2000)
+        canvas.unpack = None
+        image = plot_image(canvas, 2001)
+        self.assertEqual(image.shape, (1000, 2000))
+        self.assertTrue(array_equal(image, Canvas(30, 2000).result[::2, 1::2]))
+
+    def test_pyramid(self):
+        canvas = Canvas(30, 100)
+        pyramid = canvas.pyramid(block=8)
+        self.assertEqual(pyramid.levels[0].shape, (13, 25))
+        self.assertEqual(pyramid.levels[-1].shape, (1, 1))
+
+        cells = canvas.result
+        self.assertAlmostEqual(float(pyramid.levels[0][2, 3]), cells[16:24, 24:32].mean(), places=6)
+        self.assertAlmostEqual(float(pyramid.levels[0][12, 24]), cells[96:, 192:].mean(), places=6)
+        self.assertAlmostEqual(float(pyramid.levels[1][1, 2]), cells[16:32, 32:48].mean(), places=6)
+        self.assertAlmostEqual(float(pyramid.levels[-1][0, 0]), cells.mean(), places=6)
+
+        packed = build_pyramid(PackedCanvas(30, 100), block=8)
+        self.assertTrue(all(array_equal(a, b) for a, b in zip(pyramid.levels, packed.levels)))
+
+        self.assertEqual(pyramid.view(0, 0, 64, 64, max_pixels=16).shape, (4, 4))
+        pixels, bit_depth = decode_png(pyramid.to_png(max_pixels=100))
+        self.assertEqual((pixels.shape, bit_depth), ((7, 13), 8))
+
+    def test_preview(self):
+        pixels, bit_depth = decode_png(Canvas(30, 20)._repr_png_())
+        self.assertEqual((pixels.shape, bit_depth), ((20, 40), 1))
+
+        pixels, bit_depth = decode_png(LightConeCanvas(30, 1000)._repr_png_())
+        self.assertLessEqual(pixels.size, 1 << 20)
+        self.assertEqual(bit_depth, 8)
+
+        self.assertIsNone(Canvas(30, 20, sums_only=True)._repr_png_())
+
+
+if __name__ == '__main__':
+    main()
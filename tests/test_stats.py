@@ -0,0 +1,56 @@
+# Project PyAutomata Stats Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal, ndarray
+
+# Local Modules
+from pyautomata import Canvas, Engine, LightConeCanvas, PackedCanvas, Pattern
+from pyautomata.stats import StatsContainer, calculate_continued_stats, python_calculate_stats
+
+class StatsTestCase(TestCase):
+    def assertStatsEqual(self, stats, expected):
+        self.assertEqual(stats.count, expected.count)
+        self.assertAlmostEqual(stats.mean_increase, expected.mean_increase)
+        self.assertAlmostEqual(stats.standard_deviation, expected.standard_deviation)
+        self.assertTrue(array_equal(stats.marginal_sum_increase, expected.marginal_sum_increase))
+
+    def test_running_stats(self):
+        for rule in [1, 30, 90, 110]:
+            for pattern in [Pattern.STANDARD, Pattern.RIGHT, Pattern.ALTERNATING]:
+                for engine in [Engine.PYTHON, Engine.NUMPY, Engine.RUST]:
+                    canvas = Canvas(rule, 100, pattern, engine=engine)
+                    self.assertIsNotNone(canvas.running_stats)
+                    self.assertStatsEqual(canvas.stats, python_calculate_stats(canvas))
+
+                # Streamed across several chunks, serially and tiled
+                for engine, threads in [(Engine.NUMPY, 1), (Engine.NUMPY, 3), (Engine.RUST, 3)]:
+                    streamed = Canvas(rule, 600, pattern, engine=engine, sums_only=True,
+                                      threads=threads)
+                    self.assertStatsEqual(streamed.stats, python_calculate_stats(streamed))
+
+                self.assertStatsEqual(PackedCanvas(rule, 100, pattern).stats, canvas.stats)
+                if pattern is not Pattern.ALTERNATING:
+                    self.assertStatsEqual(LightConeCanvas(rule, 100, pattern).stats, canvas.stats)
+
+    def test_merge(self):
+        sums = Canvas(30, 500).sums
+        first = calculate_continued_stats(sums[:123])
+        second = calculate_continued_stats(sums[123:], 123)
+        self.assertStatsEqual(first.merge(second), calculate_continued_stats(sums))
+
+        canvas = Canvas(30, 200, Pattern.RIGHT)
+        canvas.extend(300)
+        self.assertStatsEqual(canvas.stats, calculate_continued_stats(canvas.sums))
+
+    def test_container_arrays(self):
+        merged = calculate_continued_stats(Canvas(30, 50).sums).merge(
+            StatsContainer([0.5, 0.25], 0.375, 0.125))
+        for stats in [StatsContainer([0.5, 0.25], 0.375, 0.125), merged, Canvas(90, 50).stats]:
+            self.assertIsInstance(stats.marginal_sum_increase, ndarray)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# Project PyAutomata Sweep Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Third-Party Modules
+from numpy import array_equal
+
+# Local Modules
+from pyautomata import Canvas, Pattern, sweep
+
+class SweepTestCase(TestCase):
+    def test_sweep_matches_canvases(self):
+        rules = [30, 1, 90, 110, 255, 45]
+        result = sweep(rules, 40, Pattern.STANDARD, workers=2, keep_canvases=True)
+
+        self.assertEqual(result.sums.shape, (len(rules), 40))
+        for i, rule in enumerate(rules):
+            canvas = Canvas(rule, 40)
+            self.assertTrue(array_equal(result.sums[i], canvas.sums))
+            self.assertTrue(array_equal(result.canvases[i], canvas.result))
+            self.assertAlmostEqual(result.stats[i].mean_increase, canvas.stats.mean_increase)
+
+    def test_sweep_sizes(self):
+        results = sweep(range(1, 9), [10, 20], 'alternating', workers=1)
+        self.assertEqual(sorted(results), [10, 20])
+        self.assertEqual(results[20].sums.shape, (8, 20))
+        self.assertIsNone(results[20].canvases)
+        self.assertEqual(results[10].index(5), 4)
+
+    def test_sweep_default_rules(self):
+        result = sweep(rows=5, workers=1)
+        self.assertEqual(len(result.rules), 255)
+        self.assertEqual(result.rules, list(range(1, 256)))
+        self.assertEqual(result.sums.shape, (255, 5))
+
+
+if __name__ == '__main__':
+    main()